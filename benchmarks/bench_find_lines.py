@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""Times xtable.helpers.image_processing.find_lines with table_regions,
+which only transforms the parts of the page around the regions, and
+checks it against the morphology on the whole masked page it replaced.
+
+Usage: python benchmarks/bench_find_lines.py [resolution]
+"""
+
+import os
+import sys
+import timeit
+
+import cv2
+import fitz
+import numpy as np
+
+from xtable.helpers.image_processing import adaptive_threshold, find_lines
+from xtable.helpers.utils import scale_pdf
+
+testdir = os.path.join(os.path.dirname(__file__), "..", "tests", "files")
+
+
+def find_lines_masked(threshold, regions, direction, line_scale=15, iterations=0):
+    """find_lines with regions, as it was before it cropped the page."""
+    if direction == "vertical":
+        size = threshold.shape[0] // line_scale
+        el = cv2.getStructuringElement(cv2.MORPH_RECT, (1, size))
+    else:
+        size = threshold.shape[1] // line_scale
+        el = cv2.getStructuringElement(cv2.MORPH_RECT, (size, 1))
+
+    region_mask = np.zeros(threshold.shape)
+    for x, y, w, h in regions:
+        region_mask[y : y + h, x : x + w] = 1
+    threshold = np.multiply(threshold, region_mask)
+
+    threshold = cv2.erode(threshold, el)
+    threshold = cv2.dilate(threshold, el)
+    dmask = cv2.dilate(threshold, el, iterations=iterations)
+    contours, _ = cv2.findContours(
+        threshold.astype(np.uint8), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
+    )
+    lines = []
+    for c in contours:
+        x, y, w, h = cv2.boundingRect(c)
+        if direction == "vertical":
+            lines.append((x + w // 2, y + h, x + w // 2, y))
+        else:
+            lines.append((x, y + h // 2, x + w, y + h // 2))
+    return dmask, lines
+
+
+def page_threshold(filename, resolution):
+    with fitz.open(filename) as doc:
+        page = doc[0]
+        pdf_width, pdf_height = page.rect.width, page.rect.height
+        zoom = resolution / 72
+        pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+    img = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width, 3)
+    _, threshold = adaptive_threshold(np.ascontiguousarray(img[:, :, ::-1]))
+    scalers = (pix.width / pdf_width, pix.height / pdf_height, pdf_height)
+    return threshold, scalers
+
+
+def main(resolution=300):
+    filename = os.path.join(testdir, "table_region.pdf")
+    threshold, scalers = page_threshold(filename, resolution)
+    # the table region of tests/test_lattice.py::test_lattice_table_regions
+    x1, y1, x2, y2 = scale_pdf((170, 370, 560, 270), scalers)
+    regions = [(x1, y1, abs(x2 - x1), abs(y2 - y1))]
+
+    print(f"page:    {threshold.shape[1]}x{threshold.shape[0]}")
+    print(
+        f"regions: {regions[0][2] * regions[0][3] / threshold.size:.1%} of the page"
+    )
+    for direction in ["vertical", "horizontal"]:
+        dmask, lines = find_lines(threshold, regions=regions, direction=direction)
+        masked_dmask, masked_lines = find_lines_masked(threshold, regions, direction)
+        assert ((dmask != 0) == (masked_dmask != 0)).all()
+        assert sorted(lines) == sorted(masked_lines)
+
+        cropped = min(
+            timeit.repeat(
+                lambda: find_lines(threshold, regions=regions, direction=direction),
+                number=5,
+                repeat=3,
+            )
+        )
+        masked = min(
+            timeit.repeat(
+                lambda: find_lines_masked(threshold, regions, direction),
+                number=5,
+                repeat=3,
+            )
+        )
+        print(
+            f"{direction + ':':11s} {len(lines)} lines, masked {masked / 5 * 1000:.1f}ms,"
+            f" cropped {cropped / 5 * 1000:.1f}ms, {masked / cropped:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
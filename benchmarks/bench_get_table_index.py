@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""Compares xtable.helpers.utils.get_table_indices with assigning
+text lines one at a time like the row/column loop it replaced.
+
+Usage: python benchmarks/bench_get_table_index.py [n_rows] [n_cols] [n_textlines]
+"""
+
+import sys
+import random
+import timeit
+
+from pdfminer.layout import LTTextLineHorizontal
+
+from xtable.core import Table
+import numpy as np
+
+from xtable.helpers.utils import get_cell_indices, get_table_indices, text_strip
+
+
+def get_table_index_loop(table, t):
+    r_idx, c_idx = [-1] * 2
+    for r in range(len(table.rows)):
+        if (t.y0 + t.y1) / 2.0 < table.rows[r][0] and (t.y0 + t.y1) / 2.0 > table.rows[
+            r
+        ][1]:
+            lt_col_overlap = []
+            for c in table.cols:
+                if c[0] <= t.x1 and c[1] >= t.x0:
+                    left = t.x0 if c[0] <= t.x0 else c[0]
+                    right = t.x1 if c[1] >= t.x1 else c[1]
+                    lt_col_overlap.append(abs(left - right) / abs(c[0] - c[1]))
+                else:
+                    lt_col_overlap.append(-1)
+            r_idx = r
+            c_idx = lt_col_overlap.index(max(lt_col_overlap))
+            break
+
+    y0_offset, y1_offset, x0_offset, x1_offset = [0] * 4
+    if t.y0 > table.rows[r_idx][0]:
+        y0_offset = abs(t.y0 - table.rows[r_idx][0])
+    if t.y1 < table.rows[r_idx][1]:
+        y1_offset = abs(t.y1 - table.rows[r_idx][1])
+    if t.x0 < table.cols[c_idx][0]:
+        x0_offset = abs(t.x0 - table.cols[c_idx][0])
+    if t.x1 > table.cols[c_idx][1]:
+        x1_offset = abs(t.x1 - table.cols[c_idx][1])
+    X = 1.0 if abs(t.x0 - t.x1) == 0.0 else abs(t.x0 - t.x1)
+    Y = 1.0 if abs(t.y0 - t.y1) == 0.0 else abs(t.y0 - t.y1)
+    charea = X * Y
+    error = ((X * (y0_offset + y1_offset)) + (Y * (x0_offset + x1_offset))) / charea
+    return [(r_idx, c_idx, text_strip(t.get_text(), ""))], error
+
+
+def table_and_text(n_rows, n_cols, n_text, seed=0):
+    rng = random.Random(seed)
+    width, height = 25.0, 8.0
+    cols = [(i * width, (i + 1) * width) for i in range(n_cols)]
+    rows = [((n_rows - i) * height, (n_rows - i - 1) * height) for i in range(n_rows)]
+    table = Table(cols, rows)
+    text = []
+    for __ in range(n_text):
+        x0 = rng.uniform(0, n_cols * width)
+        y0 = rng.uniform(0, n_rows * height)
+        t = LTTextLineHorizontal(0.1)
+        t.set_bbox((x0, y0, x0 + rng.uniform(5, 40), y0 + rng.uniform(4, 7)))
+        text.append(t)
+    return table, text
+
+
+def main(n_rows=100, n_cols=20, n_text=5000):
+    table, text = table_and_text(n_rows, n_cols, n_text)
+
+    batched = get_table_indices(table, text, "horizontal")
+    looped = [get_table_index_loop(table, t) for t in text]
+    assert batched == looped, "results differ"
+
+    t_batch = min(
+        timeit.repeat(
+            lambda: get_table_indices(table, text, "horizontal"), number=1, repeat=5
+        )
+    )
+    rows = np.array(table.rows)
+    cols = np.array(table.cols)
+    t_cells = min(
+        timeit.repeat(
+            lambda: get_cell_indices(
+                rows, cols, np.array([(t.x0, t.y0, t.x1, t.y1) for t in text])
+            ),
+            number=1,
+            repeat=5,
+        )
+    )
+    t_loop = min(
+        timeit.repeat(
+            lambda: [get_table_index_loop(table, t) for t in text], number=1, repeat=5
+        )
+    )
+    print(f"{n_rows}x{n_cols} table, {n_text} text lines")
+    print(f"loop:              {t_loop * 1000:8.1f} ms")
+    print(f"get_table_indices: {t_batch * 1000:8.1f} ms ({t_loop / t_batch:.0f}x)")
+    print(f"  of which get_cell_indices: {t_cells * 1000:.1f} ms, the rest is text")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
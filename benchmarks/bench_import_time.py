@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""Reports the cumulative time of `import xtable` in fresh interpreters,
+as measured by -X importtime, with the slowest modules it pulls in.
+
+tests/test_import_time.py only checks which modules get imported, since
+wall-clock budgets are not stable across machines.
+
+Usage: python benchmarks/bench_import_time.py [runs]
+"""
+
+import re
+import subprocess
+import sys
+
+
+def import_times(module="xtable"):
+    """Imports module in a fresh interpreter and returns the cumulative
+    import time of each module it loaded, in seconds."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        m = re.match(r"import time:\s+\d+ \|\s+(\d+) \| (\s*)(\S+)$", line)
+        if m is not None:
+            times[m.group(3)] = int(m.group(1)) / 1e6
+    return times
+
+
+def main(runs=5):
+    # the first run also warms the bytecode and filesystem caches
+    import_times()
+    runs = [import_times() for _ in range(runs)]
+    best = min(runs, key=lambda times: times["xtable"])
+    print(f"import xtable: {best['xtable'] * 1000:.1f}ms (best of {len(runs)})")
+    top_level = {
+        name: t for name, t in best.items() if "." not in name and name != "xtable"
+    }
+    slowest = sorted(top_level.items(), key=lambda x: -x[1])[:10]
+    for name, t in slowest:
+        print(f"  {name:24s} {t * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
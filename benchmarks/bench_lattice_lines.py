@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""Compares the line and joint detection of Lattice, with
+xtable.helpers.image_processing.find_lines_and_joints, to the two
+find_lines passes and the page sized sum and product of the masks it
+replaced: time and peak memory of the numpy arrays, on the first page
+of a few test PDFs.
+
+Usage: python benchmarks/bench_lattice_lines.py [resolution]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+import cv2
+import fitz
+import numpy as np
+
+from xtable.helpers.image_processing import (
+    adaptive_threshold,
+    find_lines,
+    find_lines_and_joints,
+)
+
+testdir = os.path.join(os.path.dirname(__file__), "..", "tests", "files")
+
+FILES = [
+    "foo.pdf",
+    "twotables_2.pdf",
+    "tabula/icdar2013-dataset/competition-dataset-us/us-030.pdf",
+]
+
+
+def two_passes(threshold):
+    """Line and joint detection as Lattice did it before, with the
+    sum and the product of the masks."""
+    vertical_mask, _ = find_lines(threshold, direction="vertical")
+    horizontal_mask, _ = find_lines(threshold, direction="horizontal")
+
+    mask = vertical_mask + horizontal_mask
+    contours, _ = cv2.findContours(
+        mask.astype(np.uint8), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
+    )
+    contours = sorted(contours, key=cv2.contourArea, reverse=True)[:10]
+    contours = [cv2.boundingRect(cv2.approxPolyDP(c, 3, True)) for c in contours]
+
+    joints = np.multiply(vertical_mask, horizontal_mask)
+    tables = {}
+    for x, y, w, h in contours:
+        roi = joints[y : y + h, x : x + w]
+        jc, _ = cv2.findContours(
+            roi.astype(np.uint8), cv2.RETR_CCOMP, cv2.CHAIN_APPROX_SIMPLE
+        )
+        if len(jc) <= 4:
+            continue
+        joint_coords = []
+        for j in jc:
+            jx, jy, jw, jh = cv2.boundingRect(j)
+            joint_coords.append((x + (2 * jx + jw) // 2, y + (2 * jy + jh) // 2))
+        tables[(x, y + h, x + w, y)] = joint_coords
+    return tables
+
+
+def fused(threshold):
+    return find_lines_and_joints(threshold)[0]
+
+
+def page_threshold(filename, resolution):
+    with fitz.open(filename) as doc:
+        zoom = resolution / 72
+        pix = doc[0].get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+    img = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width, 3)
+    return adaptive_threshold(np.ascontiguousarray(img[:, :, ::-1]))[1]
+
+
+def measure(detect, threshold):
+    tracemalloc.start()
+    t = time.perf_counter()
+    tables = detect(threshold)
+    elapsed = time.perf_counter() - t
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return tables, elapsed, peak
+
+
+def main(resolution=300):
+    for filename in FILES:
+        threshold = page_threshold(os.path.join(testdir, filename), resolution)
+        old_tables, old_time, old_peak = measure(two_passes, threshold)
+        tables, new_time, new_peak = measure(fused, threshold)
+        assert {k: sorted(v) for k, v in tables.items()} == {
+            k: sorted(v) for k, v in old_tables.items()
+        }
+        print(
+            f"{os.path.basename(filename)}: {len(tables)} tables,"
+            f" {old_time * 1000:.0f}ms -> {new_time * 1000:.0f}ms,"
+            f" peak {old_peak / 2 ** 20:.0f}MiB -> {new_peak / 2 ** 20:.0f}MiB"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""Compares xtable.helpers.utils.text_in_bbox with the pairwise
+duplicate removal it replaced, on a synthetic dense page.
+
+Usage: python benchmarks/bench_text_in_bbox.py [n_textlines]
+"""
+
+import sys
+import random
+import timeit
+
+from xtable.helpers.utils import (
+    text_in_bbox,
+    bbox_area,
+    bbox_intersect,
+    bbox_intersection_area,
+    bbox_longer,
+)
+
+
+class TextLine(object):
+    def __init__(self, x0, y0, x1, y1):
+        self.x0, self.y0, self.x1, self.y1 = x0, y0, x1, y1
+
+
+def text_in_bbox_pairwise(bbox, text):
+    lb = (bbox[0], bbox[1])
+    rt = (bbox[2], bbox[3])
+    t_bbox = [
+        t
+        for t in text
+        if lb[0] - 2 <= (t.x0 + t.x1) / 2.0 <= rt[0] + 2
+        and lb[1] - 2 <= (t.y0 + t.y1) / 2.0 <= rt[1] + 2
+    ]
+    rest = {t for t in t_bbox}
+    for ba in t_bbox:
+        for bb in rest.copy():
+            if ba == bb:
+                continue
+            if bbox_intersect(ba, bb):
+                if (bbox_area(ba) == 0) or (
+                    (bbox_intersection_area(ba, bb) / bbox_area(ba)) > 0.8
+                ):
+                    if bbox_longer(bb, ba):
+                        rest.discard(ba)
+    return list(rest)
+
+
+def dense_page(n, seed=0):
+    """Rows of cells with some duplicated (overlapping) text lines."""
+    rng = random.Random(seed)
+    text = []
+    cols = 8
+    for i in range(n):
+        row, col = divmod(i, cols)
+        x0 = 20 + col * 70 + rng.uniform(0, 5)
+        y0 = 20 + row * 10 + rng.uniform(0, 1)
+        t = TextLine(x0, y0, x0 + rng.uniform(20, 60), y0 + 8)
+        text.append(t)
+        if rng.random() < 0.1:
+            # overprinted text, slightly shifted
+            text.append(TextLine(t.x0 + 0.5, t.y0, t.x1 + rng.uniform(-1, 1), t.y1))
+    return text
+
+
+def main(n=5000):
+    text = dense_page(n)
+    bbox = (0, 0, 1000, 20 + (n // 8 + 1) * 10)
+
+    fast = text_in_bbox(bbox, text)
+    slow = text_in_bbox_pairwise(bbox, text)
+    assert set(fast) == set(slow), "results differ"
+
+    t_fast = min(timeit.repeat(lambda: text_in_bbox(bbox, text), number=1, repeat=3))
+    t_slow = min(
+        timeit.repeat(lambda: text_in_bbox_pairwise(bbox, text), number=1, repeat=1)
+    )
+    print(f"{len(text)} text lines, {len(fast)} kept")
+    print(f"pairwise:   {t_slow * 1000:10.1f} ms")
+    print(f"text_in_bbox: {t_fast * 1000:8.1f} ms ({t_slow / t_fast:.0f}x)")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""Times the Nurminen table detection of Stream, i.e. text edge
+generation and table area detection, on a synthetic page of textlines.
+With --linear, it is also timed and checked against a linear scan of
+the text edges like the one it replaced, which takes a few minutes for
+5,000 textlines.
+
+Usage: python benchmarks/bench_textedges.py [n_lines] [--linear]
+"""
+
+import sys
+import time
+import random
+
+import numpy as np
+
+from xtable.core import TEXTEDGE_X_TOL, TextEdge, TextEdges
+
+
+class TextLine(object):
+    """Stands in for a PDFMiner LTTextLineHorizontal."""
+
+    def __init__(self, x0, y0, x1, y1, text):
+        self.x0 = x0
+        self.y0 = y0
+        self.x1 = x1
+        self.y1 = y1
+        self.text = text
+
+    def get_text(self):
+        return self.text
+
+
+class LinearTextEdges(TextEdges):
+    """Finds text edges by scanning all of them, as TextEdges did
+    before they were indexed."""
+
+    def find(self, x_coord, align):
+        for i, te in enumerate(self._textedges[align]):
+            if np.isclose(te.x, x_coord, atol=TEXTEDGE_X_TOL):
+                return i
+        return None
+
+
+def synthetic_page(n_lines, seed=0):
+    """Textlines of a page with a few tables, whose cells are left
+    aligned with some jitter, between paragraphs of text."""
+    rng = random.Random(seed)
+    lines = []
+    y = 10.0 * n_lines
+    while len(lines) < n_lines:
+        if rng.random() < 0.3:
+            # a paragraph, whose lines start at many x-coordinates
+            for _ in range(rng.randint(3, 10)):
+                x0 = rng.uniform(30, 400)
+                lines.append(TextLine(x0, y, x0 + rng.uniform(50, 200), y + 8, "text"))
+                y -= 10
+        else:
+            # a table
+            columns = sorted(rng.uniform(30, 550) for _ in range(rng.randint(4, 12)))
+            for _ in range(rng.randint(10, 60)):
+                for x in columns:
+                    x0 = x + rng.uniform(-0.2, 0.2)
+                    lines.append(TextLine(x0, y, x0 + rng.uniform(10, 40), y + 8, "12.5"))
+                y -= 10
+        y -= 20
+    lines = lines[:n_lines]
+    lines.sort(key=lambda t: (-t.y0, t.x0))
+    return lines
+
+
+def astuple(textedge):
+    return tuple(getattr(textedge, name) for name in TextEdge.__slots__)
+
+
+def detect(cls, textlines):
+    textedges = cls(edge_tol=50)
+    textedges.generate(textlines)
+    relevant_textedges = textedges.get_relevant()
+    table_areas = textedges.get_table_areas(textlines, relevant_textedges)
+    return textedges, table_areas
+
+
+def main(n_lines=5000, linear=False):
+    textlines = synthetic_page(n_lines)
+
+    t = time.perf_counter()
+    textedges, table_areas = detect(TextEdges, textlines)
+    indexed_time = time.perf_counter() - t
+
+    print(f"textlines:   {len(textlines)}")
+    print(f"textedges:   {sum(len(v) for v in textedges._textedges.values())}")
+    print(f"table areas: {len(table_areas)}")
+    print(f"indexed:     {indexed_time:.3f}s")
+    if not linear:
+        return
+
+    t = time.perf_counter()
+    linear_textedges, linear_table_areas = detect(LinearTextEdges, textlines)
+    linear_time = time.perf_counter() - t
+
+    for align in ["left", "right", "middle"]:
+        assert [astuple(te) for te in textedges._textedges[align]] == [
+            astuple(te) for te in linear_textedges._textedges[align]
+        ]
+    assert list(table_areas) == list(linear_table_areas)
+    print(f"linear:      {linear_time:.3f}s")
+    print(f"speedup:     {linear_time / indexed_time:.1f}x")
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if arg != "--linear"]
+    main(int(args[0]) if args else 5000, linear="--linear" in sys.argv)
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+import fitz
+from pandas.testing import assert_frame_equal
+
+import xtable
+from xtable.cache import ExtractionCache
+from xtable.helpers.utils import TemporaryDirectory
+
+
+testdir = os.path.dirname(os.path.abspath(__file__))
+testdir = os.path.join(testdir, "files")
+
+
+def assert_tables_equal(tables, cached_tables):
+    assert len(cached_tables) == len(tables)
+    for table, cached_table in zip(tables, cached_tables):
+        assert (cached_table.page, cached_table.order) == (table.page, table.order)
+        assert cached_table._bbox == table._bbox
+        assert cached_table.parsing_report == table.parsing_report
+        assert_frame_equal(table.df, cached_table.df)
+
+
+def test_cache_hits():
+    filename = os.path.join(testdir, "tabula/mednine.pdf")
+    tables = xtable.read_pdf(filename, pages="all", flavor="stream")
+
+    with TemporaryDirectory() as tempdir:
+        cache = ExtractionCache(tempdir)
+        first = xtable.read_pdf(filename, pages="all", flavor="stream", cache=cache)
+        assert (cache.hits, cache.misses) == (0, 4)
+        assert cache.size > 0
+
+        second = xtable.read_pdf(filename, pages="all", flavor="stream", cache=cache)
+        assert (cache.hits, cache.misses) == (4, 4)
+
+        assert_tables_equal(tables, first)
+        assert_tables_equal(tables, second)
+
+
+def test_cache_entry_without_source():
+    filename = os.path.join(testdir, "tabula/mednine.pdf")
+    tables = xtable.read_pdf(filename, flavor="stream")
+    assert tables[0]._source is not None
+
+    with TemporaryDirectory() as tempdir:
+        cache = ExtractionCache(tempdir)
+        cache.set("key", list(tables))
+        assert all(t._source is None for t in cache.get("key"))
+        # the tables themselves keep their source
+        assert tables[0]._source is not None
+
+
+def test_cache_settings():
+    filename = os.path.join(testdir, "tabula/mednine.pdf")
+
+    with TemporaryDirectory() as tempdir:
+        cache = ExtractionCache(tempdir)
+        xtable.read_pdf(filename, flavor="stream", cache=cache)
+        xtable.read_pdf(filename, flavor="stream", row_tol=10, cache=cache)
+        xtable.read_pdf(
+            filename, flavor="stream", layout_kwargs={"char_margin": 1}, cache=cache
+        )
+        assert (cache.hits, cache.misses) == (0, 3)
+
+
+def test_cache_same_page_in_other_pdf():
+    filename = os.path.join(testdir, "tabula/mednine.pdf")
+
+    with TemporaryDirectory() as tempdir:
+        # the last page of mednine.pdf followed by its first page
+        other = os.path.join(tempdir, "other.pdf")
+        with fitz.open(filename) as src, fitz.open() as doc:
+            doc.insert_pdf(src, from_page=3, to_page=3)
+            doc.insert_pdf(src, from_page=0, to_page=0)
+            doc.save(other)
+        tables = xtable.read_pdf(other, pages="all", flavor="stream")
+
+        cache = ExtractionCache(os.path.join(tempdir, "cache"))
+        xtable.read_pdf(filename, pages="all", flavor="stream", cache=cache)
+        cached_tables = xtable.read_pdf(
+            other, pages="all", flavor="stream", cache=cache
+        )
+        assert (cache.hits, cache.misses) == (2, 4)
+        assert_tables_equal(tables, cached_tables)
+
+
+def test_cache_workers():
+    filename = os.path.join(testdir, "tabula/mednine.pdf")
+    tables = xtable.read_pdf(filename, pages="all", flavor="stream")
+
+    with TemporaryDirectory() as tempdir:
+        cache = ExtractionCache(tempdir)
+        xtable.read_pdf(filename, pages="1,2", flavor="stream", cache=cache)
+        cached_tables = xtable.read_pdf(
+            filename, pages="all", flavor="stream", workers=2, cache=cache
+        )
+        assert (cache.hits, cache.misses) == (2, 4)
+        assert_tables_equal(tables, cached_tables)
+
+        # pages parsed by the workers were cached
+        xtable.read_pdf(filename, pages="all", flavor="stream", cache=cache)
+        assert (cache.hits, cache.misses) == (6, 4)
+
+
+def test_cache_eviction():
+    filename = os.path.join(testdir, "tabula/mednine.pdf")
+
+    with TemporaryDirectory() as tempdir:
+        cache = ExtractionCache(tempdir)
+        for page in ["1", "2", "3"]:
+            xtable.read_pdf(filename, pages=page, flavor="stream", cache=cache)
+        # page 2 becomes the most recently used entry
+        xtable.read_pdf(filename, pages="2", flavor="stream", cache=cache)
+        assert (cache.hits, cache.misses) == (1, 3)
+
+        cache.max_size = cache.size
+        cache.set("empty", [])
+        assert cache.size <= cache.max_size
+        assert len(os.listdir(tempdir)) == 3
+
+        # the least recently used entry, of page 1, was removed
+        for page in ["3", "2", "1"]:
+            xtable.read_pdf(filename, pages=page, flavor="stream", cache=cache)
+        assert (cache.hits, cache.misses) == (3, 4)
+
+
+def test_cache_path():
+    filename = os.path.join(testdir, "tabula/mednine.pdf")
+
+    with TemporaryDirectory() as tempdir:
+        xtable.read_pdf(filename, flavor="stream", cache=tempdir)
+        cache = ExtractionCache(tempdir)
+        xtable.read_pdf(filename, flavor="stream", cache=cache)
+        assert (cache.hits, cache.misses) == (1, 0)
+
+        cache.clear()
+        assert cache.size == 0
+        assert os.listdir(tempdir) == []
@@ -2,6 +2,7 @@
 
 import os
 import sys
+import copy
 
 import pytest
 import pandas as pd
@@ -9,7 +10,16 @@ from pandas.testing import assert_frame_equal
 
 import xtable
 from xtable.io import PDFHandler
-from xtable.core import Table, TableList
+from xtable.parsers import Lattice, Stream
+from xtable.core import Cell, Table, TableList, TextEdges
+from xtable.helpers.utils import (
+    LayoutIndex,
+    TemporaryDirectory,
+    get_page_layout,
+    get_table_indices,
+    get_text_objects,
+    text_in_bbox,
+)
 from xtable.__version__ import generate_version
 from xtable.backends import ImageConversionBackend
 
@@ -67,6 +77,14 @@ def test_repr_poppler():
     assert repr(tables[0].cells[0][0]) == "<Cell x1=120 y1=219 x2=165 y2=234>"
 
 
+def test_repr_pymupdf():
+    filename = os.path.join(testdir, "foo.pdf")
+    tables = xtable.read_pdf(filename, backend="pymupdf")
+    assert repr(tables) == "<TableList n=1>"
+    assert repr(tables[0]) == "<Table shape=(7, 7)>"
+    assert repr(tables[0].cells[0][0]) == "<Cell x1=120 y1=218 x2=165 y2=234>"
+
+
 @skip_on_windows
 def test_repr_ghostscript():
     filename = os.path.join(testdir, "foo.pdf")
@@ -176,3 +194,277 @@ def test_handler_pages_generator():
 
     handler = PDFHandler(filename)
     assert handler._get_pages("1,2,5-10") == [1, 2, 5, 6, 7, 8, 9, 10]
+
+
+def test_read_pdf_workers():
+    filename = os.path.join(testdir, "tabula/mednine.pdf")
+    tables = xtable.read_pdf(filename, pages="all", flavor="stream")
+    parallel_tables = xtable.read_pdf(
+        filename, pages="all", flavor="stream", workers=2
+    )
+
+    assert len(parallel_tables) == len(tables)
+    for table, parallel_table in zip(tables, parallel_tables):
+        assert (parallel_table.page, parallel_table.order) == (table.page, table.order)
+        assert parallel_table.parsing_report == table.parsing_report
+        assert_frame_equal(table.df, parallel_table.df)
+
+
+def test_iter_tables():
+    filename = os.path.join(testdir, "tabula/mednine.pdf")
+    tables = xtable.read_pdf(filename, pages="all", flavor="stream")
+    table_iter = xtable.iter_tables(filename, pages="all", flavor="stream")
+
+    assert not isinstance(table_iter, (list, TableList))
+    iter_tables = list(table_iter)
+    assert len(iter_tables) == len(tables)
+    for table, iter_table in zip(tables, iter_tables):
+        assert (iter_table.page, iter_table.order) == (table.page, table.order)
+        assert_frame_equal(table.df, iter_table.df)
+
+
+def test_iter_tables_workers():
+    filename = os.path.join(testdir, "tabula/mednine.pdf")
+    tables = xtable.read_pdf(filename, pages="all", flavor="stream")
+    iter_tables = list(
+        xtable.iter_tables(filename, pages="all", flavor="stream", workers=2)
+    )
+
+    assert [(t.page, t.order) for t in iter_tables] == [
+        (t.page, t.order) for t in tables
+    ]
+    for table, iter_table in zip(tables, iter_tables):
+        assert_frame_equal(table.df, iter_table.df)
+
+
+class BatchBackend(object):
+    """Batch converts pages with PyMuPDF, like the ghostscript backend
+    does, and remembers where the images were written."""
+
+    def convert(self, pdf_path, png_path):
+        from xtable.backends.pymupdf_backend import PyMuPDFBackend
+
+        PyMuPDFBackend().convert(pdf_path, png_path)
+
+    def convert_pages(self, pdf_path, pages, output_dir):
+        from xtable.backends.pymupdf_backend import PyMuPDFBackend
+
+        self.output_dir = output_dir
+        return PyMuPDFBackend().convert_pages(pdf_path, pages, output_dir)
+
+
+def test_iter_parse_workers_removes_page_files():
+    filename = os.path.join(testdir, "tabula/mednine.pdf")
+    backend = BatchBackend()
+    handler = PDFHandler(filename, pages="all")
+
+    pages = handler.iter_parse(flavor="lattice", workers=2, backend=backend)
+    next(pages)
+    # the first page was yielded, the last one is still being parsed
+    assert not os.path.exists(os.path.join(backend.output_dir, "page-1.png"))
+    assert os.path.exists(os.path.join(backend.output_dir, "page-4.png"))
+    for _ in pages:
+        pass
+    assert not os.path.exists(backend.output_dir)
+
+
+def test_iter_tables_invalid_flavor():
+    filename = os.path.join(testdir, "foo.pdf")
+    with pytest.raises(NotImplementedError):
+        xtable.iter_tables(filename, flavor="chess")
+
+
+def test_handler_page_in_memory():
+    filename = os.path.join(testdir, "tabula/us-007.pdf")
+
+    handler = PDFHandler(filename, pages="all")
+    with TemporaryDirectory() as tempdir:
+        pages = [handler._get_page(p, tempdir) for p in handler.pages]
+        assert [page.number for page in pages] == [1, 2]
+        assert os.listdir(tempdir) == []
+
+
+def test_handler_page_parsed_twice():
+    filename = os.path.join(testdir, "foo.pdf")
+    stream_tables = xtable.read_pdf(filename, flavor="stream")
+    lattice_tables = xtable.read_pdf(filename, backend="poppler")
+
+    handler = PDFHandler(filename)
+    with TemporaryDirectory() as tempdir:
+        page = handler._get_page(1, tempdir)
+        objects = page.get_objects()
+        horizontal_text = list(objects.horizontal_text)
+        # the bboxes of the text are indexed before stream reads the text
+        objects.get_bboxes("horizontal_text")
+
+        for parser, tables in [
+            (Stream(), stream_tables),
+            (Stream(), stream_tables),
+            (Lattice(backend="poppler"), lattice_tables),
+        ]:
+            page_tables = parser.extract_tables(page, suppress_stdout=True)
+            assert len(page_tables) == len(tables)
+            for table, page_table in zip(tables, page_tables):
+                assert_frame_equal(table.df, page_table.df)
+        # parsing does not reorder the text the bboxes are aligned to
+        assert objects.horizontal_text == horizontal_text
+
+
+def test_handler_page_rotation():
+    filename = os.path.join(testdir, "clockwise_table_2.pdf")
+
+    handler = PDFHandler(filename)
+    with TemporaryDirectory() as tempdir:
+        page = handler._get_page(1, tempdir)
+        assert page.rotation == "clockwise"
+        layout, dim = page.get_layout()
+        assert page.get_layout()[0] is layout
+        assert len(page._layouts) == 1
+        assert dim[0] > dim[1]
+
+
+def test_layout_index():
+    filename = os.path.join(testdir, "column_span_2.pdf")
+    layout, __ = get_page_layout(filename)
+
+    index = LayoutIndex(layout)
+    for ltype in ["char", "image", "horizontal_text", "vertical_text"]:
+        objs = get_text_objects(layout, ltype=ltype)
+        assert index.get_objects(ltype) == objs
+        assert index.get_bboxes(ltype).shape == (len(objs), 4)
+    assert index.get_bboxes("char")[0].tolist() == list(index.chars[0].bbox)
+
+
+def test_text_in_bbox_duplicates():
+    filename = os.path.join(testdir, "column_span_2.pdf")
+    layout, __ = get_page_layout(filename)
+    text = LayoutIndex(layout).horizontal_text
+    bbox = (0, 0, layout.bbox[2], layout.bbox[3])
+    assert set(text_in_bbox(bbox, text)) == set(text)
+
+    # overprinted text line, the longer copy is kept
+    duplicate = copy.copy(text[0])
+    duplicate.x1 = text[0].x1 + 1
+    t_bbox = text_in_bbox(bbox, text + [duplicate])
+    assert duplicate in t_bbox
+    assert text[0] not in t_bbox
+    assert len(t_bbox) == len(text)
+
+
+def test_get_table_indices():
+    from pdfminer.layout import LTTextLineHorizontal
+
+    table = Table([(0, 10), (10, 20)], [(20, 10), (10, 0)])
+    text = []
+    for bbox in [(1, 11, 9, 19), (8, 1, 19, 9), (25, 11, 30, 19), (1, 30, 9, 35)]:
+        t = LTTextLineHorizontal(0.1)
+        t.set_bbox(bbox)
+        text.append(t)
+
+    with pytest.warns(UserWarning) as record:
+        assignments = get_table_indices(table, text, "horizontal")
+    assert len(record) == 1
+    assert "does not lie in column range" in str(record[0].message)
+    assert [indices[0][:2] for indices, __ in assignments] == [
+        (0, 0),
+        (1, 1),
+        (0, 0),
+        (-1, -1),
+    ]
+    assert [error for __, error in assignments] == [0.0, 16 / 88, 4.0, 5.125]
+
+
+def test_table_cells():
+    table = Table([(0, 10), (10, 20), (20, 30)], [(20, 10), (10, 0)])
+    table.cells[1][-1].right = True
+    table.cells[0][1].text = "a"
+    table.cells[0][1].text = "b"
+    assert table.right.tolist() == [[False, False, False], [False, False, True]]
+    assert table.data == [["", "ab", ""], ["", "", ""]]
+    assert [len(row) for row in table.cells] == [3, 3]
+    assert table.cells[1][2].rt == (30, 10)
+
+    cell = Cell(0, 0, 10, 20)
+    cell.top = True
+    assert cell.bound == 1
+    assert repr(cell) == "<Cell x1=0 y1=0 x2=10 y2=20>"
+
+
+def test_table_set_span():
+    # one cell per combination of (left, right, top, bottom) edges
+    combinations = [
+        (l, r, t, b) for l in (0, 1) for r in (0, 1) for t in (0, 1) for b in (0, 1)
+    ]
+    table = Table([(i, i + 1) for i in range(len(combinations))], [(1, 0)])
+    for c, (l, r, t, b) in enumerate(combinations):
+        cell = table.cells[0][c]
+        cell.left, cell.right, cell.top, cell.bottom = l, r, t, b
+    table.set_span()
+
+    for c, (l, r, t, b) in enumerate(combinations):
+        cell = table.cells[0][c]
+        bound = l + r + t + b
+        if bound < 2:
+            assert cell.hspan and cell.vspan
+        elif bound == 2:
+            assert cell.hspan == bool(t and b)
+            assert cell.vspan == bool(l and r)
+        elif bound == 3:
+            assert cell.hspan == (not l or not r)
+            assert cell.vspan == (not t or not b)
+        else:
+            assert not cell.hspan and not cell.vspan
+
+
+def test_table_set_edges():
+    table = Table([(0, 10), (10, 20), (20, 30)], [(20, 10), (10, 0)])
+    # vertical line on the middle column boundary, spanning the top row
+    # horizontal line between the rows, starting at the second column
+    table.set_edges([(10.5, 10, 10.5, 20)], [(10, 9, 30, 9)], joint_tol=2)
+    assert table.left.tolist() == [[False, True, False], [False, False, False]]
+    assert table.right.tolist() == [[True, False, False], [False, False, False]]
+    assert table.top.tolist() == [[False, False, False], [False, True, True]]
+    assert table.bottom.tolist() == [[False, True, True], [False, False, False]]
+
+
+def test_textedges_find():
+    filename = os.path.join(testdir, "tabula/12s0324.pdf")
+    layout, __ = get_page_layout(filename)
+    textlines = LayoutIndex(layout).horizontal_text
+    textlines.sort(key=lambda x: (-x.y0, x.x0))
+
+    textedges = TextEdges()
+    textedges.generate(textlines)
+    for align in ["left", "right", "middle"]:
+        edges = textedges._textedges[align]
+        assert len(edges)
+        for tl in textlines:
+            x = textedges.get_x_coord(tl, align)
+            close = [
+                i for i, te in enumerate(edges) if abs(te.x - x) <= 0.5 + 1e-5 * x
+            ]
+            assert textedges.find(x, align) == (close[0] if close else None)
+
+
+def test_textedges_slots():
+    filename = os.path.join(testdir, "tabula/12s0324.pdf")
+    layout, __ = get_page_layout(filename)
+    textlines = LayoutIndex(layout).horizontal_text
+    textlines.sort(key=lambda x: (-x.y0, x.x0))
+
+    textedges = TextEdges()
+    textedges.generate(textlines)
+    table = Table([(0, 10), (10, 20)], [(20, 10), (10, 0)])
+    for obj in [textedges, textedges._textedges["left"][0], table.cells[1][1]]:
+        assert not hasattr(obj, "__dict__")
+
+    # slotted objects still copy, as tables kept with keep_artifacts=True
+    # are pickled back from the workers
+    textedges_copy = copy.deepcopy(textedges)
+    for align in ["left", "right", "middle"]:
+        assert [repr(te) for te in textedges_copy._textedges[align]] == [
+            repr(te) for te in textedges._textedges[align]
+        ]
+    assert textedges_copy.find(
+        textedges._textedges["left"][0].x, "left"
+    ) == textedges.find(textedges._textedges["left"][0].x, "left")
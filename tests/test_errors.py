@@ -128,7 +128,7 @@ def test_lattice_no_tables_on_page():
 
 
 def test_lattice_unknown_backend():
-    message = "Unknown backend 'mupdf' specified. Please use either 'poppler' or 'ghostscript'."
+    message = "Unknown backend 'mupdf' specified. Please use either 'poppler', 'ghostscript' or 'pymupdf'."
     with pytest.raises(NotImplementedError, match=message):
         tables = xtable.read_pdf(filename, backend="mupdf")
 
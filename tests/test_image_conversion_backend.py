@@ -1,11 +1,17 @@
 # -*- coding: utf-8 -*-
 
+import os
+
 import pytest
 
 import xtable.backends.image_conversion
 from xtable.backends import ImageConversionBackend
 
 
+testdir = os.path.dirname(os.path.abspath(__file__))
+testdir = os.path.join(testdir, "files")
+
+
 class PopplerBackendError(object):
     def convert(self, pdf_path, png_path):
         raise ValueError("Image conversion failed")
@@ -58,3 +64,46 @@ def test_ghostscript_backend_error_when_use_fallback(monkeypatch):
     message = "Image conversion failed with image conversion backend 'ghostscript'"
     with pytest.raises(ValueError, match=message):
         backend.convert("foo", "bar")
+
+
+class GhostscriptBackendPages(object):
+    def convert_pages(self, pdf_path, pages, output_dir):
+        return {page: f"{output_dir}/page-{page}.png" for page in pages}
+
+
+def test_convert_pages_when_use_fallback(monkeypatch):
+    BACKENDS = {"poppler": PopplerBackendError, "ghostscript": GhostscriptBackendPages}
+    monkeypatch.setattr(
+        "xtable.backends.image_conversion.BACKENDS", BACKENDS, raising=True
+    )
+    backend = ImageConversionBackend()
+
+    png_paths = backend.convert_pages("foo", [1, 3], "bar")
+    assert png_paths == {1: "bar/page-1.png", 3: "bar/page-3.png"}
+
+
+class BatchBackendError(object):
+    def convert_pages(self, pdf_path, pages, output_dir):
+        raise ValueError("Image conversion failed")
+
+
+class BatchBackendBug(object):
+    def convert_pages(self, pdf_path, pages, output_dir):
+        raise TypeError("unexpected")
+
+
+def test_handler_convert_pages_errors(tmp_path, caplog):
+    from xtable.backends.poppler_backend import PopplerBackend
+    from xtable.handlers import PDFHandler
+
+    handler = PDFHandler(os.path.join(testdir, "birdisland.pdf"), pages="all")
+    # pdftopng renders a single page per call, poppler pages are
+    # converted one at a time
+    assert handler._convert_pages(PopplerBackend(), str(tmp_path)) == {}
+
+    with caplog.at_level("WARNING", logger="xtable"):
+        assert handler._convert_pages(BatchBackendError(), str(tmp_path)) == {}
+    assert "Batch image conversion failed" in caplog.text
+
+    with pytest.raises(TypeError, match="unexpected"):
+        handler._convert_pages(BatchBackendBug(), str(tmp_path))
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+import os
+import subprocess
+import sys
+
+
+testdir = os.path.dirname(os.path.abspath(__file__))
+testdir = os.path.join(testdir, "files")
+
+HEAVY_MODULES = ["cv2", "matplotlib", "torch"]
+
+
+def run_python(code):
+    """Runs code in a fresh interpreter and returns its stdout."""
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return proc.stdout
+
+
+def test_import_heavy_modules():
+    code = f"""
+import sys
+import xtable
+print(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules))
+"""
+    stdout = run_python(code)
+    assert stdout.splitlines()[-1] == "[]"
+
+
+def test_stream_heavy_modules():
+    filename = os.path.join(testdir, "health.pdf")
+    code = f"""
+import sys
+import xtable
+tables = xtable.read_pdf({filename!r}, flavor="stream")
+assert tables.n == 1
+print(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules))
+"""
+    stdout = run_python(code)
+    assert stdout.splitlines()[-1] == "[]"
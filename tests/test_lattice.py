@@ -4,11 +4,18 @@ import os
 import sys
 
 import pytest
+import numpy as np
 import pandas as pd
 from pandas.testing import assert_frame_equal
 
 import xtable
 from xtable.core import Table, TableList
+from xtable.helpers.image_processing import (
+    find_lines,
+    find_lines_and_joints,
+    find_contours,
+    find_joints,
+)
 from xtable.__version__ import generate_version
 
 from .data import *
@@ -46,6 +53,18 @@ def test_lattice_table_rotated():
     assert_frame_equal(df, tables[0].df)
 
 
+def test_lattice_table_rotated_pymupdf():
+    df = pd.DataFrame(data_lattice_table_rotated)
+
+    filename = os.path.join(testdir, "clockwise_table_1.pdf")
+    tables = xtable.read_pdf(filename, backend="pymupdf")
+    assert_frame_equal(df, tables[0].df)
+
+    filename = os.path.join(testdir, "anticlockwise_table_1.pdf")
+    tables = xtable.read_pdf(filename, backend="pymupdf")
+    assert_frame_equal(df, tables[0].df)
+
+
 @skip_on_windows
 def test_lattice_two_tables():
     df1 = pd.DataFrame(data_lattice_two_tables_1)
@@ -67,6 +86,60 @@ def test_lattice_table_regions():
     assert_frame_equal(df, tables[0].df)
 
 
+def test_find_lines_regions():
+    # a grid inside the first region and a line crossing the second,
+    # on a page with lines outside the regions
+    threshold = np.zeros((600, 400), dtype=np.uint8)
+    threshold[50:550:50, 20:380] = 255
+    threshold[20:580, 20:400:40] = 255
+    regions = [(30, 40, 200, 220), (150, 300, 250, 100), (0, 590, 10, 30)]
+
+    masked = np.zeros_like(threshold)
+    for x, y, w, h in regions:
+        masked[y : y + h, x : x + w] = threshold[y : y + h, x : x + w]
+    for direction in ["vertical", "horizontal"]:
+        dmask, lines = find_lines(
+            threshold, regions=regions, direction=direction, iterations=1
+        )
+        masked_dmask, masked_lines = find_lines(
+            masked, direction=direction, iterations=1
+        )
+        assert dmask.shape == threshold.shape
+        assert ((dmask != 0) == (masked_dmask != 0)).all()
+        assert sorted(lines) == sorted(masked_lines)
+
+
+def test_find_lines_and_joints():
+    # two grids of 5x5 joints and some text sized marks
+    threshold = np.zeros((800, 600), dtype=np.uint8)
+    for x, y in [(50, 50), (300, 450)]:
+        for i in range(0, 250, 60):
+            threshold[y + i : y + i + 3, x : x + 243] = 255
+            threshold[y : y + 243, x + i : x + i + 3] = 255
+    threshold[700:705, 50:60] = 255
+
+    for regions in [None, [(0, 0, 400, 400)]]:
+        tables, vertical_segments, horizontal_segments = find_lines_and_joints(
+            threshold, regions=regions
+        )
+        vertical_mask, vertical_lines = find_lines(
+            threshold, regions=regions, direction="vertical"
+        )
+        horizontal_mask, horizontal_lines = find_lines(
+            threshold, regions=regions, direction="horizontal"
+        )
+        contours = find_contours(vertical_mask, horizontal_mask)
+        assert tables == find_joints(contours, vertical_mask, horizontal_mask)
+        assert len(tables) == (2 if regions is None else 1)
+        assert all(len(joints) == 25 for joints in tables.values())
+        assert vertical_segments == vertical_lines
+        assert horizontal_segments == horizontal_lines
+
+    areas = [(40, 40, 270, 270)]
+    tables, _, _ = find_lines_and_joints(threshold, areas=areas)
+    assert list(tables) == [(40, 310, 310, 40)]
+
+
 @skip_on_windows
 def test_lattice_table_areas():
     df = pd.DataFrame(data_lattice_table_areas)
@@ -96,3 +96,49 @@ def test_grid_plot_ghostscript():
     filename = os.path.join(testdir, "foo.pdf")
     tables = xtable.read_pdf(filename, backend="ghostscript")
     return xtable.plot(tables[0], kind="grid")
+
+
+@pytest.mark.mpl_image_compare(
+    baseline_dir="files/baseline_plots",
+    filename="test_textedge_plot.png",
+    remove_text=True,
+)
+def test_textedge_plot_keep_artifacts():
+    filename = os.path.join(testdir, "tabula/12s0324.pdf")
+    tables = xtable.read_pdf(filename, flavor="stream", keep_artifacts=True)
+    assert tables[0]._text is not None
+    return xtable.plot(tables[0], kind="textedge")
+
+
+def test_plot_artifacts_recomputed():
+    filename = os.path.join(testdir, "foo.pdf")
+    tables = xtable.read_pdf(filename, backend="poppler")
+    table = tables[0]
+    assert table._text is None
+    assert table._image is None
+    assert table._segments is None
+
+    fig = xtable.plot(table, kind="line")
+    assert len(fig.axes[0].lines) > 0
+    # artifacts are not cached on the table
+    assert table._image is None
+
+
+def test_plot_artifacts_recomputed_with_password():
+    filename = os.path.join(testdir, "health_protected.pdf")
+    tables = xtable.read_pdf(filename, password="userpass", flavor="stream")
+    table = tables[0]
+    assert "userpass" not in repr(table._source)
+
+    fig = xtable.plot(table, kind="text", password="userpass")
+    assert len(fig.axes[0].patches) > 0
+
+
+def test_plot_without_source():
+    filename = os.path.join(testdir, "foo.pdf")
+    tables = xtable.read_pdf(filename, backend="poppler")
+    table = tables[0]
+    table._source = None
+
+    with pytest.raises(ValueError, match="keep_artifacts=True"):
+        xtable.plot(table, kind="line")
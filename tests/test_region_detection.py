@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import types
+
+import fitz
+import numpy as np
+import pytest
+
+
+testdir = os.path.dirname(os.path.abspath(__file__))
+testdir = os.path.join(testdir, "files")
+
+
+def page_image(filename, resolution=300):
+    """Renders the first page of a PDF to an RGB array, at the
+    resolution detect_table_regions renders pages at."""
+    with fitz.open(filename) as doc:
+        zoom = resolution / 72
+        pix = doc[0].get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+    return np.frombuffer(pix.samples, dtype=np.uint8).reshape(
+        pix.height, pix.width, 3
+    )
+
+
+def fake_pdf2image(monkeypatch):
+    """Replaces pdf2image with a module whose convert_from_path records
+    the page ranges it is called with, and returns 2x2 images filled
+    with their page number."""
+    calls = []
+
+    def convert_from_path(pdf_path, first_page, last_page, **kwargs):
+        calls.append((first_page, last_page))
+        return [
+            np.full((2, 2, 3), pgno, dtype=np.uint8)
+            for pgno in range(first_page, last_page + 1)
+        ]
+
+    pdf2image = types.ModuleType("pdf2image")
+    pdf2image.convert_from_path = convert_from_path
+    monkeypatch.setitem(sys.modules, "pdf2image", pdf2image)
+    return calls
+
+
+def test_pdf_pages2img(monkeypatch):
+    from xtable.region_detection.helpers.pdf_utils import pdf_pages2img
+
+    calls = fake_pdf2image(monkeypatch)
+    imgs = pdf_pages2img("foo.pdf", [7, 2, 3, 9, 1, 2])
+
+    # one conversion per run of consecutive pages, each page once
+    assert calls == [(1, 3), (7, 7), (9, 9)]
+    assert [img[0, 0, 0] for img in imgs] == [7, 2, 3, 9, 1, 2]
+
+
+class FakeDetector(object):
+    def __init__(self):
+        self.batches = []
+
+    def detect(self, images, conf_thres, iou_thres, batch_size=1, **kwargs):
+        self.batches.append([img[0, 0, 0] for img in images])
+        return [np.zeros((0, 6), dtype=np.float32) for img in images]
+
+
+def test_detect_pages_in_batches(monkeypatch):
+    import xtable.region_detection as region_detection
+    from xtable.region_detection.config import parameters
+
+    calls = fake_pdf2image(monkeypatch)
+    # PyPDF2 pages are not needed to detect the tables
+    monkeypatch.setattr(
+        region_detection, "norm_pdf_pages", lambda pdf_file, pages: list(pages)
+    )
+    detector = FakeDetector()
+    regions = region_detection._detect_pages(
+        detector, parameters(None, img_size=300), "foo.pdf", [1, 2, 3, 4, 5], 2
+    )
+
+    # pages are only rendered when their batch is reached
+    pdf_page, output, img = next(regions)
+    assert (pdf_page, output.shape, img[0, 0, 0]) == (1, (0, 6), 1)
+    assert calls == [(1, 2)]
+    assert [pdf_page for pdf_page, _, _ in regions] == [2, 3, 4, 5]
+    assert calls == [(1, 2), (3, 4), (5, 5)]
+    assert detector.batches == [[1, 2], [3, 4], [5]]
+
+
+def test_onnx_engine_same_boxes(tmp_path):
+    pytest.importorskip("torch")
+    pytest.importorskip("onnx")
+    pytest.importorskip("onnxruntime")
+
+    from xtable.region_detection.config import parameters
+    from xtable.region_detection.detect_func import TableDetector, export_onnx
+    from xtable.region_detection.onnx_detect import OnnxTableDetector
+
+    opt = parameters(None, img_size=416)
+    if not os.path.exists(opt.weights):
+        pytest.skip("Table detection weights are not available")
+
+    img = page_image(os.path.join(testdir, "foo.pdf"))
+    model = export_onnx(
+        opt.cfg, opt.weights, f=str(tmp_path / "model.onnx"), img_size=416
+    )
+    # torch letterboxed to the square input the model was exported with
+    torch_detector = TableDetector(opt.cfg, opt.weights, img_size=416, rect=False)
+    torch_boxes = torch_detector.detect([img], opt.conf_thres, opt.iou_thres)[0]
+    onnx_boxes = OnnxTableDetector(model).detect(
+        [img], opt.conf_thres, opt.iou_thres
+    )[0]
+
+    # boxes of (almost) equal confidence may come out in another order
+    assert len(onnx_boxes) == len(torch_boxes)
+    for box in torch_boxes:
+        assert np.abs(onnx_boxes[:, :4] - box[:4]).max(axis=1).min() <= 1
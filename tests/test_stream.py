@@ -8,6 +8,8 @@ from pandas.testing import assert_frame_equal
 
 import xtable
 from xtable.core import Table, TableList
+from xtable.parsers import Stream
+from xtable.helpers.utils import LayoutIndex, get_page_layout
 from xtable.__version__ import generate_version
 
 from .data import *
@@ -131,3 +133,26 @@ def test_stream_duplicated_text():
     filename = os.path.join(testdir, "birdisland.pdf")
     tables = xtable.read_pdf(filename, flavor="stream")
     assert_frame_equal(df, tables[0].df)
+
+
+def test_stream_group_rows():
+    filename = os.path.join(testdir, "health.pdf")
+    layout, __ = get_page_layout(filename)
+    text = LayoutIndex(layout).horizontal_text
+    text.sort(key=lambda t: (-t.y0, t.x0))
+
+    rows = Stream._group_rows(text, row_tol=2)
+    assert sum(len(r) for r in rows) == len([t for t in text if t.get_text().strip()])
+    for r in rows:
+        # a row is close to its first text object, and sorted on x0
+        assert all(abs(t.y0 - r[0].y0) <= 2 + 1e-5 * abs(t.y0) for t in r)
+        assert [t.x0 for t in r] == sorted(t.x0 for t in r)
+
+
+def test_stream_merge_columns():
+    cols = [(0, 10), (5, 12), (12.5, 20), (30, 40), (41, 50)]
+    assert Stream._merge_columns(cols) == [(0, 12), (12.5, 20), (30, 40), (41, 50)]
+    assert Stream._merge_columns(cols, column_tol=1) == [(0, 20), (30, 50)]
+    # overlapping columns within the tolerance are kept apart
+    assert Stream._merge_columns(cols, column_tol=-5) == cols
+    assert Stream._merge_columns([]) == []
@@ -3,7 +3,8 @@
 import logging
 
 from .__version__ import __version__
-from .io import read_pdf
+from .io import read_pdf, iter_tables
+from .cache import ExtractionCache
 from .helpers.plotting import PlotMethods
 
 
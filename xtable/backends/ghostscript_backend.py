@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import os
 import sys
 import ctypes
 from ctypes.util import find_library
@@ -26,13 +27,16 @@ class GhostscriptBackend(object):
         else:
             return installed_posix()
 
-    def convert(self, pdf_path, png_path, resolution=300):
+    def _check_installed(self):
         if not self.installed():
             raise OSError(
                 "Ghostscript is not installed. You can install it using the instructions"
                 " here: https://xtable-py.readthedocs.io/en/master/user/install-deps.html"
             )
 
+    def convert(self, pdf_path, png_path, resolution=300):
+        self._check_installed()
+
         import ghostscript
 
         gs_command = [
@@ -45,3 +49,41 @@ class GhostscriptBackend(object):
             pdf_path,
         ]
         ghostscript.Ghostscript(*gs_command)
+
+    def convert_pages(self, pdf_path, pages, output_dir, resolution=300):
+        """Converts pages of a PDF file to page-<n>.png files in
+        output_dir with a single Ghostscript invocation.
+
+        Returns
+        -------
+        png_paths : dict
+            Dict mapping each page number to the path of its PNG file.
+
+        """
+        self._check_installed()
+
+        import ghostscript
+
+        # Ghostscript numbers output files 1..n in page order
+        output_pattern = os.path.join(output_dir, "gs-%d.png")
+        gs_command = [
+            "gs",
+            "-q",
+            "-sDEVICE=png16m",
+            "-o",
+            output_pattern,
+            f"-r{resolution}",
+            "-sPageList=" + ",".join(str(page) for page in pages),
+            pdf_path,
+        ]
+        try:
+            ghostscript.Ghostscript(*gs_command)
+        except ghostscript.GhostscriptError as e:
+            raise ValueError(f"Ghostscript failed to convert pages: {e}")
+
+        png_paths = {}
+        for i, page in enumerate(pages, start=1):
+            png_path = os.path.join(output_dir, f"page-{page}.png")
+            os.replace(output_pattern % i, png_path)
+            png_paths[page] = png_path
+        return png_paths
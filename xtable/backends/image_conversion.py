@@ -2,8 +2,13 @@
 
 from .poppler_backend import PopplerBackend
 from .ghostscript_backend import GhostscriptBackend
+from .pymupdf_backend import PyMuPDFBackend
 
-BACKENDS = {"poppler": PopplerBackend, "ghostscript": GhostscriptBackend}
+BACKENDS = {
+    "poppler": PopplerBackend,
+    "ghostscript": GhostscriptBackend,
+    "pymupdf": PyMuPDFBackend,
+}
 
 
 class ImageConversionBackend(object):
@@ -16,9 +21,33 @@ class ImageConversionBackend(object):
         self.fallbacks = list(filter(lambda x: x != backend, BACKENDS.keys()))
 
     def convert(self, pdf_path, png_path):
+        return self._convert("convert", pdf_path, png_path)
+
+    def convert_pages(self, pdf_path, pages, output_dir):
+        """Converts pages of a PDF file to PNG files with a single
+        backend invocation.
+
+        Parameters
+        ----------
+        pdf_path : str
+            Path to the PDF file.
+        pages : list
+            List of int page numbers, in increasing order.
+        output_dir : str
+            Directory where the PNG files are written.
+
+        Returns
+        -------
+        png_paths : dict
+            Dict mapping each page number to the path of its PNG file.
+
+        """
+        return self._convert("convert_pages", pdf_path, pages, output_dir)
+
+    def _convert(self, method, *args):
         try:
             converter = BACKENDS[self.backend]()
-            converter.convert(pdf_path, png_path)
+            return getattr(converter, method)(*args)
         except Exception as e:
             import sys
 
@@ -26,14 +55,14 @@ class ImageConversionBackend(object):
                 for fallback in self.fallbacks:
                     try:
                         converter = BACKENDS[fallback]()
-                        converter.convert(pdf_path, png_path)
+                        result = getattr(converter, method)(*args)
                     except Exception as e:
                         raise type(e)(
                             str(e) + f" with image conversion backend '{fallback}'"
                         ).with_traceback(sys.exc_info()[2])
                         continue
                     else:
-                        break
+                        return result
             else:
                 raise type(e)(
                     str(e) + f" with image conversion backend '{self.backend}'"
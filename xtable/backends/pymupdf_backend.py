@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+import fitz
+import numpy as np
+
+
+class PyMuPDFBackend(object):
+    """Renders PDF pages in-process with PyMuPDF, without spawning a
+    subprocess or going through a PNG file.
+    """
+
+    def rasterize(self, page, resolution=300):
+        """Renders a page to a grayscale image.
+
+        Parameters
+        ----------
+        page : fitz.Page
+            PyMuPDF page object.
+        resolution : int, optional (default: 300)
+            Resolution in DPI.
+
+        Returns
+        -------
+        img : np.ndarray
+            uint8 array of shape (height, width).
+
+        """
+        zoom = resolution / 72.0
+        pix = page.get_pixmap(
+            matrix=fitz.Matrix(zoom, zoom), colorspace=fitz.csGRAY, alpha=False
+        )
+        img = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.stride)
+        return img[:, : pix.width]
+
+    def convert(self, pdf_path, png_path, resolution=300):
+        with fitz.open(pdf_path) as doc:
+            pix = doc[0].get_pixmap(
+                matrix=fitz.Matrix(resolution / 72.0, resolution / 72.0), alpha=False
+            )
+            pix.save(png_path)
+
+    def convert_pages(self, pdf_path, pages, output_dir, resolution=300):
+        png_paths = {}
+        with fitz.open(pdf_path) as doc:
+            for page in pages:
+                png_path = os.path.join(output_dir, f"page-{page}.png")
+                pix = doc[page - 1].get_pixmap(
+                    matrix=fitz.Matrix(resolution / 72.0, resolution / 72.0),
+                    alpha=False,
+                )
+                pix.save(png_path)
+                png_paths[page] = png_path
+        return png_paths
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+
+import os
+import copy
+import pickle
+import hashlib
+import logging
+import tempfile
+
+from .__version__ import __version__
+
+
+logger = logging.getLogger("xtable")
+
+
+class ExtractionCache(object):
+    """On-disk cache of the tables extracted from a page, keyed on
+    the content of the page and the settings it was parsed with, so
+    that a page which was already parsed, in the same or in another
+    PDF, is looked up instead of being parsed again.
+
+    Each entry is a pickle of the tables of a page, in its own file
+    in the cache directory. When the total size of the entries goes
+    over max_size, the least recently used ones are removed.
+
+    .. note:: Entries are loaded with pickle, so the cache directory
+        should only be writable by trusted users.
+
+    Parameters
+    ----------
+    path : str
+        Path to the cache directory, which is created if it does not
+        exist.
+    max_size : int, optional (default: 1073741824)
+        Maximum total size of the entries in bytes.
+
+    Attributes
+    ----------
+    hits : int
+        Number of pages which were found in the cache.
+    misses : int
+        Number of pages which were not found in the cache.
+    size : int
+        Total size of the entries in bytes.
+
+    """
+
+    def __init__(self, path, max_size=1024 ** 3):
+        self.path = os.fspath(path)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.path, exist_ok=True)
+        self.size = sum(os.path.getsize(f) for f in self._entries())
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} path={self.path!r} size={self.size}"
+            f" hits={self.hits} misses={self.misses}>"
+        )
+
+    def __contains__(self, key):
+        return os.path.exists(self._filename(key))
+
+    def __getstate__(self):
+        # counters belong to the process which looks entries up
+        return {"path": self.path, "max_size": self.max_size}
+
+    def __setstate__(self, state):
+        self.__init__(state["path"], max_size=state["max_size"])
+
+    @staticmethod
+    def key(page_hash, flavor, kwargs, layout_kwargs):
+        """Returns the cache key of a page parsed with some settings.
+
+        Parameters
+        ----------
+        page_hash : str
+            Hash of the content of the page, see
+            xtable.handlers.PDFHandler._get_page_hash.
+        flavor : str
+            The parsing method ('lattice' or 'stream').
+        kwargs : dict
+            Keyword arguments of the parser.
+        layout_kwargs : dict
+            A dict of `pdfminer.layout.LAParams <https://github.com/euske/pdfminer/blob/master/pdfminer/layout.py#L33>`_ kwargs.
+
+        Returns
+        -------
+        key : str
+
+        """
+        settings = repr(
+            (
+                __version__,
+                flavor,
+                sorted(kwargs.items()),
+                sorted(layout_kwargs.items()),
+            )
+        )
+        return hashlib.sha256(
+            "\n".join([page_hash, settings]).encode("utf-8")
+        ).hexdigest()
+
+    def get(self, key):
+        """Returns the tables cached for a key, and counts a hit or
+        a miss.
+
+        Parameters
+        ----------
+        key : str
+
+        Returns
+        -------
+        tables : list
+            List of xtable.core.Table objects, None if the key is
+            not in the cache.
+
+        """
+        filename = self._filename(key)
+        try:
+            with open(filename, "rb") as f:
+                tables = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError) as e:
+            if not isinstance(e, FileNotFoundError):
+                logger.debug(f"Cache entry {key} could not be read: {e}")
+            self.misses += 1
+            return None
+        # mark the entry as recently used
+        os.utime(filename)
+        self.hits += 1
+        return tables
+
+    def set(self, key, tables):
+        """Caches the tables of a page, and removes the least recently
+        used entries if the cache is over its maximum size.
+
+        Parameters
+        ----------
+        key : str
+        tables : list
+            List of xtable.core.Table objects.
+
+        """
+        filename = self._filename(key)
+        # the source of a table is specific to the PDF it was read
+        # from, and entries are shared between PDFs
+        entry = []
+        for table in tables:
+            table = copy.copy(table)
+            table._source = None
+            entry.append(table)
+        fd, tempname = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        if os.path.exists(filename):
+            self.size -= os.path.getsize(filename)
+        self.size += os.path.getsize(tempname)
+        # entries are written whole, for concurrent readers
+        os.replace(tempname, filename)
+        if self.size > self.max_size:
+            self._evict()
+
+    def clear(self):
+        """Removes all entries and resets the counters."""
+        for filename in self._entries():
+            os.remove(filename)
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _filename(self, key):
+        return os.path.join(self.path, f"{key}.pkl")
+
+    def _entries(self):
+        return [
+            os.path.join(self.path, f)
+            for f in os.listdir(self.path)
+            if f.endswith(".pkl")
+        ]
+
+    def _evict(self):
+        """Removes the least recently used entries until the cache is
+        under its maximum size."""
+        entries = []
+        for filename in self._entries():
+            stat = os.stat(filename)
+            entries.append((stat.st_mtime, stat.st_size, filename))
+        self.size = sum(size for _, size, _ in entries)
+        for _, size, filename in sorted(entries):
+            if self.size <= self.max_size:
+                break
+            os.remove(filename)
+            self.size -= size
+            logger.debug(f"Evicted {os.path.basename(filename)} from the cache")
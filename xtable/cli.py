@@ -4,14 +4,8 @@ import logging
 
 import click
 
-try:
-    import matplotlib.pyplot as plt
-except ImportError:
-    _HAS_MPL = False
-else:
-    _HAS_MPL = True
-
 from . import __version__, read_pdf, plot
+from .helpers.plotting import _matplotlib
 
 
 logger = logging.getLogger("xtable")
@@ -39,6 +33,12 @@ pass_config = click.make_pass_decorator(Config)
     help="Comma-separated page numbers." " Example: 1,3,4 or 1,4-end or all.",
 )
 @click.option("-pw", "--password", help="Password for decryption.")
+@click.option(
+    "-w",
+    "--workers",
+    type=int,
+    help="Number of worker processes used to parse pages in parallel.",
+)
 @click.option("-o", "--output", help="Output file path.")
 @click.option(
     "-f",
@@ -193,8 +193,7 @@ def lattice(c, *args, **kwargs):
     kwargs["shift_text"] = list(kwargs["shift_text"])
 
     if plot_type is not None:
-        if not _HAS_MPL:
-            raise ImportError("matplotlib is required for plotting.")
+        plt, _ = _matplotlib()
     else:
         if output is None:
             raise click.UsageError("Please specify output file path using --output")
@@ -284,8 +283,7 @@ def stream(c, *args, **kwargs):
     kwargs["columns"] = None if not columns else columns
 
     if plot_type is not None:
-        if not _HAS_MPL:
-            raise ImportError("matplotlib is required for plotting.")
+        plt, _ = _matplotlib()
     else:
         if output is None:
             raise click.UsageError("Please specify output file path using --output")
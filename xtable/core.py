@@ -16,6 +16,10 @@ import pandas as pd
 TEXTEDGE_REQUIRED_ELEMENTS = 4
 # padding added to table area on the left, right and bottom
 TABLE_AREA_PADDING = 10
+# maximum distance between the x-coordinates of a textline and
+# a textedge it extends, also the width of the x-coordinate buckets
+# which index the textedges
+TEXTEDGE_X_TOL = 0.5
 
 
 class TextEdge(object):
@@ -43,6 +47,9 @@ class TextEdge(object):
 
     """
 
+    # a page has thousands of text edges, which need no instance dict
+    __slots__ = ("x", "y0", "y1", "align", "intersections", "is_valid")
+
     def __init__(self, x, y0, y1, align="left"):
         self.x = x
         self.y0 = y0
@@ -63,7 +70,8 @@ class TextEdge(object):
         """Updates the text edge's x and bottom y coordinates and sets
         the is_valid attribute.
         """
-        if np.isclose(self.y0, y0, atol=edge_tol):
+        # np.isclose(self.y0, y0, atol=edge_tol) without its overhead
+        if abs(self.y0 - y0) <= edge_tol + 1e-05 * abs(y0):
             self.x = (self.intersections * self.x + x) / float(self.intersections + 1)
             self.y0 = y0
             self.intersections += 1
@@ -77,11 +85,22 @@ class TextEdges(object):
     """Defines a dict of left, right and middle text edges found on
     the PDF page. The dict has three keys based on the alignments,
     and each key's value is a list of xtable.core.TextEdge objects.
+
+    The text edges of each alignment are indexed on their x-coordinate
+    in buckets of TEXTEDGE_X_TOL, so that finding the text edge which
+    a textline extends only looks at the text edges nearby.
     """
 
+    __slots__ = ("edge_tol", "_textedges", "_buckets")
+
     def __init__(self, edge_tol=50):
         self.edge_tol = edge_tol
         self._textedges = {"left": [], "right": [], "middle": []}
+        self._buckets = {"left": {}, "right": {}, "middle": {}}
+
+    @staticmethod
+    def _bucket(x):
+        return int(x // TEXTEDGE_X_TOL)
 
     @staticmethod
     def get_x_coord(textline, align):
@@ -98,10 +117,21 @@ class TextEdges(object):
         """Returns the index of an existing text edge using
         the specified x coordinate and alignment.
         """
-        for i, te in enumerate(self._textedges[align]):
-            if np.isclose(te.x, x_coord, atol=0.5):
-                return i
-        return None
+        textedges = self._textedges[align]
+        buckets = self._buckets[align]
+        # np.isclose(te.x, x_coord, atol=TEXTEDGE_X_TOL) without its overhead
+        tol = TEXTEDGE_X_TOL + 1e-05 * abs(x_coord)
+        found = None
+        # one more bucket on each side for rounding
+        for b in range(
+            self._bucket(x_coord - tol) - 1, self._bucket(x_coord + tol) + 2
+        ):
+            for i in buckets.get(b, ()):
+                if found is not None and i > found:
+                    continue
+                if abs(textedges[i].x - x_coord) <= tol:
+                    found = i
+        return found
 
     def add(self, textline, align):
         """Adds a new text edge to the current dict."""
@@ -109,6 +139,9 @@ class TextEdges(object):
         y0 = textline.y0
         y1 = textline.y1
         te = TextEdge(x, y0, y1, align=align)
+        self._buckets[align].setdefault(self._bucket(x), []).append(
+            len(self._textedges[align])
+        )
         self._textedges[align].append(te)
 
     def update(self, textline):
@@ -119,9 +152,14 @@ class TextEdges(object):
             if idx is None:
                 self.add(textline, align)
             else:
-                self._textedges[align][idx].update_coords(
-                    x_coord, textline.y0, edge_tol=self.edge_tol
-                )
+                te = self._textedges[align][idx]
+                bucket = self._bucket(te.x)
+                te.update_coords(x_coord, textline.y0, edge_tol=self.edge_tol)
+                if self._bucket(te.x) != bucket:
+                    # the text edge moved to another bucket
+                    buckets = self._buckets[align]
+                    buckets[bucket].remove(idx)
+                    buckets.setdefault(self._bucket(te.x), []).append(idx)
 
     def generate(self, textlines):
         """Generates the text edges dict based on horizontal text
@@ -203,21 +241,55 @@ class TextEdges(object):
         sum_textline_height = 0
         for tl in textlines:
             sum_textline_height += tl.y1 - tl.y0
-            found = None
-            for area in table_areas:
-                # check for overlap
-                if tl.y0 >= area[1] and tl.y1 <= area[3]:
-                    found = area
-                    break
-            if found is not None:
-                table_areas.pop(found)
-                updated_area = (
-                    min(tl.x0, found[0]),
-                    min(tl.y0, found[1]),
-                    max(found[2], tl.x1),
-                    max(found[3], tl.y1),
-                )
-                table_areas[updated_area] = None
+
+        # the y-coordinates of an area do not change below, as only the
+        # textlines it contains vertically are added to it
+        areas = list(table_areas)
+        bounds = np.array([(area[1], area[3]) for area in areas]).reshape(-1, 2)
+        y0 = np.array([tl.y0 for tl in textlines], dtype=float)
+        y1 = np.array([tl.y1 for tl in textlines], dtype=float)
+        contained = (y0[:, np.newaxis] >= bounds[:, 0]) & (
+            y1[:, np.newaxis] <= bounds[:, 1]
+        )
+        n_contained = contained.sum(axis=1)
+        if n_contained.max(initial=0) == 1:
+            # each textline extends the only area which contains it
+            lines = np.flatnonzero(n_contained)
+            idx = contained[lines].argmax(axis=1)
+            x0 = np.array([area[0] for area in areas], dtype=float)
+            x1 = np.array([area[2] for area in areas], dtype=float)
+            np.minimum.at(x0, idx, [textlines[i].x0 for i in lines])
+            np.maximum.at(x1, idx, [textlines[i].x1 for i in lines])
+            # an extended area moves to the end, after the textline
+            # which extended it last
+            last = np.full(len(areas), -1)
+            np.maximum.at(last, idx, lines)
+            table_areas = {}
+            for a in np.lexsort((np.arange(len(areas)), last)).tolist():
+                area = areas[a]
+                if last[a] >= 0:
+                    area = (x0[a].item(), area[1], x1[a].item(), area[3])
+                table_areas[area] = None
+        elif n_contained.max(initial=0) > 1:
+            # areas overlap, a textline extends the first area which
+            # contains it
+            for i in np.flatnonzero(n_contained):
+                tl = textlines[i]
+                found = None
+                for area in table_areas:
+                    # check for overlap
+                    if tl.y0 >= area[1] and tl.y1 <= area[3]:
+                        found = area
+                        break
+                if found is not None:
+                    table_areas.pop(found)
+                    updated_area = (
+                        min(tl.x0, found[0]),
+                        min(tl.y0, found[1]),
+                        max(found[2], tl.x1),
+                        max(found[3], tl.y1),
+                    )
+                    table_areas[updated_area] = None
         average_textline_height = sum_textline_height / float(len(textlines))
 
         # add some padding to table areas
@@ -228,10 +300,84 @@ class TextEdges(object):
         return table_areas_padded
 
 
+def _snap(coords, values, tol):
+    """Finds the coordinates close to each value, like
+    np.isclose(value, coords, atol=tol) does for a single value.
+
+    Parameters
+    ----------
+    coords : np.ndarray
+        Coordinates, in increasing order for the fast path.
+    values : np.ndarray
+        Values to snap.
+    tol : float
+        Absolute tolerance.
+
+    Returns
+    -------
+    first : np.ndarray
+        Index of the first close coordinate for each value, -1 if
+        there is none.
+    count : np.ndarray
+        Number of close coordinates for each value.
+
+    """
+    if len(coords) and np.all(coords[:-1] <= coords[1:]):
+        # only coordinates within the largest tolerance can be close,
+        # they form a window of the sorted coordinates
+        margin = (tol + 1e-05 * np.abs(coords).max()) * (1 + 1e-06) + 1e-09
+        lo = np.searchsorted(coords, values - margin, side="left")
+        hi = np.searchsorted(coords, values + margin, side="right")
+        width = max(int((hi - lo).max()), 1)
+        idx = lo[:, None] + np.arange(width)
+        in_window = idx < hi[:, None]
+        idx = np.minimum(idx, len(coords) - 1)
+    else:
+        idx = np.broadcast_to(np.arange(len(coords)), (len(values), len(coords)))
+        in_window = np.ones(idx.shape, dtype=bool)
+    if not idx.size:
+        return np.full(len(values), -1), np.zeros(len(values), dtype=int)
+    close = in_window & np.isclose(values[:, None], coords[idx], atol=tol)
+    count = close.sum(axis=1)
+    first = np.where(count > 0, idx[np.arange(len(values)), close.argmax(axis=1)], -1)
+    return first, count
+
+
+def _fill_ranges(flags, L, J, K, mask):
+    """Sets flags[L, J:K] to True for each (L, J, K) where mask is
+    True, using a difference array over the second axis.
+    """
+    mask = mask & (J < K)
+    if not mask.any():
+        return
+    L, J, K = L[mask], J[mask], K[mask]
+    diff = np.zeros((flags.shape[0], flags.shape[1] + 1), dtype=int)
+    np.add.at(diff, (L, J), 1)
+    np.add.at(diff, (L, K), -1)
+    flags |= np.cumsum(diff, axis=1)[:, :-1] > 0
+
+
+def _cell_flag(name):
+    """Returns a property reading and writing a cell's entry in the
+    boolean array of its table with the same name.
+    """
+
+    def fget(self):
+        return bool(getattr(self._table, name)[self._r, self._c])
+
+    def fset(self, value):
+        getattr(self._table, name)[self._r, self._c] = value
+
+    return property(fget, fset)
+
+
 class Cell(object):
     """Defines a cell in a table with coordinates relative to a
     left-bottom origin. (PDF coordinate space)
 
+    Cells of a Table are lightweight views on the arrays of the table,
+    a Cell created on its own is backed by a single cell Table.
+
     Parameters
     ----------
     x1 : float
@@ -270,22 +416,21 @@ class Cell(object):
 
     """
 
+    # views are created for every cell access, keep them small
+    __slots__ = ("_table", "_r", "_c")
+
     def __init__(self, x1, y1, x2, y2):
-        self.x1 = x1
-        self.y1 = y1
-        self.x2 = x2
-        self.y2 = y2
-        self.lb = (x1, y1)
-        self.lt = (x1, y2)
-        self.rb = (x2, y1)
-        self.rt = (x2, y2)
-        self.left = False
-        self.right = False
-        self.top = False
-        self.bottom = False
-        self.hspan = False
-        self.vspan = False
-        self._text = ""
+        self._table = Table([(x1, x2)], [(y2, y1)])
+        self._r = 0
+        self._c = 0
+
+    @classmethod
+    def _view(cls, table, r, c):
+        cell = cls.__new__(cls)
+        cell._table = table
+        cell._r = r
+        cell._c = c
+        return cell
 
     def __repr__(self):
         x1 = round(self.x1)
@@ -294,13 +439,53 @@ class Cell(object):
         y2 = round(self.y2)
         return f"<Cell x1={x1} y1={y1} x2={x2} y2={y2}>"
 
+    @property
+    def x1(self):
+        return self._table.cols[self._c][0]
+
+    @property
+    def y1(self):
+        return self._table.rows[self._r][1]
+
+    @property
+    def x2(self):
+        return self._table.cols[self._c][1]
+
+    @property
+    def y2(self):
+        return self._table.rows[self._r][0]
+
+    @property
+    def lb(self):
+        return (self.x1, self.y1)
+
+    @property
+    def lt(self):
+        return (self.x1, self.y2)
+
+    @property
+    def rb(self):
+        return (self.x2, self.y1)
+
+    @property
+    def rt(self):
+        return (self.x2, self.y2)
+
+    left = _cell_flag("left")
+    right = _cell_flag("right")
+    top = _cell_flag("top")
+    bottom = _cell_flag("bottom")
+    hspan = _cell_flag("hspan")
+    vspan = _cell_flag("vspan")
+
     @property
     def text(self):
-        return self._text
+        return self._table.text[self._r * len(self._table.cols) + self._c]
 
     @text.setter
     def text(self, t):
-        self._text = "".join([self._text, t])
+        i = self._r * len(self._table.cols) + self._c
+        self._table.text[i] = "".join([self._table.text[i], t])
 
     @property
     def bound(self):
@@ -308,6 +493,51 @@ class Cell(object):
         return self.top + self.bottom + self.left + self.right
 
 
+class _CellRow(object):
+    """Sequence of the Cell views in a row of a Table."""
+
+    __slots__ = ("_table", "_r")
+
+    def __init__(self, table, r):
+        self._table = table
+        self._r = r
+
+    def __len__(self):
+        return len(self._table.cols)
+
+    def __getitem__(self, c):
+        if isinstance(c, slice):
+            return [self[i] for i in range(*c.indices(len(self)))]
+        return Cell._view(self._table, self._r, range(len(self))[c])
+
+    def __iter__(self):
+        for c in range(len(self)):
+            yield Cell._view(self._table, self._r, c)
+
+
+class _Cells(object):
+    """Sequence of the rows of Cell views of a Table, indexed like
+    the list of lists of cells it replaces.
+    """
+
+    __slots__ = ("_table",)
+
+    def __init__(self, table):
+        self._table = table
+
+    def __len__(self):
+        return len(self._table.rows)
+
+    def __getitem__(self, r):
+        if isinstance(r, slice):
+            return [self[i] for i in range(*r.indices(len(self)))]
+        return _CellRow(self._table, range(len(self))[r])
+
+    def __iter__(self):
+        for r in range(len(self)):
+            yield _CellRow(self._table, r)
+
+
 class Table(object):
     """Defines a table with coordinates relative to a left-bottom
     origin. (PDF coordinate space)
@@ -334,19 +564,36 @@ class Table(object):
         Table number on PDF page.
     page : int
         PDF page number.
+    left, right, top, bottom : np.ndarray
+        Boolean arrays of shape (n_rows, n_cols), whether or not
+        each cell is bounded on that side.
+    hspan, vspan : np.ndarray
+        Boolean arrays of shape (n_rows, n_cols), whether or not
+        each cell spans horizontally or vertically.
+    text : np.ndarray
+        Flat array of the text assigned to each cell, in row-major
+        order.
 
     """
 
     def __init__(self, cols, rows):
         self.cols = cols
         self.rows = rows
-        self.cells = [[Cell(c[0], r[1], c[1], r[0]) for c in cols] for r in rows]
+        shape = (len(rows), len(cols))
+        self.left = np.zeros(shape, dtype=bool)
+        self.right = np.zeros(shape, dtype=bool)
+        self.top = np.zeros(shape, dtype=bool)
+        self.bottom = np.zeros(shape, dtype=bool)
+        self.hspan = np.zeros(shape, dtype=bool)
+        self.vspan = np.zeros(shape, dtype=bool)
+        self.text = np.full(shape[0] * shape[1], "", dtype=object)
         self.df = None
         self.shape = (0, 0)
         self.accuracy = 0
         self.whitespace = 0
         self.order = None
         self.page = None
+        self._source = None
 
     def __repr__(self):
         return f"<{self.__class__.__name__} shape={self.shape}>"
@@ -358,13 +605,19 @@ class Table(object):
         if self.page < other.page:
             return True
 
+    @property
+    def cells(self):
+        """Two-dimensional sequence of Cell views, indexed as
+        cells[row][col].
+        """
+        return _Cells(self)
+
     @property
     def data(self):
         """Returns two-dimensional list of strings in table."""
-        d = []
-        for row in self.cells:
-            d.append([cell.text.strip() for cell in row])
-        return d
+        n_cols = len(self.cols)
+        text = [t.strip() for t in self.text.tolist()]
+        return [text[i : i + n_cols] for i in range(0, len(text), n_cols)]
 
     @property
     def parsing_report(self):
@@ -382,9 +635,8 @@ class Table(object):
 
     def set_all_edges(self):
         """Sets all table edges to True."""
-        for row in self.cells:
-            for cell in row:
-                cell.left = cell.right = cell.top = cell.bottom = True
+        for edge in (self.left, self.right, self.top, self.bottom):
+            edge[:] = True
         return self
 
     def set_edges(self, vertical, horizontal, joint_tol=2):
@@ -392,6 +644,10 @@ class Table(object):
         coordinates overlap with the line's coordinates within a
         tolerance.
 
+        Line end points are snapped to the sorted row and column
+        coordinates with np.searchsorted, the edges they cover are
+        then set for all lines at once.
+
         Parameters
         ----------
         vertical : list
@@ -400,167 +656,76 @@ class Table(object):
             List of detected horizontal lines.
 
         """
-        for v in vertical:
-            # find closest x coord
-            # iterate over y coords and find closest start and end points
-            i = [
-                i
-                for i, t in enumerate(self.cols)
-                if np.isclose(v[0], t[0], atol=joint_tol)
-            ]
-            j = [
-                j
-                for j, t in enumerate(self.rows)
-                if np.isclose(v[3], t[0], atol=joint_tol)
-            ]
-            k = [
-                k
-                for k, t in enumerate(self.rows)
-                if np.isclose(v[1], t[0], atol=joint_tol)
-            ]
-            if not j:
-                continue
-            J = j[0]
-            if i == [0]:  # only left edge
-                L = i[0]
-                if k:
-                    K = k[0]
-                    while J < K:
-                        self.cells[J][L].left = True
-                        J += 1
-                else:
-                    K = len(self.rows)
-                    while J < K:
-                        self.cells[J][L].left = True
-                        J += 1
-            elif i == []:  # only right edge
-                L = len(self.cols) - 1
-                if k:
-                    K = k[0]
-                    while J < K:
-                        self.cells[J][L].right = True
-                        J += 1
-                else:
-                    K = len(self.rows)
-                    while J < K:
-                        self.cells[J][L].right = True
-                        J += 1
-            else:  # both left and right edges
-                L = i[0]
-                if k:
-                    K = k[0]
-                    while J < K:
-                        self.cells[J][L].left = True
-                        self.cells[J][L - 1].right = True
-                        J += 1
-                else:
-                    K = len(self.rows)
-                    while J < K:
-                        self.cells[J][L].left = True
-                        self.cells[J][L - 1].right = True
-                        J += 1
+        n_rows, n_cols = len(self.rows), len(self.cols)
+        col_x = np.array([c[0] for c in self.cols], dtype=float)
+        row_y = np.array([r[0] for r in self.rows], dtype=float)
 
-        for h in horizontal:
+        v = np.array(vertical, dtype=float).reshape(-1, 4)
+        if len(v):
+            # find closest x coord
+            # find closest start and end points in y coords
+            i, n_i = _snap(col_x, v[:, 0], joint_tol)
+            # rows are in decreasing order
+            j, __ = _snap(-row_y, -v[:, 3], joint_tol)
+            k, __ = _snap(-row_y, -v[:, 1], joint_tol)
+            J = j
+            K = np.where(k >= 0, k, n_rows)
+            valid = j >= 0
+            only_left = valid & (i == 0) & (n_i == 1)
+            only_right = valid & (n_i == 0)
+            both = valid & ~only_left & ~only_right
+            L = np.where(only_left, 0, i)
+            _fill_ranges(self.left.T, L, J, K, only_left | both)
+            L = np.where(only_right, n_cols - 1, (i - 1) % n_cols)
+            _fill_ranges(self.right.T, L, J, K, only_right | both)
+
+        h = np.array(horizontal, dtype=float).reshape(-1, 4)
+        if len(h):
             # find closest y coord
-            # iterate over x coords and find closest start and end points
-            i = [
-                i
-                for i, t in enumerate(self.rows)
-                if np.isclose(h[1], t[0], atol=joint_tol)
-            ]
-            j = [
-                j
-                for j, t in enumerate(self.cols)
-                if np.isclose(h[0], t[0], atol=joint_tol)
-            ]
-            k = [
-                k
-                for k, t in enumerate(self.cols)
-                if np.isclose(h[2], t[0], atol=joint_tol)
-            ]
-            if not j:
-                continue
-            J = j[0]
-            if i == [0]:  # only top edge
-                L = i[0]
-                if k:
-                    K = k[0]
-                    while J < K:
-                        self.cells[L][J].top = True
-                        J += 1
-                else:
-                    K = len(self.cols)
-                    while J < K:
-                        self.cells[L][J].top = True
-                        J += 1
-            elif i == []:  # only bottom edge
-                L = len(self.rows) - 1
-                if k:
-                    K = k[0]
-                    while J < K:
-                        self.cells[L][J].bottom = True
-                        J += 1
-                else:
-                    K = len(self.cols)
-                    while J < K:
-                        self.cells[L][J].bottom = True
-                        J += 1
-            else:  # both top and bottom edges
-                L = i[0]
-                if k:
-                    K = k[0]
-                    while J < K:
-                        self.cells[L][J].top = True
-                        self.cells[L - 1][J].bottom = True
-                        J += 1
-                else:
-                    K = len(self.cols)
-                    while J < K:
-                        self.cells[L][J].top = True
-                        self.cells[L - 1][J].bottom = True
-                        J += 1
+            # find closest start and end points in x coords
+            i, n_i = _snap(-row_y, -h[:, 1], joint_tol)
+            j, __ = _snap(col_x, h[:, 0], joint_tol)
+            k, __ = _snap(col_x, h[:, 2], joint_tol)
+            J = j
+            K = np.where(k >= 0, k, n_cols)
+            valid = j >= 0
+            only_top = valid & (i == 0) & (n_i == 1)
+            only_bottom = valid & (n_i == 0)
+            both = valid & ~only_top & ~only_bottom
+            L = np.where(only_top, 0, i)
+            _fill_ranges(self.top, L, J, K, only_top | both)
+            L = np.where(only_bottom, n_rows - 1, (i - 1) % n_rows)
+            _fill_ranges(self.bottom, L, J, K, only_bottom | both)
 
         return self
 
     def set_border(self):
         """Sets table border edges to True."""
-        for r in range(len(self.rows)):
-            self.cells[r][0].left = True
-            self.cells[r][len(self.cols) - 1].right = True
-        for c in range(len(self.cols)):
-            self.cells[0][c].top = True
-            self.cells[len(self.rows) - 1][c].bottom = True
+        self.left[:, 0] = True
+        self.right[:, -1] = True
+        self.top[0, :] = True
+        self.bottom[-1, :] = True
         return self
 
     def set_span(self):
         """Sets a cell's hspan or vspan attribute to True depending
         on whether the cell spans horizontally or vertically.
         """
-        for row in self.cells:
-            for cell in row:
-                left = cell.left
-                right = cell.right
-                top = cell.top
-                bottom = cell.bottom
-                if cell.bound == 4:
-                    continue
-                elif cell.bound == 3:
-                    if not left and (right and top and bottom):
-                        cell.hspan = True
-                    elif not right and (left and top and bottom):
-                        cell.hspan = True
-                    elif not top and (left and right and bottom):
-                        cell.vspan = True
-                    elif not bottom and (left and right and top):
-                        cell.vspan = True
-                elif cell.bound == 2:
-                    if left and right and (not top and not bottom):
-                        cell.vspan = True
-                    elif top and bottom and (not left and not right):
-                        cell.hspan = True
-                elif cell.bound in [0, 1]:
-                    cell.vspan = True
-                    cell.hspan = True
+        left, right, top, bottom = self.left, self.right, self.top, self.bottom
+        bound = (
+            left.astype(int) + right.astype(int) + top.astype(int) + bottom.astype(int)
+        )
+        # bounded on three sides, open on the left/right or top/bottom
+        three = bound == 3
+        self.hspan |= three & ~(left & right)
+        self.vspan |= three & ~(top & bottom)
+        # bounded on two opposite sides
+        two = bound == 2
+        self.vspan |= two & left & right
+        self.hspan |= two & top & bottom
+        # bounded on one side or none
+        self.hspan |= bound < 2
+        self.vspan |= bound < 2
         return self
 
     def to_csv(self, path, **kwargs):
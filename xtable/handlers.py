@@ -182,27 +182,169 @@
 # -*- coding: utf-8 -*-
 
 import os
+import io
+import re
 import sys
+import copy
 import fitz
+import hashlib
+import logging
 import pathlib
+import itertools
+import warnings
 from typing import Union
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from pdfminer.pdfparser import PDFParser
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdfpage import PDFPage
 
 from .core import TableList
+from .cache import ExtractionCache
 from .parsers import Stream, Lattice
 from .helpers.utils import (
+    LayoutIndex,
     TemporaryDirectory,
-    get_page_layout,
-    get_text_objects,
+    get_pdfpage_layout,
     get_rotation,
     is_url,
     download_url,
 )
 
+logger = logging.getLogger("xtable")
+
+# degrees by which a page is turned clockwise to make its text upright
+ROTATIONS = {"anticlockwise": 90, "clockwise": 270}
+
+# number of pages converted to images by one image conversion backend
+# invocation, so that the tables on the first pages are returned before
+# the last pages are converted
+CONVERT_BATCH_SIZE = 32
+
+# reference to another object in a PDF object, e.g. '12 0 R'
+REFERENCE = re.compile(r"(\d+) \d+ R")
+# reference to the parent of an object in the page tree
+PARENT_REFERENCE = re.compile(r"/Parent\s*\d+ \d+ R")
+
+
+class Page(object):
+    """Defines a single page of a PDF file which is analysed in memory
+    from the PDFMiner document shared by all pages.
+
+    Parameters
+    ----------
+    pdfpage : object
+        PDFMiner PDFPage object.
+    number : int
+        Page number.
+    filename : str
+        Path where the page is written as a single page PDF, only
+        when a file is needed (e.g. for image conversion).
+    doc : object
+        PyMuPDF document which contains the page.
+
+    Attributes
+    ----------
+    rotation : str
+        '' if text on the page is upright, 'anticlockwise' or
+        'clockwise' otherwise. Rotated pages are turned upright
+        in memory before their layout is analysed.
+    imagename : str
+        Path to an image of the page rendered ahead of parsing by a
+        batch conversion, None if there is none.
+
+    """
+
+    def __init__(self, pdfpage, number, filename, doc):
+        self.pdfpage = pdfpage
+        self.number = number
+        self.filename = filename
+        self.rotation = ""
+        self.imagename = None
+        self._doc = doc
+        self._layouts = {}
+        self._objects = {}
+        self._upright = None
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} number={self.number}>"
+
+    def get_layout(self, layout_kwargs={}):
+        """Returns the PDFMiner LTPage object and page dimension.
+
+        Layouts are cached per rotation and layout_kwargs, so the
+        layout computed to detect rotation is reused by the parsers
+        and layout analysis is only run again when one of them changes.
+        """
+        key = self._key(layout_kwargs)
+        if key not in self._layouts:
+            pdfpage = self.pdfpage
+            if self.rotation:
+                pdfpage = copy.copy(pdfpage)
+                pdfpage.rotate = (pdfpage.rotate + ROTATIONS[self.rotation]) % 360
+            self._layouts[key] = get_pdfpage_layout(pdfpage, **layout_kwargs)
+        return self._layouts[key]
+
+    def get_objects(self, layout_kwargs={}):
+        """Returns the xtable.helpers.utils.LayoutIndex of the page
+        layout, which is cached like the layout itself.
+        """
+        key = self._key(layout_kwargs)
+        if key not in self._objects:
+            layout, __ = self.get_layout(layout_kwargs)
+            self._objects[key] = LayoutIndex(layout)
+        return self._objects[key]
+
+    def _key(self, layout_kwargs):
+        return (self.rotation, tuple(sorted(layout_kwargs.items())))
+
+    def set_rotation(self, rotation):
+        """Sets the rotation of the page and drops cached layouts of
+        the previous orientation, which are no longer needed.
+        """
+        if rotation != self.rotation:
+            self.rotation = rotation
+            self._layouts = {
+                k: v for k, v in self._layouts.items() if k[0] == rotation
+            }
+            self._objects = {
+                k: v for k, v in self._objects.items() if k[0] == rotation
+            }
+
+    def save(self):
+        """Writes the page, turned upright, as a single page PDF
+        to self.filename.
+        """
+        if os.path.exists(self.filename):
+            return
+        doc = self._upright_doc()
+        doc.save(self.filename)
+        doc.close()
+
+    def get_fitz_page(self):
+        """Returns the page, turned upright, as a PyMuPDF page."""
+        if not self.rotation:
+            return self._doc[self.number - 1]
+        if self._upright is None:
+            self._upright = self._upright_doc()
+        return self._upright[0]
+
+    def _upright_doc(self):
+        doc = fitz.open()
+        pno = self.number - 1
+        if self.rotation:
+            rotate = (self._doc[pno].rotation + ROTATIONS[self.rotation]) % 360
+        else:
+            rotate = -1
+        doc.insert_pdf(self._doc, from_page=pno, to_page=pno, rotate=rotate)
+        return doc
+
 
 class PDFHandler(object):
-    """Handles all operations like temp directory creation, splitting
-    file into single page PDFs, parsing each PDF and then removing the
-    temp directory.
+    """Handles all operations like temp directory creation, analysing
+    each page of the PDF file in memory, parsing each page and then
+    removing the temp directory.
 
     Parameters
     ----------
@@ -231,6 +373,10 @@ class PDFHandler(object):
                 self.password = self.password.encode("ascii")
         self.layout = self._get_layout(filepath)
         self.pages = self._get_pages(pages)
+        self._document = None
+        self._pdfpages = None
+        self._images = {}
+        self._xref_hashes = {}
 
     def _get_layout(self, filepath: Union[pathlib.Path, str]):
         """Get the layout of pdf file.
@@ -245,16 +391,97 @@ class PDFHandler(object):
             Object of pdf layout in pyMuPDF structure.
         """
         with open(filepath, "rb") as f:
-            infile = fitz.Document(f)
-
-            if infile.is_encrypted:
-                if self.password is not None:  # decrypt if password provided
-                    rc = infile.authenticate(self.password)
-                    if not rc > 0:
-                        raise ValueError("wrong password")
-                    return rc
-            else:
-                return infile
+            self._data = f.read()
+        infile = fitz.open(stream=self._data, filetype="pdf")
+
+        self._encrypted = infile.is_encrypted
+        if infile.is_encrypted:
+            rc = infile.authenticate(self.password)
+            if not rc > 0:
+                raise ValueError("file has not been decrypted")
+        return infile
+
+    def _get_pdfpage(self, pgno: int):
+        """Returns the PDFMiner PDFPage object for a page number. The
+        PDFMiner document is parsed once and shared by all pages.
+
+        Parameters
+        ----------
+        pgno : int
+            Page number.
+
+        Returns
+        -------
+        pdfpage : object
+            PDFMiner PDFPage object.
+
+        """
+        if self._document is None:
+            parser = PDFParser(io.BytesIO(self._data))
+            self._document = PDFDocument(parser, password=self.password)
+            self._pdfpages = list(PDFPage.create_pages(self._document))
+        return self._pdfpages[pgno - 1]
+
+    def _get_page_hash(self, pgno: int):
+        """Returns a hash of the content stream of a page, the
+        resources it uses, its boxes and its rotation. Pages with
+        the same hash have the same tables, even in different PDFs.
+
+        Parameters
+        ----------
+        pgno : int
+            Page number.
+
+        Returns
+        -------
+        page_hash : str
+
+        """
+        doc = self.layout
+        page = doc[pgno - 1]
+        h = hashlib.sha256(page.read_contents())
+        boxes = (tuple(page.mediabox), tuple(page.cropbox), page.rotation)
+        h.update(repr(boxes).encode("utf-8"))
+
+        # resources can be inherited from the page tree
+        xref = page.xref
+        kind, resources = doc.xref_get_key(xref, "Resources")
+        while kind == "null":
+            kind, parent = doc.xref_get_key(xref, "Parent")
+            if kind != "xref":
+                break
+            xref = int(parent.split()[0])
+            kind, resources = doc.xref_get_key(xref, "Resources")
+        h.update(self._resolve_references(resources).encode("utf-8"))
+        return h.hexdigest()
+
+    def _resolve_references(self, obj, stack=()):
+        """Replaces the references in a PDF object with the hashes of
+        the objects they point to, which do not depend on where the
+        objects are in the file."""
+        return REFERENCE.sub(
+            lambda m: self._get_xref_hash(int(m.group(1)), stack),
+            PARENT_REFERENCE.sub("", obj),
+        )
+
+    def _get_xref_hash(self, xref, stack=()):
+        """Returns a hash of a PDF object, its stream and the objects
+        it references. Hashes are cached as objects like fonts are
+        shared by many pages."""
+        if xref in self._xref_hashes:
+            return self._xref_hashes[xref]
+        if xref in stack:
+            # the object is already being hashed
+            return "cycle"
+        doc = self.layout
+        obj = doc.xref_object(xref, compressed=True)
+        h = hashlib.sha256(
+            self._resolve_references(obj, stack + (xref,)).encode("utf-8")
+        )
+        if doc.xref_is_stream(xref):
+            h.update(doc.xref_stream_raw(xref))
+        self._xref_hashes[xref] = h.hexdigest()
+        return self._xref_hashes[xref]
 
     def _get_pages(self, pages):
         """Converts pages string to list of ints.
@@ -278,79 +505,390 @@ class PDFHandler(object):
         if pages == "1":
             page_numbers.append({"start": 1, "end": 1})
         else:
-            with open(self.filepath, "rb") as f:
-                infile = fitz.open(f)
-
-                if infile.is_encrypted:
-                    infile.authenticate(self.password)
-
-                if pages == "all":
-                    page_numbers.append({"start": 1, "end": infile.page_count})
-                else:
-                    for r in pages.split(","):
-                        if "-" in r:
-                            a, b = r.split("-")
-                            if b == "end":
-                                b = infile.page_count
-                            page_numbers.append({"start": int(a), "end": int(b)})
-                        else:
-                            page_numbers.append({"start": int(r), "end": int(r)})
+            infile = self.layout
+
+            if pages == "all":
+                page_numbers.append({"start": 1, "end": infile.page_count})
+            else:
+                for r in pages.split(","):
+                    if "-" in r:
+                        a, b = r.split("-")
+                        if b == "end":
+                            b = infile.page_count
+                        page_numbers.append({"start": int(a), "end": int(b)})
+                    else:
+                        page_numbers.append({"start": int(r), "end": int(r)})
 
         P = []
         for p in page_numbers:
             P.extend(range(p["start"], p["end"] + 1))
         return sorted(set(P))
 
-    def _save_page(self, pgno: int, temp: Union[pathlib.Path, str]):
-        """Extract specified page from PDF file and save into temporary directory.
+    def _get_page(
+        self, pgno: int, temp: Union[pathlib.Path, str], layout_kwargs={}
+    ):
+        """Analyses the layout of specified page in memory and detects
+        its rotation. A rotated page is turned upright, its layout is
+        analysed again when a parser asks for it.
+
         Parameters
         ----------
         pgno : int
             Page number.
             Example: 1.
         temp: pathlib.Path|str
+            Temporary directory, used only if the page needs to be
+            written to a file.
+        layout_kwargs : dict, optional (default: {})
+            A dict of `pdfminer.layout.LAParams <https://github.com/euske/pdfminer/blob/master/pdfminer/layout.py#L33>`_ kwargs.
+
+        Returns
+        -------
+        page : xtable.handlers.Page
+
+        """
+        page = Page(
+            self._get_pdfpage(pgno),
+            pgno,
+            os.path.join(temp, f"page-{pgno}.pdf"),
+            self.layout,
+        )
+        objects = page.get_objects(layout_kwargs)
+
+        # detect rotated PDF
+        page.set_rotation(
+            get_rotation(
+                objects.chars, objects.horizontal_text, objects.vertical_text
+            )
+        )
+        if not page.rotation:
+            # batch images are rendered from the pages as they are
+            page.imagename = self._images.get(pgno)
+        return page
+
+    def _convert_pages(self, backend, temp: Union[pathlib.Path, str], pages=None):
+        """Converts pages to images with a single invocation of the
+        image conversion backend, if it supports batch conversion.
+        Backends which rasterize pages in memory are left alone.
+
+        If the backend fails with an OSError or a ValueError, pages are
+        converted one at a time instead. Other errors are raised.
+
+        Parameters
+        ----------
+        backend : object
+            Image conversion backend of the Lattice parser.
+        temp: pathlib.Path|str
+            Temporary directory where the images are written.
+        pages : list, optional (default: None)
+            Page numbers to convert, all pages if None.
+
+        Returns
+        -------
+        images : dict
+            Dict mapping page numbers to image paths, empty if pages
+            will be converted one at a time.
+
+        """
+        if not hasattr(backend, "convert_pages") or hasattr(backend, "rasterize"):
+            return {}
+        if pages is not None and not pages:
+            return {}
+        if self._encrypted:
+            # encrypted files are decrypted page by page in Page.save
+            return {}
+        try:
+            images = backend.convert_pages(
+                self.filepath, self.pages if pages is None else pages, temp
+            )
+        except (OSError, ValueError) as e:
+            # the backend is missing or failed on these pages, which are
+            # converted one at a time, raising the error for the pages
+            # that need an image
+            logger.warning(
+                f"Batch image conversion failed, converting pages one at a time: {e}"
+            )
+            images = {}
+        return images
+
+    def _parse_page(
+        self, pgno, parser, tempdir, suppress_stdout=False, layout_kwargs={}
+    ):
+        """Analyses a single page in memory and extracts tables
+        from it.
+
+        Parameters
+        ----------
+        pgno : int
+            Page number.
+        parser : xtable.parsers.Lattice or xtable.parsers.Stream
+            Parser instance used to extract tables.
+        tempdir : str
             Temporary directory.
+        suppress_stdout : bool (default: False)
+            Suppress logs and warnings.
+        layout_kwargs : dict, optional (default: {})
+            A dict of `pdfminer.layout.LAParams <https://github.com/euske/pdfminer/blob/master/pdfminer/layout.py#L33>`_ kwargs.
+
+        Returns
+        -------
+        tables : list
+            List of xtable.core.Table objects found on the page.
+
         """
-        # read the pdf file
-        with open(self.filepath, "rb") as fileobj:
-            infile = fitz.open(fileobj)
-            if infile.is_encrypted:
-                infile.authenticate(self.password)
-
-        # create new pdf file and get the pdf page
-        newdoc_path = pathlib.Path(temp) / str(f"page-{pgno}.pdf")
-        new_doc = fitz.open()
-        new_doc.insert_pdf(self.layout, from_page=pgno, to_page=pgno)
-        new_doc.save(newdoc_path)
-        new_doc.close()
-        layout, dim = get_page_layout(newdoc_path)
-
-        # fix rotated PDF
-        chars = get_text_objects(layout, ltype="char")
-        horizontal_text = get_text_objects(layout, ltype="horizontal_text")
-        vertical_text = get_text_objects(layout, ltype="vertical_text")
-        rotation = get_rotation(chars, horizontal_text, vertical_text)
-        if rotation != "":
-            # init new document
-            rotate_newdoc_path = pathlib.Path(temp) / str(f"page-{pgno}-rotated.pdf")
-            rotate_doc = fitz.open()
-            # rotate and save
-            if rotation == "anticlockwise":
-                # rotate page by 90 degrees anticounter-clockwise
-                rotate_doc.insert_pdf(
-                    self.layout, from_page=pgno, to_page=pgno, rotate=90
-                )
-            elif rotation == "clockwise":
-                # rotate page by -90 degrees counter-clockwise
-                rotate_doc.insert_pdf(
-                    self.layout, from_page=pgno, to_page=pgno, rotate=-90
+        page = self._get_page(pgno, tempdir, layout_kwargs=layout_kwargs)
+        return parser.extract_tables(
+            page, suppress_stdout=suppress_stdout, layout_kwargs=layout_kwargs
+        )
+
+    def _set_source(self, tables, pgno, layout_kwargs, kwargs):
+        """Records the page and the options each table was extracted
+        with, so that plotting artifacts which were not kept can be
+        recomputed from the source page. The password is not recorded,
+        it has to be passed to xtable.plot again."""
+        for table in tables:
+            table._source = (self.filepath, pgno, layout_kwargs, kwargs)
+
+    def _get_cache_keys(self, cache, flavor, layout_kwargs, kwargs):
+        """Returns the cache key of each page, an empty dict if there
+        is no cache. Tables which keep their plotting artifacts are
+        too large to be cached.
+        """
+        if cache is None or kwargs.get("keep_artifacts"):
+            return {}
+        return {
+            p: cache.key(self._get_page_hash(p), flavor, kwargs, layout_kwargs)
+            for p in self.pages
+        }
+
+    def _get_cached(self, cache, keys, pgno):
+        """Returns the tables of a page from the cache, None if they
+        are not cached. The tables may have been cached from the same
+        page of another PDF, or from another page of this one.
+        """
+        if pgno not in keys:
+            return None
+        tables = cache.get(keys[pgno])
+        if tables is not None:
+            logger.debug(f"Found tables of page-{pgno} in the cache")
+            for table in tables:
+                table.page = pgno
+        return tables
+
+    def _remove_page_files(self, pgno, temp: Union[pathlib.Path, str]):
+        """Removes the single page PDF and image written for a page
+        which has been parsed."""
+        for ext in [".pdf", ".png"]:
+            path = os.path.join(temp, f"page-{pgno}{ext}")
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _iter_serial(
+        self, flavor, suppress_stdout=False, layout_kwargs={}, cache=None, **kwargs
+    ):
+        """Extracts tables page by page in the current process. Pages
+        found in the cache are not converted to images nor parsed.
+
+        Yields
+        ------
+        tables : list
+            List of xtable.core.Table objects found on a page, in
+            page order.
+
+        """
+        with TemporaryDirectory() as tempdir:
+            parser = Lattice(**kwargs) if flavor == "lattice" else Stream(**kwargs)
+            keys = self._get_cache_keys(cache, flavor, layout_kwargs, kwargs)
+            try:
+                for i, p in enumerate(self.pages):
+                    if flavor == "lattice" and i % CONVERT_BATCH_SIZE == 0:
+                        self._images = self._convert_pages(
+                            parser.backend,
+                            tempdir,
+                            [
+                                q
+                                for q in self.pages[i : i + CONVERT_BATCH_SIZE]
+                                if q not in keys or keys[q] not in cache
+                            ],
+                        )
+                    t = self._get_cached(cache, keys, p)
+                    if t is None:
+                        t = self._parse_page(
+                            p,
+                            parser,
+                            tempdir,
+                            suppress_stdout=suppress_stdout,
+                            layout_kwargs=layout_kwargs,
+                        )
+                        if p in keys:
+                            cache.set(keys[p], t)
+                    self._set_source(t, p, layout_kwargs, kwargs)
+                    self._remove_page_files(p, tempdir)
+                    yield t
+            finally:
+                self._images = {}
+
+    def _iter_parallel(
+        self,
+        flavor,
+        workers,
+        suppress_stdout=False,
+        layout_kwargs={},
+        cache=None,
+        **kwargs,
+    ):
+        """Extracts tables from all pages using a pool of worker
+        processes. Each worker owns its own handler and parser, and
+        at most two pages per worker are parsed ahead of the page
+        which is yielded.
+
+        Warnings raised inside a worker are re-issued in the calling
+        process so that they behave like they do in the serial path.
+        For Lattice, page images are batch converted in the calling
+        process, CONVERT_BATCH_SIZE pages at a time, as the pages are
+        submitted, and each image is sent to the worker parsing its
+        page. The files of a page are removed once its tables have been
+        returned. Pages found in the cache are looked up in the calling
+        process and are not sent to the workers.
+
+        Yields
+        ------
+        tables : list
+            List of xtable.core.Table objects found on a page, in
+            page order.
+
+        """
+        with TemporaryDirectory() as tempdir:
+            keys = self._get_cache_keys(cache, flavor, layout_kwargs, kwargs)
+            backend = None
+            if flavor == "lattice":
+                with warnings.catch_warnings():
+                    # the workers' parsers warn about their options
+                    warnings.simplefilter("ignore")
+                    backend = Lattice(**kwargs).backend
+            initargs = (
+                self.filepath,
+                self.password,
+                flavor,
+                suppress_stdout,
+                layout_kwargs,
+                kwargs,
+            )
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=initargs
+            ) as executor:
+                images = {}
+
+                def submit(i, p):
+                    if backend is not None and i % CONVERT_BATCH_SIZE == 0:
+                        # convert the next batch just before its first
+                        # page is submitted
+                        images.update(
+                            self._convert_pages(
+                                backend,
+                                tempdir,
+                                [
+                                    q
+                                    for q in self.pages[i : i + CONVERT_BATCH_SIZE]
+                                    if q not in keys or keys[q] not in cache
+                                ],
+                            )
+                        )
+                    t = self._get_cached(cache, keys, p)
+                    if t is None:
+                        future = executor.submit(
+                            _parse_page_worker, p, images.pop(p, None)
+                        )
+                        return p, False, future
+                    future = Future()
+                    future.set_result((t, []))
+                    return p, True, future
+
+                pages = enumerate(self.pages)
+                futures = deque(
+                    submit(i, p) for i, p in itertools.islice(pages, 2 * workers)
                 )
-                # save pdf file
-            rotate_doc.save(rotate_newdoc_path)
-            rotate_doc.close()
+                while futures:
+                    p, cached, future = futures.popleft()
+                    t, caught = future.result()
+                    next_page = next(pages, None)
+                    if next_page is not None:
+                        futures.append(submit(*next_page))
+                    for message, category in caught:
+                        warnings.warn(message, category)
+                    if not cached and p in keys:
+                        cache.set(keys[p], t)
+                    self._set_source(t, p, layout_kwargs, kwargs)
+                    self._remove_page_files(p, tempdir)
+                    yield t
+
+    def iter_parse(
+        self,
+        flavor="lattice",
+        suppress_stdout=False,
+        layout_kwargs={},
+        workers=None,
+        cache=None,
+        **kwargs,
+    ):
+        """Extracts tables page by page, yielding the tables found on
+        each page as soon as it is parsed.
+
+        Parameters
+        ----------
+        flavor : str (default: 'lattice')
+            The parsing method to use ('lattice' or 'stream').
+            Lattice is used by default.
+        suppress_stdout : str (default: False)
+            Suppress logs and warnings.
+        layout_kwargs : dict, optional (default: {})
+            A dict of `pdfminer.layout.LAParams <https://github.com/euske/pdfminer/blob/master/pdfminer/layout.py#L33>`_ kwargs.
+        workers : int, optional (default: None)
+            Number of worker processes used to parse pages in parallel.
+            Pages are parsed serially in the current process if None or 1.
+        cache : xtable.cache.ExtractionCache or str, optional (default: None)
+            Cache, or path to the directory of a cache, where the
+            tables of each page are looked up before it is parsed.
+        kwargs : dict
+            See xtable.read_pdf kwargs.
+
+        Yields
+        ------
+        tables : list
+            List of xtable.core.Table objects found on a page, in
+            page order.
+
+        """
+        if workers is not None and workers < 1:
+            raise ValueError("workers should be a positive integer")
+        if isinstance(cache, (str, os.PathLike)):
+            cache = ExtractionCache(cache)
+
+        if workers is not None and workers > 1 and len(self.pages) > 1:
+            return self._iter_parallel(
+                flavor,
+                min(workers, len(self.pages)),
+                suppress_stdout=suppress_stdout,
+                layout_kwargs=layout_kwargs,
+                cache=cache,
+                **kwargs,
+            )
+        return self._iter_serial(
+            flavor,
+            suppress_stdout=suppress_stdout,
+            layout_kwargs=layout_kwargs,
+            cache=cache,
+            **kwargs,
+        )
 
     def parse(
-        self, flavor="lattice", suppress_stdout=False, layout_kwargs={}, **kwargs
+        self,
+        flavor="lattice",
+        suppress_stdout=False,
+        layout_kwargs={},
+        workers=None,
+        cache=None,
+        **kwargs,
     ):
         """Extracts tables by calling parser.get_tables on all single
         page PDFs.
@@ -364,25 +902,77 @@ class PDFHandler(object):
             Suppress logs and warnings.
         layout_kwargs : dict, optional (default: {})
             A dict of `pdfminer.layout.LAParams <https://github.com/euske/pdfminer/blob/master/pdfminer/layout.py#L33>`_ kwargs.
+        workers : int, optional (default: None)
+            Number of worker processes used to parse pages in parallel.
+            Pages are parsed serially in the current process if None or 1.
+        cache : xtable.cache.ExtractionCache or str, optional (default: None)
+            Cache, or path to the directory of a cache, where the
+            tables of each page are looked up before it is parsed.
         kwargs : dict
-            See camelot.read_pdf kwargs.
+            See xtable.read_pdf kwargs.
 
         Returns
         -------
-        tables : camelot.core.TableList
+        tables : xtable.core.TableList
             List of tables found in PDF.
 
         """
         tables = []
-        with TemporaryDirectory() as tempdir:
-            for p in self.pages:
-                self._save_page(p, tempdir)
-            pages = [os.path.join(tempdir, f"page-{p}.pdf") for p in self.pages]
-            parser = Lattice(**kwargs) if flavor == "lattice" else Stream(**kwargs)
-            for p in pages:
-                t = parser.extract_tables(
-                    p, suppress_stdout=suppress_stdout, layout_kwargs=layout_kwargs
-                )
-                tables.extend(t)
+        for t in self.iter_parse(
+            flavor=flavor,
+            suppress_stdout=suppress_stdout,
+            layout_kwargs=layout_kwargs,
+            workers=workers,
+            cache=cache,
+            **kwargs,
+        ):
+            tables.extend(t)
         return TableList(sorted(tables))
 
+
+# per-process state for parallel page parsing, set up by _init_worker
+_worker = {}
+
+
+def _init_worker(filepath, password, flavor, suppress_stdout, layout_kwargs, kwargs):
+    """Initializes a worker process with its own handler and parser."""
+    _worker["handler"] = PDFHandler(filepath, password=password)
+    _worker["parser"] = Lattice(**kwargs) if flavor == "lattice" else Stream(**kwargs)
+    _worker["suppress_stdout"] = suppress_stdout
+    _worker["layout_kwargs"] = layout_kwargs
+
+
+def _parse_page_worker(pgno, imagename=None):
+    """Extracts tables from a single page inside a worker process.
+
+    Parameters
+    ----------
+    pgno : int
+        Page number.
+    imagename : str, optional (default: None)
+        Path to the image of the page if it was batch converted,
+        otherwise the page is converted by the parser.
+
+    Returns
+    -------
+    tables : list
+        List of xtable.core.Table objects found on the page.
+    caught : list
+        List of (message, category) tuples for the warnings raised
+        while parsing the page.
+
+    """
+    handler = _worker["handler"]
+    handler._images = {pgno: imagename} if imagename is not None else {}
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("ignore" if _worker["suppress_stdout"] else "always")
+        with TemporaryDirectory() as tempdir:
+            tables = handler._parse_page(
+                pgno,
+                _worker["parser"],
+                tempdir,
+                suppress_stdout=_worker["suppress_stdout"],
+                layout_kwargs=_worker["layout_kwargs"],
+            )
+    caught = [(str(m.message), m.category) for m in w]
+    return tables, caught
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 
-import cv2
 import numpy as np
 
 
@@ -9,8 +8,9 @@ def adaptive_threshold(imagename, process_background=False, blocksize=15, c=-2):
 
     Parameters
     ----------
-    imagename : string
-        Path to image file.
+    imagename : string or np.ndarray
+        Path to image file, or the image itself as a BGR or
+        grayscale array.
     process_background : bool, optional (default: False)
         Whether or not to process lines that are in background.
     blocksize : int, optional (default: 15)
@@ -32,8 +32,16 @@ def adaptive_threshold(imagename, process_background=False, blocksize=15, c=-2):
         numpy.ndarray representing the thresholded image.
 
     """
-    img = cv2.imread(imagename)
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    import cv2
+
+    if isinstance(imagename, np.ndarray):
+        img = imagename
+    else:
+        img = cv2.imread(imagename)
+    if img.ndim == 2:
+        gray = img
+    else:
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
 
     if process_background:
         threshold = cv2.adaptiveThreshold(
@@ -64,7 +72,8 @@ def find_lines(
     regions : list, optional (default: None)
         List of page regions that may contain tables of the form x1,y1,x2,y2
         where (x1, y1) -> left-top and (x2, y2) -> right-bottom
-        in image coordinate space.
+        in image coordinate space. Only the parts of the image
+        around them are transformed.
     direction : string, optional (default: 'horizontal')
         Specifies whether to find vertical or horizontal lines.
     line_scale : int, optional (default: 15)
@@ -89,7 +98,7 @@ def find_lines(
         image coordinate space.
 
     """
-    lines = []
+    import cv2
 
     if direction == "vertical":
         size = threshold.shape[0] // line_scale
@@ -101,30 +110,116 @@ def find_lines(
         raise ValueError("Specify direction as either 'vertical' or 'horizontal'")
 
     if regions is not None:
-        region_mask = np.zeros(threshold.shape)
-        for region in regions:
-            x, y, w, h = region
-            region_mask[y : y + h, x : x + w] = 1
-        threshold = np.multiply(threshold, region_mask)
+        found = _find_lines_in_regions(threshold, regions, {direction: el}, iterations)
+        return found[direction]
+
+    return _open_lines(threshold, direction, el, iterations)
+
+
+def find_lines_and_joints(
+    threshold, regions=None, areas=None, line_scale=15, iterations=0
+):
+    """Finds vertical and horizontal lines, the table boundaries they
+    form and the joints inside each boundary, in a single pass over a
+    thresholded image.
+
+    Both directions share the image, and the parts of it around the
+    regions. The masks of the lines stay uint8, their union and their
+    joints are found with OpenCV's bitwise operations, the joints only
+    inside the table boundaries.
+
+    Parameters
+    ----------
+    threshold : object
+        numpy.ndarray representing the thresholded image.
+    regions : list, optional (default: None)
+        List of page regions that may contain tables of the form x,y,w,h
+        where (x, y) -> left-top, w -> width and h -> height
+        in image coordinate space.
+    areas : list, optional (default: None)
+        List of table boundaries of the form x,y,w,h in image
+        coordinate space, which are used instead of the boundaries
+        formed by the lines.
+    line_scale : int, optional (default: 15)
+        Factor by which the page dimensions will be divided to get
+        smallest length of lines that should be detected.
+    iterations : int, optional (default: 0)
+        Number of times for erosion/dilation is applied.
+
+    Returns
+    -------
+    tables : dict
+        Dict with table boundaries as keys and list of intersections
+        in that boundary as their value, see find_joints.
+    vertical_segments : list
+        List of tuples representing vertical lines with coordinates
+        relative to a left-top origin in image coordinate space.
+    horizontal_segments : list
+        List of tuples representing horizontal lines with coordinates
+        relative to a left-top origin in image coordinate space.
+
+    """
+    import cv2
+
+    threshold = threshold.astype(np.uint8, copy=False)
+    elements = {
+        "vertical": cv2.getStructuringElement(
+            cv2.MORPH_RECT, (1, threshold.shape[0] // line_scale)
+        ),
+        "horizontal": cv2.getStructuringElement(
+            cv2.MORPH_RECT, (threshold.shape[1] // line_scale, 1)
+        ),
+    }
+
+    if regions is not None:
+        found = _find_lines_in_regions(threshold, regions, elements, iterations)
+    else:
+        found = {
+            direction: _open_lines(threshold, direction, el, iterations)
+            for direction, el in elements.items()
+        }
+    vertical_mask, vertical_segments = found["vertical"]
+    horizontal_mask, horizontal_segments = found["horizontal"]
+
+    if areas is None:
+        areas = find_contours(vertical_mask, horizontal_mask)
+    tables = find_joints(areas, vertical_mask, horizontal_mask)
+    return tables, vertical_segments, horizontal_segments
+
+
+def _open_lines(threshold, direction, el, iterations, x_offset=0, y_offset=0):
+    """Returns the mask and the lines which are left after opening an
+    image with a structuring element, shifted by an offset.
+    """
+    import cv2
 
     threshold = cv2.erode(threshold, el)
     threshold = cv2.dilate(threshold, el)
-    dmask = cv2.dilate(threshold, el, iterations=iterations)
+    if iterations:
+        dmask = cv2.dilate(threshold, el, iterations=iterations)
+    else:
+        # findContours does not modify its input since OpenCV 3.2
+        dmask = threshold
 
     try:
         _, contours, _ = cv2.findContours(
-            threshold.astype(np.uint8), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
+            threshold.astype(np.uint8, copy=False),
+            cv2.RETR_EXTERNAL,
+            cv2.CHAIN_APPROX_SIMPLE,
         )
     except ValueError:
         # for opencv backward compatibility
         contours, _ = cv2.findContours(
-            threshold.astype(np.uint8), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
+            threshold.astype(np.uint8, copy=False),
+            cv2.RETR_EXTERNAL,
+            cv2.CHAIN_APPROX_SIMPLE,
         )
 
+    lines = []
     for c in contours:
         x, y, w, h = cv2.boundingRect(c)
-        x1, x2 = x, x + w
-        y1, y2 = y, y + h
+        x1, x2 = x_offset + x, x_offset + x + w
+        y1, y2 = y_offset + y, y_offset + y + h
         if direction == "vertical":
             lines.append(((x1 + x2) // 2, y2, (x1 + x2) // 2, y1))
         elif direction == "horizontal":
@@ -133,6 +228,78 @@ def find_lines(
     return dmask, lines
 
 
+def _region_crops(regions, shape, margin):
+    """Returns the parts of the page, of the form x1,y1,x2,y2 in image
+    coordinate space, which contain the regions grown by a margin.
+    Parts which overlap are merged, so that no region is closer than
+    the margin to the border of its part, unless it is a page border.
+    """
+    height, width = shape
+    crops = []
+    for x, y, w, h in regions:
+        crop = (
+            max(x - margin, 0),
+            max(y - margin, 0),
+            min(x + w + margin, width),
+            min(y + h + margin, height),
+        )
+        if crop[0] >= crop[2] or crop[1] >= crop[3]:
+            continue
+        i = 0
+        while i < len(crops):
+            c = crops[i]
+            if crop[0] < c[2] and c[0] < crop[2] and crop[1] < c[3] and c[1] < crop[3]:
+                crop = (
+                    min(crop[0], c[0]),
+                    min(crop[1], c[1]),
+                    max(crop[2], c[2]),
+                    max(crop[3], c[3]),
+                )
+                del crops[i]
+                # the merged part may now overlap a part checked before
+                i = 0
+            else:
+                i += 1
+        crops.append(crop)
+    return crops
+
+
+def _find_lines_in_regions(threshold, regions, elements, iterations):
+    """Finds lines like find_lines does on a page masked with the
+    regions, but only transforms the parts of the page around them.
+
+    The parts are grown by the reach of the erosion and dilations,
+    so that the lines and the masks are the same as on the whole page.
+    Returns a dict of the mask and the lines of each direction in
+    elements, a dict of the structuring element of each direction.
+    """
+    margin = max(max(el.shape) for el in elements.values()) * (iterations + 1)
+    found = {
+        direction: (np.zeros(threshold.shape, dtype=np.uint8), [])
+        for direction in elements
+    }
+
+    for x1, y1, x2, y2 in _region_crops(regions, threshold.shape, margin):
+        roi = np.zeros((y2 - y1, x2 - x1), dtype=np.uint8)
+        for x, y, w, h in regions:
+            rx1, ry1 = max(x, x1), max(y, y1)
+            rx2, ry2 = min(x + w, x2), min(y + h, y2)
+            if rx1 < rx2 and ry1 < ry2:
+                roi[ry1 - y1 : ry2 - y1, rx1 - x1 : rx2 - x1] = threshold[
+                    ry1:ry2, rx1:rx2
+                ]
+
+        for direction, el in elements.items():
+            dmask, lines = found[direction]
+            roi_dmask, roi_lines = _open_lines(
+                roi, direction, el, iterations, x_offset=x1, y_offset=y1
+            )
+            dmask[y1:y2, x1:x2] = roi_dmask
+            lines.extend(roi_lines)
+
+    return found
+
+
 def find_contours(vertical, horizontal):
     """Finds table boundaries using OpenCV's findContours.
 
@@ -151,16 +318,21 @@ def find_contours(vertical, horizontal):
         h -> height in image coordinate space.
 
     """
-    mask = vertical + horizontal
+    import cv2
+
+    if vertical.dtype == horizontal.dtype == np.uint8:
+        mask = cv2.bitwise_or(vertical, horizontal)
+    else:
+        mask = (vertical + horizontal).astype(np.uint8)
 
     try:
         __, contours, __ = cv2.findContours(
-            mask.astype(np.uint8), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
+            mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
         )
     except ValueError:
         # for opencv backward compatibility
         contours, __ = cv2.findContours(
-            mask.astype(np.uint8), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
+            mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
         )
     # sort in reverse based on contour area and use first 10 contours
     contours = sorted(contours, key=cv2.contourArea, reverse=True)[:10]
@@ -196,19 +368,34 @@ def find_joints(contours, vertical, horizontal):
         and (x2, y2) -> rt in image coordinate space.
 
     """
-    joints = np.multiply(vertical, horizontal)
+    import cv2
+
+    uint8 = vertical.dtype == horizontal.dtype == np.uint8
+    if not uint8:
+        joints = np.multiply(vertical, horizontal)
     tables = {}
     for c in contours:
         x, y, w, h = c
-        roi = joints[y : y + h, x : x + w]
+        if uint8:
+            # uint8 masks are joined inside the boundary only
+            roi = vertical[y : y + h, x : x + w]
+            if roi.size == 0:
+                continue
+            roi = cv2.bitwise_and(roi, horizontal[y : y + h, x : x + w])
+        else:
+            roi = joints[y : y + h, x : x + w]
         try:
             __, jc, __ = cv2.findContours(
-                roi.astype(np.uint8), cv2.RETR_CCOMP, cv2.CHAIN_APPROX_SIMPLE
+                roi.astype(np.uint8, copy=False),
+                cv2.RETR_CCOMP,
+                cv2.CHAIN_APPROX_SIMPLE,
             )
         except ValueError:
             # for opencv backward compatibility
             jc, __ = cv2.findContours(
-                roi.astype(np.uint8), cv2.RETR_CCOMP, cv2.CHAIN_APPROX_SIMPLE
+                roi.astype(np.uint8, copy=False),
+                cv2.RETR_CCOMP,
+                cv2.CHAIN_APPROX_SIMPLE,
             )
         if len(jc) <= 4:  # remove contours with less than 4 joints
             continue
@@ -1,16 +1,71 @@
 # -*- coding: utf-8 -*-
 
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib.patches as patches
-except ImportError:
-    _HAS_MPL = False
-else:
-    _HAS_MPL = True
+
+def _matplotlib():
+    """Imports matplotlib when a plot is generated, so that
+    importing xtable does not load it.
+
+    Returns
+    -------
+    plt : module
+        matplotlib.pyplot
+    patches : module
+        matplotlib.patches
+
+    """
+    try:
+        import matplotlib.pyplot as plt
+        import matplotlib.patches as patches
+    except ImportError:
+        raise ImportError("matplotlib is required for plotting.")
+    return plt, patches
+
+
+def _with_artifacts(table, password=None):
+    """Returns the table if it kept the text, image, line segments
+    and text edges of its page, otherwise extracts it again from its
+    source page with keep_artifacts=True.
+
+    Parameters
+    ----------
+    table : xtable.core.Table
+    password : str, optional (default: None)
+        Password for decryption of the source PDF, which is not
+        kept on the table.
+
+    Returns
+    -------
+    table : xtable.core.Table
+        A table with plotting artifacts.
+
+    """
+    if table._text is not None:
+        return table
+    if table._source is None:
+        raise ValueError(
+            "Table has no plotting artifacts, extract it with keep_artifacts=True"
+        )
+
+    from ..io import read_pdf
+
+    filepath, page, layout_kwargs, kwargs = table._source
+    tables = read_pdf(
+        filepath,
+        pages=str(page),
+        password=password,
+        flavor=table.flavor,
+        suppress_stdout=True,
+        layout_kwargs=layout_kwargs,
+        **dict(kwargs, keep_artifacts=True),
+    )
+    for t in tables:
+        if t.order == table.order:
+            return t
+    raise ValueError(f"Table {table.order} not found on page {page} of {filepath}")
 
 
 class PlotMethods(object):
-    def __call__(self, table, kind="text", filename=None):
+    def __call__(self, table, kind="text", filename=None, password=None):
         """Plot elements found on PDF page based on kind
         specified, useful for debugging and playing with different
         parameters to get the best output.
@@ -24,14 +79,17 @@ class PlotMethods(object):
             The element type for which a plot should be generated.
         filepath: str, optional (default: None)
             Absolute path for saving the generated plot.
+        password : str, optional (default: None)
+            Password for decryption of the PDF, needed when the
+            plotting artifacts of a table from an encrypted PDF
+            have to be recomputed.
 
         Returns
         -------
         fig : matplotlib.fig.Figure
 
         """
-        if not _HAS_MPL:
-            raise ImportError("matplotlib is required for plotting.")
+        _matplotlib()
 
         if table.flavor == "lattice" and kind in ["textedge"]:
             raise NotImplementedError(f"Lattice flavor does not support kind='{kind}'")
@@ -39,7 +97,10 @@ class PlotMethods(object):
             raise NotImplementedError(f"Stream flavor does not support kind='{kind}'")
 
         plot_method = getattr(self, kind)
-        fig = plot_method(table)
+        if kind == "grid":
+            fig = plot_method(table)
+        else:
+            fig = plot_method(table, password=password)
 
         if filename is not None:
             fig.savefig(filename)
@@ -47,19 +108,23 @@ class PlotMethods(object):
 
         return fig
 
-    def text(self, table):
+    def text(self, table, password=None):
         """Generates a plot for all text elements present
         on the PDF page.
 
         Parameters
         ----------
         table : xtable.core.Table
+        password : str, optional (default: None)
+            Password for decryption of the PDF.
 
         Returns
         -------
         fig : matplotlib.fig.Figure
 
         """
+        plt, patches = _matplotlib()
+        table = _with_artifacts(table, password=password)
         fig = plt.figure()
         ax = fig.add_subplot(111, aspect="equal")
         xs, ys = [], []
@@ -84,6 +149,7 @@ class PlotMethods(object):
         fig : matplotlib.fig.Figure
 
         """
+        plt, _ = _matplotlib()
         fig = plt.figure()
         ax = fig.add_subplot(111, aspect="equal")
         for row in table.cells:
@@ -98,19 +164,23 @@ class PlotMethods(object):
                     ax.plot([cell.lb[0], cell.rb[0]], [cell.lb[1], cell.rb[1]])
         return fig
 
-    def contour(self, table):
+    def contour(self, table, password=None):
         """Generates a plot for all table boundaries present
         on the PDF page.
 
         Parameters
         ----------
         table : xtable.core.Table
+        password : str, optional (default: None)
+            Password for decryption of the PDF.
 
         Returns
         -------
         fig : matplotlib.fig.Figure
 
         """
+        plt, patches = _matplotlib()
+        table = _with_artifacts(table, password=password)
         try:
             img, table_bbox = table._image
             _FOR_LATTICE = True
@@ -144,21 +214,25 @@ class PlotMethods(object):
                 ax.set_ylim(min(ys) - 10, max(ys) + 10)
 
         if _FOR_LATTICE:
-            ax.imshow(img)
+            ax.imshow(img, cmap="gray" if img.ndim == 2 else None)
         return fig
 
-    def textedge(self, table):
+    def textedge(self, table, password=None):
         """Generates a plot for relevant textedges.
 
         Parameters
         ----------
         table : xtable.core.Table
+        password : str, optional (default: None)
+            Password for decryption of the PDF.
 
         Returns
         -------
         fig : matplotlib.fig.Figure
 
         """
+        plt, patches = _matplotlib()
+        table = _with_artifacts(table, password=password)
         fig = plt.figure()
         ax = fig.add_subplot(111, aspect="equal")
         xs, ys = [], []
@@ -176,19 +250,23 @@ class PlotMethods(object):
 
         return fig
 
-    def joint(self, table):
+    def joint(self, table, password=None):
         """Generates a plot for all line intersections present
         on the PDF page.
 
         Parameters
         ----------
         table : xtable.core.Table
+        password : str, optional (default: None)
+            Password for decryption of the PDF.
 
         Returns
         -------
         fig : matplotlib.fig.Figure
 
         """
+        plt, _ = _matplotlib()
+        table = _with_artifacts(table, password=password)
         img, table_bbox = table._image
         fig = plt.figure()
         ax = fig.add_subplot(111, aspect="equal")
@@ -199,22 +277,26 @@ class PlotMethods(object):
                 x_coord.append(coord[0])
                 y_coord.append(coord[1])
         ax.plot(x_coord, y_coord, "ro")
-        ax.imshow(img)
+        ax.imshow(img, cmap="gray" if img.ndim == 2 else None)
         return fig
 
-    def line(self, table):
+    def line(self, table, password=None):
         """Generates a plot for all line segments present
         on the PDF page.
 
         Parameters
         ----------
         table : xtable.core.Table
+        password : str, optional (default: None)
+            Password for decryption of the PDF.
 
         Returns
         -------
         fig : matplotlib.fig.Figure
 
         """
+        plt, _ = _matplotlib()
+        table = _with_artifacts(table, password=password)
         fig = plt.figure()
         ax = fig.add_subplot(111, aspect="equal")
         vertical, horizontal = table._segments
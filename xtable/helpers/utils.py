@@ -339,7 +339,7 @@ def segments_in_bbox(bbox, v_segments, h_segments):
     return v_s, h_s
 
 
-def text_in_bbox(bbox, text):
+def text_in_bbox(bbox, text, bboxes=None):
     """Returns all text objects present inside a bounding box.
 
     Parameters
@@ -349,6 +349,9 @@ def text_in_bbox(bbox, text):
         (x1, y1) -> lb and (x2, y2) -> rt in the PDF coordinate
         space.
     text : List of PDFMiner text objects.
+    bboxes : np.ndarray, optional (default: None)
+        Array of shape (n, 4) with the (x0, y0, x1, y1) coordinates
+        of text, see LayoutIndex.get_bboxes. Computed if not given.
 
     Returns
     -------
@@ -356,31 +359,91 @@ def text_in_bbox(bbox, text):
         List of PDFMiner text objects that lie inside table, discarding the overlapping ones
 
     """
+    if bboxes is None:
+        bboxes = np.array(
+            [(t.x0, t.y0, t.x1, t.y1) for t in text], dtype=float
+        ).reshape(len(text), 4)
     lb = (bbox[0], bbox[1])
     rt = (bbox[2], bbox[3])
-    t_bbox = [
-        t
-        for t in text
-        if lb[0] - 2 <= (t.x0 + t.x1) / 2.0 <= rt[0] + 2
-        and lb[1] - 2 <= (t.y0 + t.y1) / 2.0 <= rt[1] + 2
-    ]
+    xc = (bboxes[:, 0] + bboxes[:, 2]) / 2.0
+    yc = (bboxes[:, 1] + bboxes[:, 3]) / 2.0
+    inside = np.flatnonzero(
+        (lb[0] - 2 <= xc) & (xc <= rt[0] + 2) & (lb[1] - 2 <= yc) & (yc <= rt[1] + 2)
+    )
+    t_bbox = [text[i] for i in inside]
 
     # Avoid duplicate text by discarding overlapping boxes
-    rest = {t for t in t_bbox}
-    for ba in t_bbox:
-        for bb in rest.copy():
-            if ba == bb:
-                continue
-            if bbox_intersect(ba, bb):
-                # if the intersection is larger than 80% of ba's size, we keep the longest
-                if (bbox_area(ba)==0) or ((bbox_intersection_area(ba, bb) / bbox_area(ba)) > 0.8):
-                    if bbox_longer(bb, ba):
-                        rest.discard(ba)
-    unique_boxes = list(rest)
+    keep = _discard_overlapping(bboxes[inside])
+    unique_boxes = [t for t, k in zip(t_bbox, keep) if k]
 
     return unique_boxes
 
 
+def _discard_overlapping(bboxes):
+    """Returns a mask of the boxes to keep after discarding each box
+    which overlaps a kept box by more than 80% of its own area and is
+    not longer than it, like the pairwise loop this replaces.
+
+    Only the pairs of boxes which overlap vertically are compared;
+    they are found with a sweep over the boxes sorted by y0, so the
+    cost is O(n log n) plus the number of such pairs.
+
+    Parameters
+    ----------
+    bboxes : np.ndarray
+        Array of shape (n, 4) with (x0, y0, x1, y1) rows.
+
+    Returns
+    -------
+    keep : np.ndarray
+        Boolean array of shape (n,).
+
+    """
+    n = len(bboxes)
+    keep = np.ones(n, dtype=bool)
+    if n < 2:
+        return keep
+    x0, y0, x1, y1 = bboxes.T
+
+    # pairs (a, b) with y0[a] <= y0[b] <= y1[a], b after a in y0 order
+    order = np.argsort(y0, kind="stable")
+    y0_sorted = y0[order]
+    stop = np.searchsorted(y0_sorted, y1[order], side="right")
+    count = np.maximum(stop - np.arange(n) - 1, 0)
+    if not count.any():
+        return keep
+    first = np.repeat(np.arange(n), count)
+    offset = np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+    a = order[first]
+    b = order[first + 1 + offset]
+
+    # the rest of bbox_intersect
+    hit = (x1[a] >= x0[b]) & (x1[b] >= x0[a]) & (y1[b] >= y0[a])
+    a, b = a[hit], b[hit]
+    # compare both directions of each overlapping pair
+    a, b = np.concatenate([a, b]), np.concatenate([b, a])
+
+    width = x1 - x0
+    area = width * (y1 - y0)
+    inter = (np.minimum(x1[a], x1[b]) - np.maximum(x0[a], x0[b])) * (
+        np.minimum(y1[a], y1[b]) - np.maximum(y0[a], y0[b])
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        covered = (area[a] == 0) | (inter / area[a] > 0.8)
+    # a is discarded by b if b is longer or equal
+    discard = covered & (width[b] >= width[a])
+    a, b = a[discard], b[discard]
+
+    # boxes are visited in order and a box discarded earlier no
+    # longer discards the ones after it
+    pairs = np.lexsort((b, a))
+    a, b = a[pairs].tolist(), b[pairs].tolist()
+    for i, j in zip(a, b):
+        if keep[i] and (keep[j] or j > i):
+            keep[i] = False
+    return keep
+
+
 def bbox_intersection_area(ba, bb) -> float:
     """Returns area of the intersection of the bounding boxes of two PDFMiner objects.
 
@@ -720,66 +783,147 @@ def get_table_index(
         +-------+
 
     """
-    r_idx, c_idx = [-1] * 2
-    for r in range(len(table.rows)):
-        if (t.y0 + t.y1) / 2.0 < table.rows[r][0] and (t.y0 + t.y1) / 2.0 > table.rows[
-            r
-        ][1]:
-            lt_col_overlap = []
-            for c in table.cols:
-                if c[0] <= t.x1 and c[1] >= t.x0:
-                    left = t.x0 if c[0] <= t.x0 else c[0]
-                    right = t.x1 if c[1] >= t.x1 else c[1]
-                    lt_col_overlap.append(abs(left - right) / abs(c[0] - c[1]))
-                else:
-                    lt_col_overlap.append(-1)
-            if len(list(filter(lambda x: x != -1, lt_col_overlap))) == 0:
-                text = t.get_text().strip("\n")
-                text_range = (t.x0, t.x1)
-                col_range = (table.cols[0][0], table.cols[-1][1])
-                warnings.warn(
-                    f"{text} {text_range} does not lie in column range {col_range}"
-                )
-            r_idx = r
-            c_idx = lt_col_overlap.index(max(lt_col_overlap))
-            break
-
-    # error calculation
-    y0_offset, y1_offset, x0_offset, x1_offset = [0] * 4
-    if t.y0 > table.rows[r_idx][0]:
-        y0_offset = abs(t.y0 - table.rows[r_idx][0])
-    if t.y1 < table.rows[r_idx][1]:
-        y1_offset = abs(t.y1 - table.rows[r_idx][1])
-    if t.x0 < table.cols[c_idx][0]:
-        x0_offset = abs(t.x0 - table.cols[c_idx][0])
-    if t.x1 > table.cols[c_idx][1]:
-        x1_offset = abs(t.x1 - table.cols[c_idx][1])
-    X = 1.0 if abs(t.x0 - t.x1) == 0.0 else abs(t.x0 - t.x1)
-    Y = 1.0 if abs(t.y0 - t.y1) == 0.0 else abs(t.y0 - t.y1)
+    return get_table_indices(
+        table,
+        [t],
+        direction,
+        split_text=split_text,
+        flag_size=flag_size,
+        strip_text=strip_text,
+    )[0]
+
+
+def get_cell_indices(rows, cols, bboxes):
+    """Assigns bounding boxes to table cells. Each box goes to the
+    first row which contains its vertical center and to the column it
+    overlaps the most, relative to the column width.
+
+    Parameters
+    ----------
+    rows : np.ndarray
+        Array of shape (n_rows, 2) with (top, bottom) rows.
+    cols : np.ndarray
+        Array of shape (n_cols, 2) with (left, right) columns.
+    bboxes : np.ndarray
+        Array of shape (n, 4) with (x0, y0, x1, y1) rows.
+
+    Returns
+    -------
+    r_idx : np.ndarray
+        Row indices, -1 if a box lies in no row.
+    c_idx : np.ndarray
+        Column indices, -1 if a box lies in no row.
+    errors : np.ndarray
+        Assignment errors, see get_table_index.
+    outside : np.ndarray
+        Boolean mask of the boxes which lie in a row but overlap
+        no column.
+
+    """
+    x0, y0, x1, y1 = (bboxes[:, i, None] for i in range(4))
+    r_top, r_bottom = rows[:, 0], rows[:, 1]
+    c_left, c_right = cols[:, 0], cols[:, 1]
+
+    yc = (y0 + y1) / 2.0
+    if np.all(r_top >= r_bottom) and np.all(r_bottom[:-1] >= r_top[1:]):
+        # rows are ordered top to bottom and do not overlap, only the
+        # first row whose bottom lies below the center can contain it
+        yc = yc[:, 0]
+        r_idx = np.searchsorted(-r_bottom, -yc, side="right")
+        r_idx[r_idx == len(rows)] = -1
+        found = (r_idx != -1) & (yc < r_top[r_idx]) & (yc > r_bottom[r_idx])
+        r_idx[~found] = -1
+    else:
+        in_row = (yc < r_top) & (yc > r_bottom)
+        found = in_row.any(axis=1)
+        r_idx = np.where(found, in_row.argmax(axis=1), -1)
+
+    overlaps = (c_left <= x1) & (c_right >= x0)
+    left = np.where(c_left <= x0, x0, c_left)
+    right = np.where(c_right >= x1, x1, c_right)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lt_col_overlap = np.where(
+            overlaps, np.abs(left - right) / np.abs(c_left - c_right), -1
+        )
+    c_idx = np.where(found, lt_col_overlap.argmax(axis=1), -1)
+    outside = found & ~overlaps.any(axis=1)
+
+    # error calculation, boxes in no row are measured against the
+    # last row and column
+    x0, y0, x1, y1 = bboxes.T
+    r_top, r_bottom = r_top[r_idx], r_bottom[r_idx]
+    c_left, c_right = c_left[c_idx], c_right[c_idx]
+    y0_offset = np.where(y0 > r_top, np.abs(y0 - r_top), 0)
+    y1_offset = np.where(y1 < r_bottom, np.abs(y1 - r_bottom), 0)
+    x0_offset = np.where(x0 < c_left, np.abs(x0 - c_left), 0)
+    x1_offset = np.where(x1 > c_right, np.abs(x1 - c_right), 0)
+    X = np.abs(x0 - x1)
+    X[X == 0.0] = 1.0
+    Y = np.abs(y0 - y1)
+    Y[Y == 0.0] = 1.0
     charea = X * Y
-    error = ((X * (y0_offset + y1_offset)) + (Y * (x0_offset + x1_offset))) / charea
+    errors = ((X * (y0_offset + y1_offset)) + (Y * (x0_offset + x1_offset))) / charea
+    return r_idx, c_idx, errors, outside
+
+
+def get_table_indices(
+    table, text, direction, split_text=False, flag_size=False, strip_text=""
+):
+    """Gets indices of the table cells where given text objects lie,
+    like get_table_index, but for all text objects of a table at once
+    using get_cell_indices.
+
+    Parameters
+    ----------
+    table : xtable.core.Table
+    text : list
+        List of PDFMiner LTTextLine objects.
+    direction : string
+        Direction of the PDFMiner LTTextLine objects.
+    split_text : bool, optional (default: False)
+        Whether or not to split a text line if it spans across
+        multiple cells.
+    flag_size : bool, optional (default: False)
+        Whether or not to highlight a substring using <s></s>
+        if its size is different from rest of the string. (Useful for
+        super and subscripts)
+    strip_text : str, optional (default: '')
+        Characters that should be stripped from a string before
+        assigning it to a cell.
 
-    if split_text:
-        return (
-            split_textline(
+    Returns
+    -------
+    assignments : list
+        List of (indices, error) tuples, one per text object, as
+        returned by get_table_index.
+
+    """
+    if not text:
+        return []
+    r_idx, c_idx, errors, outside = get_cell_indices(
+        np.array(table.rows, dtype=float).reshape(-1, 2),
+        np.array(table.cols, dtype=float).reshape(-1, 2),
+        np.array([(t.x0, t.y0, t.x1, t.y1) for t in text], dtype=float),
+    )
+    for i in np.flatnonzero(outside):
+        t = text[i]
+        t_text = t.get_text().strip("\n")
+        text_range = (t.x0, t.x1)
+        col_range = (table.cols[0][0], table.cols[-1][1])
+        warnings.warn(f"{t_text} {text_range} does not lie in column range {col_range}")
+
+    assignments = []
+    for t, r, c, error in zip(text, r_idx.tolist(), c_idx.tolist(), errors.tolist()):
+        if split_text:
+            indices = split_textline(
                 table, t, direction, flag_size=flag_size, strip_text=strip_text
-            ),
-            error,
-        )
-    else:
-        if flag_size:
-            return (
-                [
-                    (
-                        r_idx,
-                        c_idx,
-                        flag_font_size(t._objs, direction, strip_text=strip_text),
-                    )
-                ],
-                error,
             )
+        elif flag_size:
+            indices = [(r, c, flag_font_size(t._objs, direction, strip_text=strip_text))]
         else:
-            return [(r_idx, c_idx, text_strip(t.get_text(), strip_text))], error
+            indices = [(r, c, text_strip(t.get_text(), strip_text))]
+        assignments.append((indices, error))
+    return assignments
 
 
 def compute_accuracy(error_weights):
@@ -877,27 +1021,75 @@ def get_page_layout(
             raise PDFTextExtractionNotAllowed(
                 f"Text extraction is not allowed: {filename}"
             )
-        laparams = LAParams(
-            line_overlap=line_overlap,
-            char_margin=char_margin,
-            line_margin=line_margin,
-            word_margin=word_margin,
-            boxes_flow=boxes_flow,
-            detect_vertical=detect_vertical,
-            all_texts=all_texts,
-        )
-        rsrcmgr = PDFResourceManager()
-        device = PDFPageAggregator(rsrcmgr, laparams=laparams)
-        interpreter = PDFPageInterpreter(rsrcmgr, device)
         for page in PDFPage.create_pages(document):
-            interpreter.process_page(page)
-            layout = device.get_result()
-            width = layout.bbox[2]
-            height = layout.bbox[3]
-            dim = (width, height)
+            layout, dim = get_pdfpage_layout(
+                page,
+                line_overlap=line_overlap,
+                char_margin=char_margin,
+                line_margin=line_margin,
+                word_margin=word_margin,
+                boxes_flow=boxes_flow,
+                detect_vertical=detect_vertical,
+                all_texts=all_texts,
+            )
         return layout, dim
 
 
+def get_pdfpage_layout(
+    page,
+    line_overlap=0.5,
+    char_margin=1.0,
+    line_margin=0.5,
+    word_margin=0.1,
+    boxes_flow=0.5,
+    detect_vertical=True,
+    all_texts=True,
+):
+    """Returns a PDFMiner LTPage object and page dimension of an
+    already parsed PDFMiner PDFPage, without reading anything from
+    disk. To get the definitions of kwargs, see
+    https://pdfminersix.rtfd.io/en/latest/reference/composable.html.
+
+    Parameters
+    ----------
+    page : object
+        PDFMiner PDFPage object.
+    line_overlap : float
+    char_margin : float
+    line_margin : float
+    word_margin : float
+    boxes_flow : float
+    detect_vertical : bool
+    all_texts : bool
+
+    Returns
+    -------
+    layout : object
+        PDFMiner LTPage object.
+    dim : tuple
+        Dimension of pdf page in the form (width, height).
+
+    """
+    laparams = LAParams(
+        line_overlap=line_overlap,
+        char_margin=char_margin,
+        line_margin=line_margin,
+        word_margin=word_margin,
+        boxes_flow=boxes_flow,
+        detect_vertical=detect_vertical,
+        all_texts=all_texts,
+    )
+    rsrcmgr = PDFResourceManager()
+    device = PDFPageAggregator(rsrcmgr, laparams=laparams)
+    interpreter = PDFPageInterpreter(rsrcmgr, device)
+    interpreter.process_page(page)
+    layout = device.get_result()
+    width = layout.bbox[2]
+    height = layout.bbox[3]
+    dim = (width, height)
+    return layout, dim
+
+
 def get_text_objects(layout, ltype="char", t=None):
     """Recursively parses pdf layout to get a list of
     PDFMiner text objects.
@@ -932,7 +1124,110 @@ def get_text_objects(layout, ltype="char", t=None):
             if isinstance(obj, LTObject):
                 t.append(obj)
             else:
-                t += get_text_objects(obj, ltype=ltype)
+                get_text_objects(obj, ltype=ltype, t=t)
     except AttributeError:
         pass
     return t
+
+
+class LayoutIndex(object):
+    """Index of the PDFMiner objects on a page, built by walking the
+    layout tree once and bucketing objects by type.
+
+    Parameters
+    ----------
+    layout : object
+        PDFMiner LTPage object.
+
+    Attributes
+    ----------
+    chars : list
+        List of LTChar objects.
+    images : list
+        List of LTImage objects.
+    horizontal_text : list
+        List of LTTextLineHorizontal objects.
+    vertical_text : list
+        List of LTTextLineVertical objects.
+
+    """
+
+    _ltypes = (
+        ("char", LTChar),
+        ("image", LTImage),
+        ("horizontal_text", LTTextLineHorizontal),
+        ("vertical_text", LTTextLineVertical),
+    )
+
+    def __init__(self, layout):
+        self._objects = {ltype: [] for ltype, __ in self._ltypes}
+        self._bboxes = {}
+        stack = [iter(getattr(layout, "_objs", []))]
+        while stack:
+            obj = next(stack[-1], None)
+            if obj is None:
+                stack.pop()
+                continue
+            for ltype, LTObject in self._ltypes:
+                if isinstance(obj, LTObject):
+                    self._objects[ltype].append(obj)
+                    break
+            objs = getattr(obj, "_objs", None)
+            if objs:
+                stack.append(iter(objs))
+
+    @property
+    def chars(self):
+        return self._objects["char"]
+
+    @property
+    def images(self):
+        return self._objects["image"]
+
+    @property
+    def horizontal_text(self):
+        return self._objects["horizontal_text"]
+
+    @property
+    def vertical_text(self):
+        return self._objects["vertical_text"]
+
+    def get_objects(self, ltype="char"):
+        """Returns the list of objects of a type, like get_text_objects.
+
+        Parameters
+        ----------
+        ltype : string
+            Specify 'char', 'image', 'horizontal_text' or 'vertical_text'.
+
+        Returns
+        -------
+        t : list
+            List of PDFMiner objects.
+
+        """
+        return self._objects[ltype]
+
+    def get_bboxes(self, ltype="char"):
+        """Returns the coordinates of the objects of a type as an array
+        with one (x0, y0, x1, y1) row per object, in the same order as
+        get_objects. Arrays are computed once and cached.
+
+        Parameters
+        ----------
+        ltype : string
+            Specify 'char', 'image', 'horizontal_text' or 'vertical_text'.
+
+        Returns
+        -------
+        bboxes : np.ndarray
+            Array of shape (n, 4).
+
+        """
+        if ltype not in self._bboxes:
+            objs = self._objects[ltype]
+            bboxes = np.array(
+                [(o.x0, o.y0, o.x1, o.y1) for o in objs], dtype=float
+            ).reshape(len(objs), 4)
+            self._bboxes[ltype] = bboxes
+        return self._bboxes[ltype]
@@ -13,6 +13,8 @@ def read_pdf(
     flavor="lattice",
     suppress_stdout=False,
     layout_kwargs={},
+    workers=None,
+    cache=None,
     **kwargs
 ):
     """Read PDF and return extracted tables.
@@ -36,6 +38,14 @@ def read_pdf(
         Print all logs and warnings.
     layout_kwargs : dict, optional (default: {})
         A dict of `pdfminer.layout.LAParams <https://github.com/euske/pdfminer/blob/master/pdfminer/layout.py#L33>`_ kwargs.
+    workers : int, optional (default: None)
+        Number of worker processes used to parse pages in parallel.
+        Pages are parsed serially if None or 1.
+    cache : xtable.cache.ExtractionCache or str, optional (default: None)
+        Cache, or path to the directory of a cache, where the tables
+        of each page are looked up before it is parsed, and stored
+        after. Pages with the same content and parser settings, in
+        any PDF, are only parsed once.
     table_areas : list, optional (default: None)
         List of table area strings of the form x1,y1,x2,y2
         where (x1, y1) -> left-top and (x2, y2) -> right-bottom
@@ -51,6 +61,10 @@ def read_pdf(
     strip_text : str, optional (default: '')
         Characters that should be stripped from a string before
         assigning it to a cell.
+    keep_artifacts : bool, optional (default: False)
+        Keep the page image, text and line segments or text edges
+        used to plot each table. Otherwise they are recomputed from
+        the PDF file when the table is plotted.
     row_tol^ : int, optional (default: 2)
         Tolerance parameter used to combine text vertically,
         to generate rows.
@@ -114,6 +128,96 @@ def read_pdf(
             flavor=flavor,
             suppress_stdout=suppress_stdout,
             layout_kwargs=layout_kwargs,
+            workers=workers,
+            cache=cache,
             **kwargs
         )
         return tables
+
+
+def iter_tables(
+    filepath,
+    pages="1",
+    password=None,
+    flavor="lattice",
+    suppress_stdout=False,
+    layout_kwargs={},
+    workers=None,
+    cache=None,
+    **kwargs
+):
+    """Read PDF and yield extracted tables as soon as the page they
+    are on has been parsed, so that tables which have been handled
+    can be dropped instead of being kept in a TableList until all
+    pages are parsed.
+
+    Takes the same arguments as :meth:`read_pdf() <xtable.read_pdf>`.
+
+    Parameters
+    ----------
+    filepath : str
+        Filepath or URL of the PDF file.
+    pages : str, optional (default: '1')
+        Comma-separated page numbers.
+        Example: '1,3,4' or '1,4-end' or 'all'.
+    password : str, optional (default: None)
+        Password for decryption.
+    flavor : str (default: 'lattice')
+        The parsing method to use ('lattice' or 'stream').
+        Lattice is used by default.
+    suppress_stdout : bool, optional (default: True)
+        Print all logs and warnings.
+    layout_kwargs : dict, optional (default: {})
+        A dict of `pdfminer.layout.LAParams <https://github.com/euske/pdfminer/blob/master/pdfminer/layout.py#L33>`_ kwargs.
+    workers : int, optional (default: None)
+        Number of worker processes used to parse pages in parallel.
+        Pages are parsed serially if None or 1.
+    cache : xtable.cache.ExtractionCache or str, optional (default: None)
+        Cache, or path to the directory of a cache, where the tables
+        of each page are looked up before it is parsed, and stored
+        after. Pages with the same content and parser settings, in
+        any PDF, are only parsed once.
+    kwargs : dict
+        See xtable.read_pdf kwargs.
+
+    Yields
+    ------
+    table : xtable.core.Table
+        Tables in page order, and in the order they are found on
+        each page.
+
+    """
+    if flavor not in ["lattice", "stream"]:
+        raise NotImplementedError(
+            "Unknown flavor specified." " Use either 'lattice' or 'stream'"
+        )
+
+    with warnings.catch_warnings():
+        if suppress_stdout:
+            warnings.simplefilter("ignore")
+
+        validate_input(kwargs, flavor=flavor)
+        p = PDFHandler(filepath, pages=pages, password=password)
+        kwargs = remove_extra(kwargs, flavor=flavor)
+        page_tables = p.iter_parse(
+            flavor=flavor,
+            suppress_stdout=suppress_stdout,
+            layout_kwargs=layout_kwargs,
+            workers=workers,
+            cache=cache,
+            **kwargs
+        )
+    return _iter_tables(page_tables, suppress_stdout)
+
+
+def _iter_tables(page_tables, suppress_stdout):
+    """Yields the tables of each page, suppressing warnings only while
+    a page is parsed and not while the caller handles its tables."""
+    while True:
+        with warnings.catch_warnings():
+            if suppress_stdout:
+                warnings.simplefilter("ignore")
+            tables = next(page_tables, None)
+        if tables is None:
+            return
+        yield from sorted(tables)
@@ -2,19 +2,31 @@
 
 import os
 
-from ..helpers.utils import get_page_layout, get_text_objects
+from ..helpers.utils import LayoutIndex, get_page_layout
 
 
 class BaseParser(object):
     """Defines a base parser."""
 
     def _generate_layout(self, filename, layout_kwargs):
-        self.filename = filename
+        if isinstance(filename, (str, os.PathLike)):
+            # path to a single page PDF
+            self.page = None
+            self.filename = os.fspath(filename)
+            self.layout, self.dimensions = get_page_layout(
+                self.filename, **layout_kwargs
+            )
+            self.objects = LayoutIndex(self.layout)
+        else:
+            # page analysed in memory, see xtable.handlers.Page
+            self.page = filename
+            self.filename = self.page.filename
+            self.layout, self.dimensions = self.page.get_layout(layout_kwargs)
+            self.objects = self.page.get_objects(layout_kwargs)
         self.layout_kwargs = layout_kwargs
-        self.layout, self.dimensions = get_page_layout(filename, **layout_kwargs)
-        self.images = get_text_objects(self.layout, ltype="image")
-        self.horizontal_text = get_text_objects(self.layout, ltype="horizontal_text")
-        self.vertical_text = get_text_objects(self.layout, ltype="vertical_text")
+        self.images = self.objects.images
+        self.horizontal_text = self.objects.horizontal_text
+        self.vertical_text = self.objects.vertical_text
         self.pdf_width, self.pdf_height = self.dimensions
         self.rootname, __ = os.path.splitext(self.filename)
         self.imagename = "".join([self.rootname, ".png"])
@@ -7,6 +7,7 @@ import locale
 import logging
 import warnings
 
+import fitz
 import numpy as np
 import pandas as pd
 
@@ -18,15 +19,13 @@ from ..helpers.utils  import (
     segments_in_bbox,
     text_in_bbox,
     merge_close_lines,
-    get_table_index,
+    get_table_indices,
     compute_accuracy,
     compute_whitespace,
 )
 from ..helpers.image_processing import (
     adaptive_threshold,
-    find_lines,
-    find_contours,
-    find_joints,
+    find_lines_and_joints,
 )
 from ..backends.image_conversion import BACKENDS
 
@@ -91,6 +90,14 @@ class Lattice(BaseParser):
         For more information, refer `OpenCV's dilate <https://docs.opencv.org/2.4/modules/imgproc/doc/filtering.html#dilate>`_.
     resolution : int, optional (default: 300)
         Resolution used for PDF to PNG conversion.
+    backend : str or object, optional (default: 'ghostscript')
+        Image conversion backend, one of 'ghostscript', 'poppler' or
+        'pymupdf', or an object which implements a 'convert' method.
+        'pymupdf' renders pages in memory, without writing files.
+    keep_artifacts : bool, optional (default: False)
+        Keep the text, image and line segments of the page on each
+        table for plotting. Otherwise they are recomputed from the
+        source page when the table is plotted.
 
     """
 
@@ -112,6 +119,7 @@ class Lattice(BaseParser):
         iterations=0,
         resolution=300,
         backend="ghostscript",
+        keep_artifacts=False,
         **kwargs,
     ):
         self.table_regions = table_regions
@@ -130,6 +138,7 @@ class Lattice(BaseParser):
         self.iterations = iterations
         self.resolution = resolution
         self.backend = Lattice._get_backend(backend)
+        self.keep_artifacts = keep_artifacts
 
     @staticmethod
     def _get_backend(backend):
@@ -142,7 +151,7 @@ class Lattice(BaseParser):
         if isinstance(backend, str):
             if backend not in BACKENDS.keys():
                 raise NotImplementedError(
-                    f"Unknown backend '{backend}' specified. Please use either 'poppler' or 'ghostscript'."
+                    f"Unknown backend '{backend}' specified. Please use either 'poppler', 'ghostscript' or 'pymupdf'."
                 )
 
             if backend == "ghostscript":
@@ -253,7 +262,7 @@ class Lattice(BaseParser):
             return scaled_areas
 
         self.image, self.threshold = adaptive_threshold(
-            self.imagename,
+            self.imagename if self.pageimage is None else self.pageimage,
             process_background=self.process_background,
             blocksize=self.threshold_blocksize,
             c=self.threshold_constant,
@@ -268,44 +277,20 @@ class Lattice(BaseParser):
         image_scalers = (image_width_scaler, image_height_scaler, self.pdf_height)
         pdf_scalers = (pdf_width_scaler, pdf_height_scaler, image_height)
 
-        if self.table_areas is None:
-            regions = None
-            if self.table_regions is not None:
-                regions = scale_areas(self.table_regions)
-
-            vertical_mask, vertical_segments = find_lines(
-                self.threshold,
-                regions=regions,
-                direction="vertical",
-                line_scale=self.line_scale,
-                iterations=self.iterations,
-            )
-            horizontal_mask, horizontal_segments = find_lines(
-                self.threshold,
-                regions=regions,
-                direction="horizontal",
-                line_scale=self.line_scale,
-                iterations=self.iterations,
-            )
-
-            contours = find_contours(vertical_mask, horizontal_mask)
-            table_bbox = find_joints(contours, vertical_mask, horizontal_mask)
-        else:
-            vertical_mask, vertical_segments = find_lines(
-                self.threshold,
-                direction="vertical",
-                line_scale=self.line_scale,
-                iterations=self.iterations,
-            )
-            horizontal_mask, horizontal_segments = find_lines(
-                self.threshold,
-                direction="horizontal",
-                line_scale=self.line_scale,
-                iterations=self.iterations,
-            )
-
+        regions = None
+        areas = None
+        if self.table_areas is not None:
             areas = scale_areas(self.table_areas)
-            table_bbox = find_joints(areas, vertical_mask, horizontal_mask)
+        elif self.table_regions is not None:
+            regions = scale_areas(self.table_regions)
+
+        table_bbox, vertical_segments, horizontal_segments = find_lines_and_joints(
+            self.threshold,
+            regions=regions,
+            areas=areas,
+            line_scale=self.line_scale,
+            iterations=self.iterations,
+        )
 
         self.table_bbox_unscaled = copy.deepcopy(table_bbox)
 
@@ -319,8 +304,12 @@ class Lattice(BaseParser):
         v_s, h_s = segments_in_bbox(
             tk, self.vertical_segments, self.horizontal_segments
         )
-        t_bbox["horizontal"] = text_in_bbox(tk, self.horizontal_text)
-        t_bbox["vertical"] = text_in_bbox(tk, self.vertical_text)
+        t_bbox["horizontal"] = text_in_bbox(
+            tk, self.horizontal_text, self.objects.get_bboxes("horizontal_text")
+        )
+        t_bbox["vertical"] = text_in_bbox(
+            tk, self.vertical_text, self.objects.get_bboxes("vertical_text")
+        )
 
         t_bbox["horizontal"].sort(key=lambda x: (-x.y0, x.x0))
         t_bbox["vertical"].sort(key=lambda x: (x.x0, -x.y0))
@@ -358,15 +347,14 @@ class Lattice(BaseParser):
         # TODO: have a single list in place of two directional ones?
         # sorted on x-coordinate based on reading order i.e. LTR or RTL
         for direction in ["vertical", "horizontal"]:
-            for t in self.t_bbox[direction]:
-                indices, error = get_table_index(
-                    table,
-                    t,
-                    direction,
-                    split_text=self.split_text,
-                    flag_size=self.flag_size,
-                    strip_text=self.strip_text,
-                )
+            for indices, error in get_table_indices(
+                table,
+                self.t_bbox[direction],
+                direction,
+                split_text=self.split_text,
+                flag_size=self.flag_size,
+                strip_text=self.strip_text,
+            ):
                 if indices[:2] != (-1, -1):
                     pos_errors.append(error)
                     indices = Lattice._reduce_index(
@@ -390,17 +378,43 @@ class Lattice(BaseParser):
         table.order = table_idx + 1
         table.page = int(os.path.basename(self.rootname).replace("page-", ""))
 
-        # for plotting
-        _text = []
-        _text.extend([(t.x0, t.y0, t.x1, t.y1) for t in self.horizontal_text])
-        _text.extend([(t.x0, t.y0, t.x1, t.y1) for t in self.vertical_text])
-        table._text = _text
-        table._image = (self.image, self.table_bbox_unscaled)
-        table._segments = (self.vertical_segments, self.horizontal_segments)
+        # for plotting, recomputed from the source page if not kept
+        table._text = None
+        table._image = None
+        table._segments = None
         table._textedges = None
+        if self.keep_artifacts:
+            _text = []
+            _text.extend([(t.x0, t.y0, t.x1, t.y1) for t in self.horizontal_text])
+            _text.extend([(t.x0, t.y0, t.x1, t.y1) for t in self.vertical_text])
+            table._text = _text
+            table._image = (self.image, self.table_bbox_unscaled)
+            table._segments = (self.vertical_segments, self.horizontal_segments)
 
         return table
 
+    def _rasterize(self):
+        """Renders the page in memory if the backend can, otherwise
+        converts it to an image file.
+        """
+        self.pageimage = None
+        if self.page is not None and self.page.imagename is not None:
+            # rendered ahead by a batch conversion of all pages
+            self.imagename = self.page.imagename
+            return
+        if hasattr(self.backend, "rasterize"):
+            if self.page is not None:
+                page = self.page.get_fitz_page()
+                self.pageimage = self.backend.rasterize(page, self.resolution)
+            else:
+                with fitz.open(self.filename) as doc:
+                    self.pageimage = self.backend.rasterize(doc[0], self.resolution)
+            return
+        if self.page is not None:
+            # image conversion backends need the page as a file
+            self.page.save()
+        self.backend.convert(self.filename, self.imagename)
+
     def extract_tables(self, filename, suppress_stdout=False, layout_kwargs={}):
         self._generate_layout(filename, layout_kwargs)
         if not suppress_stdout:
@@ -418,7 +432,7 @@ class Lattice(BaseParser):
                 )
             return []
 
-        self.backend.convert(self.filename, self.imagename)
+        self._rasterize()
 
         self._generate_table_bbox()
 
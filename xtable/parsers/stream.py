@@ -9,7 +9,7 @@ import pandas as pd
 
 from .base import BaseParser
 from ..core import TextEdges, Table
-from ..helpers.utils import text_in_bbox, get_table_index, compute_accuracy, compute_whitespace
+from ..helpers.utils import text_in_bbox, get_table_indices, compute_accuracy, compute_whitespace
 
 
 logger = logging.getLogger("xtable")
@@ -51,6 +51,10 @@ class Stream(BaseParser):
     column_tol : int, optional (default: 0)
         Tolerance parameter used to combine text horizontally,
         to generate columns.
+    keep_artifacts : bool, optional (default: False)
+        Keep the text and text edges of the page on each table for
+        plotting. Otherwise they are recomputed from the source page
+        when the table is plotted.
 
     """
 
@@ -65,6 +69,7 @@ class Stream(BaseParser):
         edge_tol=50,
         row_tol=2,
         column_tol=0,
+        keep_artifacts=False,
         **kwargs,
     ):
         self.table_regions = table_regions
@@ -77,6 +82,7 @@ class Stream(BaseParser):
         self.edge_tol = edge_tol
         self.row_tol = row_tol
         self.column_tol = column_tol
+        self.keep_artifacts = keep_artifacts
 
     @staticmethod
     def _text_bbox(t_bbox):
@@ -101,6 +107,53 @@ class Stream(BaseParser):
         text_bbox = (xmin, ymin, xmax, ymax)
         return text_bbox
 
+    @staticmethod
+    def _row_bounds(y0, row_tol=2):
+        """Splits text objects, in the order they are given, into
+        rows vertically within a tolerance. A row ends at the first
+        object whose y0 is not close to the y0 of the first object
+        of the row.
+
+        Parameters
+        ----------
+        y0 : np.ndarray
+            y0 coordinates of the text objects.
+        row_tol : int, optional (default: 2)
+
+        Returns
+        -------
+        bounds : np.ndarray
+            Index of the first object of each row, followed by the
+            number of objects. The first row is compared with y=0, so
+            it is empty unless the first objects are close to it.
+
+        """
+        n = len(y0)
+        bounds = [0]
+        row_y = 0
+        pos = 0
+        while pos < n:
+            # look for the end of the row in windows which double in
+            # size, so that a row takes a few array comparisons
+            end = n
+            size = 8
+            while pos < n:
+                y = y0[pos : pos + size]
+                # not np.isclose(row_y, y, atol=row_tol), without its overhead
+                far = ~(np.abs(row_y - y) <= row_tol + 1e-05 * np.abs(y))
+                if far.any():
+                    end = pos + int(far.argmax())
+                    break
+                pos += size
+                size *= 2
+            if end == n:
+                break
+            bounds.append(end)
+            row_y = y0[end]
+            pos = end + 1
+        bounds.append(n)
+        return np.array(bounds)
+
     @staticmethod
     def _group_rows(text, row_tol=2):
         """Groups PDFMiner text objects into rows vertically
@@ -118,22 +171,21 @@ class Stream(BaseParser):
             Two-dimensional list of text objects grouped into rows.
 
         """
-        row_y = 0
-        rows = []
-        temp = []
-
-        for t in text:
-            # is checking for upright necessary?
-            # if t.get_text().strip() and all([obj.upright for obj in t._objs if
-            # type(obj) is LTChar]):
-            if t.get_text().strip():
-                if not np.isclose(row_y, t.y0, atol=row_tol):
-                    rows.append(sorted(temp, key=lambda t: t.x0))
-                    temp = []
-                    row_y = t.y0
-                temp.append(t)
-
-        rows.append(sorted(temp, key=lambda t: t.x0))
+        # is checking for upright necessary?
+        # if t.get_text().strip() and all([obj.upright for obj in t._objs if
+        # type(obj) is LTChar]):
+        text = [t for t in text if t.get_text().strip()]
+        x0 = np.array([t.x0 for t in text], dtype=float)
+        y0 = np.array([t.y0 for t in text], dtype=float)
+
+        bounds = Stream._row_bounds(y0, row_tol=row_tol)
+        # sort each row on x0, objects with the same x0 keep their order
+        row_idx = np.repeat(np.arange(len(bounds) - 1), np.diff(bounds))
+        order = np.lexsort((x0, row_idx)).tolist()
+        rows = [
+            [text[k] for k in order[start:end]]
+            for start, end in zip(bounds[:-1], bounds[1:])
+        ]
         if len(rows) > 1:
             __ = rows.pop(0)  # TODO: hacky
         return rows
@@ -146,7 +198,7 @@ class Stream(BaseParser):
         Parameters
         ----------
         l : list
-            List of column x-coordinate tuples.
+            List of column x-coordinate tuples, sorted, with x0 <= x1.
         column_tol : int, optional (default: 0)
 
         Returns
@@ -155,22 +207,13 @@ class Stream(BaseParser):
             List of merged column x-coordinate tuples.
 
         """
-        merged = []
-        for higher in l:
-            if not merged:
-                merged.append(higher)
-            else:
-                lower = merged[-1]
-                if column_tol >= 0:
-                    if higher[0] <= lower[1] or np.isclose(
-                        higher[0], lower[1], atol=column_tol
-                    ):
-                        upper_bound = max(lower[1], higher[1])
-                        lower_bound = min(lower[0], higher[0])
-                        merged[-1] = (lower_bound, upper_bound)
-                    else:
-                        merged.append(higher)
-                elif column_tol < 0:
+        if column_tol < 0:
+            merged = []
+            for higher in map(tuple, np.asarray(l, dtype=float).tolist()):
+                if not merged:
+                    merged.append(higher)
+                else:
+                    lower = merged[-1]
                     if higher[0] <= lower[1]:
                         if np.isclose(higher[0], lower[1], atol=abs(column_tol)):
                             merged.append(higher)
@@ -180,7 +223,43 @@ class Stream(BaseParser):
                             merged[-1] = (lower_bound, upper_bound)
                     else:
                         merged.append(higher)
-        return merged
+            return merged
+
+        if not len(l):
+            return []
+        x0, x1 = np.asarray(l, dtype=float).reshape(-1, 2).T
+        # as columns are sorted, the right boundary of the merged column
+        # is the largest x1 so far
+        right = np.maximum.accumulate(x1)[:-1]
+        new = ~((x0[1:] <= right) | np.isclose(x0[1:], right, atol=column_tol))
+        starts = np.flatnonzero(np.concatenate(([True], new)))
+        return list(zip(x0[starts].tolist(), np.maximum.reduceat(x1, starts).tolist()))
+
+    @staticmethod
+    def _columns_from_rows(rows_grouped, ncols, column_tol=0):
+        """Merges the x-coordinates of the text objects in rows with
+        ncols objects into column boundaries.
+
+        Parameters
+        ----------
+        rows_grouped : list
+            Two-dimensional list of text objects grouped into rows.
+        ncols : int
+            Number of objects in the rows which are used.
+        column_tol : int, optional (default: 0)
+
+        Returns
+        -------
+        cols : list
+            List of merged column x-coordinate tuples.
+
+        """
+        cols = np.array(
+            [(t.x0, t.x1) for r in rows_grouped if len(r) == ncols for t in r],
+            dtype=float,
+        ).reshape(-1, 2)
+        cols = cols[np.lexsort((cols[:, 1], cols[:, 0]))]
+        return Stream._merge_columns(cols, column_tol=column_tol)
 
     @staticmethod
     def _join_rows(rows_grouped, text_y_max, text_y_min):
@@ -231,10 +310,7 @@ class Stream(BaseParser):
         if text:
             text = Stream._group_rows(text, row_tol=row_tol)
             elements = [len(r) for r in text]
-            new_cols = [
-                (t.x0, t.x1) for r in text if len(r) == max(elements) for t in r
-            ]
-            cols.extend(Stream._merge_columns(sorted(new_cols)))
+            cols.extend(Stream._columns_from_rows(text, max(elements)))
         return cols
 
     @staticmethod
@@ -275,8 +351,9 @@ class Stream(BaseParser):
         vertically.
         """
         # TODO: add support for arabic text #141
-        # sort textlines in reading order
-        textlines.sort(key=lambda x: (-x.y0, x.x0))
+        # sort textlines in reading order, in a copy since the list may
+        # be the page's, which its cached bboxes are aligned to
+        textlines = sorted(textlines, key=lambda x: (-x.y0, x.x0))
         textedges = TextEdges(edge_tol=self.edge_tol)
         # generate left, middle and right textedges
         textedges.generate(textlines)
@@ -304,7 +381,11 @@ class Stream(BaseParser):
                     y1 = float(y1)
                     x2 = float(x2)
                     y2 = float(y2)
-                    region_text = text_in_bbox((x1, y2, x2, y1), self.horizontal_text)
+                    region_text = text_in_bbox(
+                        (x1, y2, x2, y1),
+                        self.horizontal_text,
+                        self.objects.get_bboxes("horizontal_text"),
+                    )
                     hor_text.extend(region_text)
             # find tables based on nurminen's detection algorithm
             table_bbox = self._nurminen_table_detection(hor_text)
@@ -322,8 +403,12 @@ class Stream(BaseParser):
     def _generate_columns_and_rows(self, table_idx, tk):
         # select elements which lie within table_bbox
         t_bbox = {}
-        t_bbox["horizontal"] = text_in_bbox(tk, self.horizontal_text)
-        t_bbox["vertical"] = text_in_bbox(tk, self.vertical_text)
+        t_bbox["horizontal"] = text_in_bbox(
+            tk, self.horizontal_text, self.objects.get_bboxes("horizontal_text")
+        )
+        t_bbox["vertical"] = text_in_bbox(
+            tk, self.vertical_text, self.objects.get_bboxes("vertical_text")
+        )
 
         t_bbox["horizontal"].sort(key=lambda x: (-x.y0, x.x0))
         t_bbox["vertical"].sort(key=lambda x: (x.x0, -x.y0))
@@ -363,29 +448,22 @@ class Stream(BaseParser):
                         ncols = max(set(elements), key=elements.count)
                     else:
                         warnings.warn(f"No tables found in table area {table_idx + 1}")
-                cols = [
-                    (t.x0, t.x1) for r in rows_grouped if len(r) == ncols for t in r
-                ]
-                cols = self._merge_columns(sorted(cols), column_tol=self.column_tol)
-                inner_text = []
-                for i in range(1, len(cols)):
-                    left = cols[i - 1][1]
-                    right = cols[i][0]
-                    inner_text.extend(
-                        [
-                            t
-                            for direction in self.t_bbox
-                            for t in self.t_bbox[direction]
-                            if t.x0 > left and t.x1 < right
-                        ]
-                    )
-                outer_text = [
-                    t
-                    for direction in self.t_bbox
-                    for t in self.t_bbox[direction]
-                    if t.x0 > cols[-1][1] or t.x1 < cols[0][0]
+                cols = self._columns_from_rows(
+                    rows_grouped, ncols, column_tol=self.column_tol
+                )
+                text = [
+                    t for direction in self.t_bbox for t in self.t_bbox[direction]
                 ]
-                inner_text.extend(outer_text)
+                x0 = np.array([t.x0 for t in text], dtype=float)
+                x1 = np.array([t.x1 for t in text], dtype=float)
+                # text which lies between two columns, gap by gap
+                left = np.array([c[1] for c in cols[:-1]], dtype=float)
+                right = np.array([c[0] for c in cols[1:]], dtype=float)
+                between = (x0 > left[:, np.newaxis]) & (x1 < right[:, np.newaxis])
+                inner_text = [text[k] for k in np.nonzero(between)[1]]
+                # text which lies outside all columns
+                outside = (x0 > cols[-1][1]) | (x1 < cols[0][0])
+                inner_text.extend([text[k] for k in np.flatnonzero(outside)])
                 cols = self._add_columns(cols, inner_text, self.row_tol)
                 cols = self._join_columns(cols, text_x_min, text_x_max)
 
@@ -399,15 +477,14 @@ class Stream(BaseParser):
         # TODO: have a single list in place of two directional ones?
         # sorted on x-coordinate based on reading order i.e. LTR or RTL
         for direction in ["vertical", "horizontal"]:
-            for t in self.t_bbox[direction]:
-                indices, error = get_table_index(
-                    table,
-                    t,
-                    direction,
-                    split_text=self.split_text,
-                    flag_size=self.flag_size,
-                    strip_text=self.strip_text,
-                )
+            for indices, error in get_table_indices(
+                table,
+                self.t_bbox[direction],
+                direction,
+                split_text=self.split_text,
+                flag_size=self.flag_size,
+                strip_text=self.strip_text,
+            ):
                 if indices[:2] != (-1, -1):
                     pos_errors.append(error)
                     for r_idx, c_idx, text in indices:
@@ -425,14 +502,17 @@ class Stream(BaseParser):
         table.order = table_idx + 1
         table.page = int(os.path.basename(self.rootname).replace("page-", ""))
 
-        # for plotting
-        _text = []
-        _text.extend([(t.x0, t.y0, t.x1, t.y1) for t in self.horizontal_text])
-        _text.extend([(t.x0, t.y0, t.x1, t.y1) for t in self.vertical_text])
-        table._text = _text
+        # for plotting, recomputed from the source page if not kept
+        table._text = None
         table._image = None
         table._segments = None
-        table._textedges = self.textedges
+        table._textedges = None
+        if self.keep_artifacts:
+            _text = []
+            _text.extend([(t.x0, t.y0, t.x1, t.y1) for t in self.horizontal_text])
+            _text.extend([(t.x0, t.y0, t.x1, t.y1) for t in self.vertical_text])
+            table._text = _text
+            table._textedges = self.textedges
 
         return table
 
@@ -1,73 +1,142 @@
 # -*- coding: utf-8 -*-
-import os
 import pathlib
-from typing import Union
+from typing import List, Union
+
+import numpy as np
 
 from .helpers.img_utils import bboxes_pdf
-from .helpers.pdf_utils import norm_pdf_page, pdf_page2img
-from .detect_func import (
-    detectTable,
-    parameters,
-)
+from .helpers.pdf_utils import norm_pdf_pages, pdf_pages2img
+from .config import parameters
+
+
+def __getattr__(name):
+    # the PyTorch detector is only imported when it is used, so that
+    # engine="onnxruntime" runs without PyTorch
+    if name in ("TableDetector", "detectTable", "export_onnx"):
+        from . import detect_func
+
+        return getattr(detect_func, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def output_yolo(output):
     """Gets the output of yolo model
 
     Args:
-        output (str): output of yolo model in string format
+        output (narray): detections of yolo model, one (x1, y1, x2, y2, conf, cls) row per table
 
     Returns:
-        bboxes (tuple): list of boundaries of table in the pdf page in top-left, right-bottom format
+        bboxes (narray): array of boundaries of table in the image in top-left, right-bottom format,
+        with the confidence and class of each table
     """
-
-    output = output.split("\n")
-    output.remove("")
-
-    bboxes = []
-    for x in output:
-        cleaned_output = x.split(" ")
-        cleaned_output.remove("")
-        cleaned_output = [eval(x) for x in cleaned_output]
-        bboxes.append(cleaned_output)
-
-    return bboxes
+    return np.asarray(output, dtype=float).reshape(-1, 6)
 
 
 def detect_table_regions(
-    pdf_file: Union[pathlib.Path, str], page_number: int, img_size: int = 300
+    pdf_file: Union[pathlib.Path, str],
+    page_number: int = None,
+    img_size: int = None,
+    pages: List[int] = None,
+    batch_size: int = 8,
+    engine: str = "torch",
+    quantized: bool = False,
 ):
-    """Detect the table in pdf page
+    """Detect the table in pdf pages
 
     Args:
         pdf_file (path|str): path to pdf file
-        pg (int): value of pdf page
+        page_number (int): value of pdf page
+        img_size (int): size of the network input. Default is 300 with engine="torch", and
+            the size the ONNX model was exported with for engine="onnxruntime"
+        pages (list): values of pdf pages, detected in batches of batch_size pages instead of page_number
+        batch_size (int): maximum number of pages rendered and run in a forward pass
+            at a time. Default is 8
+        engine (str): "torch" to run the model with PyTorch, or "onnxruntime" to run the model
+            exported by export_onnx with ONNX Runtime on CPU. Default is "torch"
+        quantized (bool): True to run the INT8 model made by quantize.quantize_detector,
+            with engine="onnxruntime". Default is False
 
     Returns:
         pdf_page (object): the pdf page
-        output_DL (string): output of the model in string
-        img_path (path): the path to temporary image
+        output_DL (narray): table bounds in the image, one (x1, y1, x2, y2, conf, cls) row per table
+        img (narray): the image of the pdf page
+        or, if pages is given, an iterator of (pdf_page, output_DL, img) tuples, one per
+        page, which renders and detects the next batch_size pages as it is consumed
     """
-
-    # convert pdf page to img and detect table from img
-    img_path = pdf_file[:-4] + "-" + str(page_number) + ".jpg"
-    pdf_page = norm_pdf_page(pdf_file, page_number)
-    img = pdf_page2img(pdf_file, page_number, save_image=True)
-    opt = parameters(img_path, img_size=img_size)
-    output_detect = detectTable(opt)
-    output_DL = output_yolo(output_detect)
-
-    # Remove temporary files and folders
-    os.remove(img_path)
-    os.rmdir("data/parsing_outputs")
-
-    return pdf_page, output_DL, img
+    if pages is None:
+        return next(
+            detect_table_regions(
+                pdf_file,
+                img_size=img_size,
+                pages=[page_number],
+                batch_size=1,
+                engine=engine,
+                quantized=quantized,
+            )
+        )
+
+    opt = parameters(None, img_size=300 if img_size is None else img_size)
+    if quantized and engine != "onnxruntime":
+        raise ValueError("quantized=True needs engine='onnxruntime'")
+
+    if engine == "torch":
+        from .detect_func import TableDetector
+
+        detector = TableDetector.get(
+            opt.cfg,
+            opt.weights,
+            device=opt.device,
+            img_size=opt.img_size,
+            half=opt.half,
+        )
+    elif engine == "onnxruntime":
+        from .onnx_detect import OnnxTableDetector
+
+        detector = OnnxTableDetector.get(
+            opt.onnx_int8_weights if quantized else opt.onnx_weights
+        )
+        # the ONNX model has the square input size it was exported with
+        if img_size is not None and detector.img_size != (img_size, img_size):
+            raise ValueError(
+                f"The ONNX model takes {detector.img_size} images, export it"
+                f" with export_onnx(..., img_size={img_size})"
+            )
+    else:
+        raise NotImplementedError(
+            f"Unknown engine '{engine}' specified. Please use either 'torch' or 'onnxruntime'."
+        )
+
+    return _detect_pages(detector, opt, pdf_file, pages, batch_size)
+
+
+def _detect_pages(detector, opt, pdf_file, pages, batch_size):
+    """Converts pdf pages to images in memory and detects tables in them,
+    batch_size pages at a time, so that only the images of one batch are
+    held while the pages are detected
+
+    Yields:
+        (pdf_page, output_DL, img) tuple of each page, in the order of pages
+    """
+    for start in range(0, len(pages), batch_size):
+        batch = pages[start : start + batch_size]
+        pdf_pages = norm_pdf_pages(pdf_file, batch)
+        imgs = pdf_pages2img(pdf_file, batch)
+        boxes = detector.detect(
+            imgs,
+            opt.conf_thres,
+            opt.iou_thres,
+            classes=opt.classes,
+            agnostic=opt.agnostic_nms,
+            batch_size=batch_size,
+        )
+        for pdf_page, det, img in zip(pdf_pages, boxes, imgs):
+            yield pdf_page, output_yolo(det), img
 
 
 def convert_table_regions_from_img_to_pdf(table_bounds, img, pdf_page):
     """Convert table bounds in image to table region in pdf page
     Args:
-        table_bounds (list): list of table bounds
+        table_bounds (narray): table bounds in the image, one (x1, y1, x2, y2, conf, cls) row per table
         img (object): image
         pdf_page (object): pdf page
     Returns:
@@ -75,7 +144,7 @@ def convert_table_regions_from_img_to_pdf(table_bounds, img, pdf_page):
     """
     interesting_areas = []
     if len(table_bounds) != 0:
-        for x in table_bounds:
+        for x in output_yolo(table_bounds).tolist():
             # Normalize the output of the model to fit with the size of pdf file
             [x1, y1, x2, y2] = bboxes_pdf(img, pdf_page, x)
             interesting_areas.append([x1, y1, x2, y2])
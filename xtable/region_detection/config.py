@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+import pathlib
+
+import xtable
+
+
+class parameters:
+    """
+    Get configuration parameters
+    """
+
+    def __init__(self, img, img_size):
+        self.cfg = str(
+            pathlib.Path(xtable.__file__).parent
+            / "region_detection"
+            / "models"
+            / "yolov3-tiny_table.cfg"
+        )
+        self.names = str(
+            pathlib.Path(xtable.__file__).parent
+            / "region_detection"
+            / "models"
+            / "table.names"
+        )
+        self.weights = str(
+            pathlib.Path(xtable.__file__).parent
+            / "region_detection"
+            / "models"
+            / "best_v2.weights"
+        )
+        self.onnx_weights = str(
+            pathlib.Path(xtable.__file__).parent
+            / "region_detection"
+            / "models"
+            / "best_v2.onnx"
+        )
+        self.onnx_int8_weights = str(
+            pathlib.Path(xtable.__file__).parent
+            / "region_detection"
+            / "models"
+            / "best_v2-int8.onnx"
+        )
+        self.source = img
+        self.output = "data/parsing_outputs/"
+        self.img_size = img_size
+        self.conf_thres = 0.2
+        self.iou_thres = 0.4
+        self.fourcc = "mp4v"
+        self.half = False
+        self.device = "cpu"
+        self.view_img = False
+        self.save_txt = True
+        self.classes = None
+        self.agnostic_nms = False
@@ -1,62 +1,249 @@
-import xtable
-import pathlib
-
+from .config import parameters
 from .models import *
 from .datasets import *
+from .helpers.img_utils import img_rgb
 from .helpers.utils import *
 
 
-def detectTable(opt):
-    with torch.no_grad():
-        img_size = (
-            (320, 192) if ONNX_EXPORT else opt.img_size
-        )  # (320, 192) or (416, 256) or (608, 352) for (height, width)
-        out, source, weights, half, view_img, save_txt = (
-            opt.output,
-            opt.source,
-            opt.weights,
-            opt.half,
-            opt.view_img,
-            opt.save_txt,
-        )
-        # webcam = source == '0' or source.startswith('rtsp') or source.startswith('http') or source.endswith('.txt')
-        webcam = False
+# table detectors which have been loaded, keyed by (cfg, weights, device, img_size)
+_detectors = {}
+
+
+class TableDetector(object):
+    """Table detector which builds the YOLO model, loads its weights
+    and fuses its Conv2d + BatchNorm2d layers once, and then runs it
+    on any number of images.
+
+    Args:
+        cfg (str): path to the model configuration file
+        weights (str): path to the model weights, in darknet or pytorch format
+        device (str): device the model runs on. Default is "cpu"
+        img_size (int): size of the network input. Default is 416
+        half (bool): True to run in half precision, only supported on CUDA
+        rect (bool): True to letterbox images to the smallest rectangle with
+            sides multiple of 32, False to pad them to a square img_size x img_size
+            like the ONNX model exported by export_onnx. Default is True
+    """
 
-        # Initialize
-        device = torch_utils.select_device(device="cpu" if ONNX_EXPORT else opt.device)
-        if os.path.exists(out):
-            shutil.rmtree(out)  # delete output folder
-        os.makedirs(out)  # make new output folder
+    def __init__(
+        self, cfg, weights, device="cpu", img_size=416, half=False, rect=True
+    ):
+        self.cfg = cfg
+        self.weights = weights
+        self.img_size = img_size
+        self.rect = rect
+        self.device = torch_utils.select_device(device=device)
 
         # Initialize model
-        model = Darknet(opt.cfg, img_size)
+        self.model = Darknet(cfg, img_size)
 
         # Load weights
         attempt_download(weights)
         if weights.endswith(".pt"):  # pytorch format
-            model.load_state_dict(torch.load(weights, map_location=device)["model"])
+            self.model.load_state_dict(
+                torch.load(weights, map_location=self.device)["model"]
+            )
         else:  # darknet format
-            load_darknet_weights(model, weights)
-
-        # Second-stage classifier
-        classify = False
-        if classify:
-            modelc = torch_utils.load_classifier(name="resnet101", n=2)  # initialize
-            modelc.load_state_dict(
-                torch.load("weights/resnet101.pt", map_location=device)["model"]
-            )  # load weights
-            modelc.to(device).eval()
+            load_darknet_weights(self.model, weights)
 
         # Fuse Conv2d + BatchNorm2d layers
-        model.fuse()
-        torch_utils.model_info(model, report="summary")  # 'full' or 'summary'
+        self.model.fuse()
+        torch_utils.model_info(self.model, report="summary")  # 'full' or 'summary'
 
         # Eval mode
-        model.to(device).eval()
+        self.model.to(self.device).eval()
+
+        # Half precision
+        self.half = half and self.device.type != "cpu"
+        if self.half:
+            self.model.half()
+
+    @classmethod
+    def get(cls, cfg, weights, device="cpu", img_size=416, half=False, rect=True):
+        """Gets the table detector for a model, which is only loaded on
+        the first call and shared by the later ones.
+
+        Args:
+            cfg (str): path to the model configuration file
+            weights (str): path to the model weights
+            device (str): device the model runs on. Default is "cpu"
+            img_size (int): size of the network input. Default is 416
+            half (bool): True to run in half precision, only supported on CUDA
+            rect (bool): True to letterbox images to the smallest rectangle,
+                False to pad them to a square. Default is True
+
+        Returns:
+            detector (TableDetector): the loaded table detector
+        """
+        key = (str(cfg), str(weights), device, img_size, half, rect)
+        if key not in _detectors:
+            _detectors[key] = cls(
+                str(cfg),
+                str(weights),
+                device=device,
+                img_size=img_size,
+                half=half,
+                rect=rect,
+            )
+        return _detectors[key]
+
+    def detect(
+        self,
+        images,
+        conf_thres=0.2,
+        iou_thres=0.4,
+        classes=None,
+        agnostic=False,
+        batch_size=1,
+    ):
+        """Detects tables in images, running the network on up to
+        batch_size images at a time
+
+        Args:
+            images (list): list of images as RGB arrays of shape (h, w, 3), or paths to images
+            conf_thres (float): object confidence threshold. Default is 0.2
+            iou_thres (float): IoU threshold of the non-maximum suppression. Default is 0.4
+            classes (list): classes to keep, all of them if None
+            agnostic (bool): True for class-agnostic non-maximum suppression
+            batch_size (int): maximum number of images in a forward pass. Default is 1
+
+        Returns:
+            boxes (list): one array of detections per image, with a row
+            (x1, y1, x2, y2, conf, cls) per table in image pixels
+        """
+        boxes = []
+        with torch.no_grad():
+            for start in range(0, len(images), batch_size):
+                img0s, imgs = [], []
+                for img0 in images[start : start + batch_size]:
+                    img0 = img_rgb(img0)
+                    img0s.append(img0)
+
+                    # Padded resize, to 3x416x416, or to the smallest
+                    # rectangle with sides multiple of 32 if rect
+                    img = letterbox(img0, new_shape=self.img_size, auto=self.rect)[0]
+                    imgs.append(img.transpose(2, 0, 1))
+
+                # Pages of the same size are letterboxed to the same shape,
+                # consecutive images of one shape are stacked into a batch
+                i = 0
+                while i < len(imgs):
+                    j = i + 1
+                    while j < len(imgs) and imgs[j].shape == imgs[i].shape:
+                        j += 1
+                    boxes.extend(
+                        self._detect_batch(
+                            imgs[i:j],
+                            img0s[i:j],
+                            conf_thres,
+                            iou_thres,
+                            classes,
+                            agnostic,
+                        )
+                    )
+                    i = j
+        return boxes
+
+    def _detect_batch(self, imgs, img0s, conf_thres, iou_thres, classes, agnostic):
+        """Runs the network and the non-maximum suppression on a batch
+        of letterboxed images of the same shape"""
+        img = torch.from_numpy(np.ascontiguousarray(np.stack(imgs))).to(self.device)
+        img = img.half() if self.half else img.float()  # uint8 to fp16/32
+        img /= 255.0  # 0 - 255 to 0.0 - 1.0
+
+        # Inference
+        pred = self.model(img)[0].float()
+
+        # Apply NMS
+        pred = non_max_suppression(
+            pred, conf_thres, iou_thres, classes=classes, agnostic=agnostic
+        )
+
+        boxes = []
+        for det, img0 in zip(pred, img0s):
+            if det is None or not len(det):
+                boxes.append(np.zeros((0, 6), dtype=np.float32))
+                continue
 
-        # Export mode
-        if ONNX_EXPORT:
+            # Rescale boxes from img_size to img0 size
+            det[:, :4] = scale_coords(img.shape[2:], det[:, :4], img0.shape).round()
+            boxes.append(det.cpu().numpy())
+        return boxes
+
+
+def export_onnx(cfg, weights, f=None, img_size=416, opset_version=11):
+    """Exports the fused table detection model to ONNX, to run it with
+    engine="onnxruntime" without PyTorch. The graph takes a batch of
+    (3, img_size, img_size) images and gives the same predictions as
+    the model does in TableDetector(img_size=img_size, rect=False). Its
+    height and width are fixed, since the YOLO layers build their grids
+    for one input size.
+
+    Args:
+        cfg (str): path to the model configuration file
+        weights (str): path to the model weights, in darknet or pytorch format
+        f (str): path to the ONNX model, next to the weights if None
+        img_size (int): size of the network input, a multiple of 32. Default is 416
+        opset_version (int): ONNX opset version. Default is 11
+
+    Returns:
+        f (str): path to the ONNX model
+    """
+    if img_size % 32:
+        raise ValueError(f"img_size should be a multiple of 32, got {img_size}")
+    if f is None:
+        f = os.path.splitext(str(weights))[0] + ".onnx"
+    model = TableDetector(str(cfg), str(weights), img_size=img_size).model
+
+    with torch.no_grad():
+        img = torch.zeros((1, 3, img_size, img_size))
+        torch.onnx.export(
+            model,
+            img,
+            f,
+            input_names=["images"],
+            output_names=["pred"],
+            dynamic_axes={"images": {0: "batch"}, "pred": {0: "batch"}},
+            opset_version=opset_version,
+        )
+
+        # Validate exported model
+        import onnx
+
+        onnx.checker.check_model(onnx.load(f))  # Check that the IR is well formed
+        try:
+            import onnxruntime
+        except ImportError:
+            return f
+
+        # Check that the graph predicts the same boxes as the model
+        session = onnxruntime.InferenceSession(f, providers=["CPUExecutionProvider"])
+        img = torch.rand((2, 3, img_size, img_size))
+        pred = session.run(["pred"], {"images": img.numpy()})[0]
+        np.testing.assert_allclose(
+            pred, model(img)[0].numpy(), rtol=1e-3, atol=1e-3
+        )
+    return f
+
+
+def detectTable(opt):
+    if ONNX_EXPORT:
+        with torch.no_grad():
+            img_size = (
+                320,
+                192,
+            )  # (320, 192) or (416, 256) or (608, 352) for (height, width)
+            model = Darknet(opt.cfg, img_size)
+            attempt_download(opt.weights)
+            if opt.weights.endswith(".pt"):  # pytorch format
+                model.load_state_dict(
+                    torch.load(opt.weights, map_location="cpu")["model"]
+                )
+            else:  # darknet format
+                load_darknet_weights(model, opt.weights)
             model.fuse()
+            model.eval()
+
             img = torch.zeros((1, 3) + img_size)  # (1, 3, 320, 192)
             f = opt.weights.replace(
                 opt.weights.split(".")[-1], "onnx"
@@ -73,119 +260,18 @@ def detectTable(opt):
             )  # Print a human readable representation of the graph
             return
 
-        # Half precision
-        half = half and device.type != "cpu"  # half precision only supported on CUDA
-        if half:
-            model.half()
-
-        # Set Dataloader
-        vid_path, vid_writer = None, None
-        if webcam:
-            view_img = True
-            torch.backends.cudnn.benchmark = (
-                True  # set True to speed up constant image size inference
-            )
-            dataset = LoadStreams(source, img_size=img_size)
-        else:
-            save_img = False
-            dataset = LoadImages(source, img_size=img_size)
-
-        # Get names and colors
-        names = load_classes(opt.names)
-        colors = [[random.randint(0, 255) for _ in range(3)] for _ in range(len(names))]
-
-        # Run inference
-        t0 = time.time()
-        results = ""
-        for path, img, im0s, vid_cap in dataset:
-            t = time.time()
-            img = torch.from_numpy(img).to(device)
-            img = img.half() if half else img.float()  # uint8 to fp16/32
-            img /= 255.0  # 0 - 255 to 0.0 - 1.0
-            if img.ndimension() == 3:
-                img = img.unsqueeze(0)
-
-            # Inference
-            pred = model(img)[0].float() if half else model(img)[0]
-
-            # Apply NMS
-            pred = non_max_suppression(
-                pred,
-                opt.conf_thres,
-                opt.iou_thres,
-                classes=opt.classes,
-                agnostic=opt.agnostic_nms,
-            )
+    # The model is loaded once and reused by later calls
+    detector = TableDetector.get(
+        opt.cfg, opt.weights, device=opt.device, img_size=opt.img_size, half=opt.half
+    )
 
-            # Apply Classifier
-            if classify:
-                pred = apply_classifier(pred, modelc, img, im0s)
-
-            # Process detections
-            for i, det in enumerate(pred):  # detections per image
-                if webcam:  # batch_size >= 1
-                    p, s, im0 = path[i], "%g: " % i, im0s[i]
-                else:
-                    p, s, im0 = path, "", im0s
-
-                save_path = str(Path(out) / Path(p).name)
-                s += "%gx%g " % img.shape[2:]  # print string
-                if det is not None and len(det):
-                    # Rescale boxes from img_size to im0 size
-                    det[:, :4] = scale_coords(
-                        img.shape[2:], det[:, :4], im0.shape
-                    ).round()
-
-                    # Print results
-                    for c in det[:, -1].unique():
-                        n = (det[:, -1] == c).sum()  # detections per class
-                        s += "%g %ss, " % (n, names[int(c)])  # add to string
-
-                    # Write results
-                    for *xyxy, conf, cls in det:
-                        if save_txt:  # Write to file
-                            # with open(save_path + '.txt', 'a') as file:
-                            #     file.write(('%g ' * 6 + '\n') % (*xyxy, cls, conf))
-                            results += ("%g " * 6 + "\n") % (*xyxy, cls, conf)
-                        if save_img or view_img:  # Add bbox to image
-                            label = "%s %.2f" % (names[int(cls)], conf)
-                            plot_one_box(xyxy, im0, label=label, color=colors[int(cls)])
-        return results
-
-
-class parameters:
-    """
-    Get configuration parameters
-    """
-
-    def __init__(self, img, img_size):
-        self.cfg = str(
-            pathlib.Path(xtable.__file__).parent
-            / "region_detection"
-            / "models"
-            / "yolov3-tiny_table.cfg"
-        )
-        self.names = str(
-            pathlib.Path(xtable.__file__).parent
-            / "region_detection"
-            / "models"
-            / "table.names"
-        )
-        self.weights = str(
-            pathlib.Path(xtable.__file__).parent
-            / "region_detection"
-            / "models"
-            / "best_v2.weights"
-        )
-        self.source = img
-        self.output = "data/parsing_outputs/"
-        self.img_size = img_size
-        self.conf_thres = 0.2
-        self.iou_thres = 0.4
-        self.fourcc = "mp4v"
-        self.half = False
-        self.device = "cpu"
-        self.view_img = False
-        self.save_txt = True
-        self.classes = None
-        self.agnostic_nms = False
+    # Run inference
+    images = LoadImages(opt.source, img_size=opt.img_size).files
+    boxes = detector.detect(
+        images,
+        opt.conf_thres,
+        opt.iou_thres,
+        classes=opt.classes,
+        agnostic=opt.agnostic_nms,
+    )
+    return np.concatenate([np.zeros((0, 6), dtype=np.float32)] + boxes)
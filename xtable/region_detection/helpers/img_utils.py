@@ -1,3 +1,7 @@
+import cv2
+import numpy as np
+
+
 def img_dim(img, bbox):
     """Get image dimension from bbox"""
     H_img, W_img, _ = img.shape
@@ -82,3 +86,65 @@ def bboxes_img(img, pdf_page, bbox):
     x2, y2 = bbox[2] * (W_img / W_pdf), (1 - (bbox[1] / H_pdf)) * H_img
 
     return [x1, y1, x2, y2, None, None]
+
+
+def letterbox(
+    img,
+    new_shape=(416, 416),
+    color=(128, 128, 128),
+    auto=True,
+    scaleFill=False,
+    scaleup=True,
+    interp=cv2.INTER_AREA,
+):
+    # Resize image to a 32-pixel-multiple rectangle https://github.com/ultralytics/yolov3/issues/232
+    shape = img.shape[:2]  # current shape [height, width]
+    if isinstance(new_shape, int):
+        new_shape = (new_shape, new_shape)
+
+    # Scale ratio (new / old)
+    r = max(new_shape) / max(shape)
+    if not scaleup:  # only scale down, do not scale up (for better test mAP)
+        r = min(r, 1.0)
+
+    # Compute padding
+    ratio = r, r  # width, height ratios
+    new_unpad = int(round(shape[1] * r)), int(round(shape[0] * r))
+    dw, dh = new_shape[1] - new_unpad[0], new_shape[0] - new_unpad[1]  # wh padding
+    if auto:  # minimum rectangle
+        dw, dh = np.mod(dw, 32), np.mod(dh, 32)  # wh padding
+    elif scaleFill:  # stretch
+        dw, dh = 0.0, 0.0
+        new_unpad = new_shape
+        ratio = new_shape[0] / shape[1], new_shape[1] / shape[0]  # width, height ratios
+
+    dw /= 2  # divide padding into 2 sides
+    dh /= 2
+
+    if shape[::-1] != new_unpad:  # resize
+        img = cv2.resize(
+            img, new_unpad, interpolation=interp
+        )  # INTER_AREA is better, INTER_LINEAR is faster
+    top, bottom = int(round(dh - 0.1)), int(round(dh + 0.1))
+    left, right = int(round(dw - 0.1)), int(round(dw + 0.1))
+    img = cv2.copyMakeBorder(
+        img, top, bottom, left, right, cv2.BORDER_CONSTANT, value=color
+    )  # add border
+    return img, ratio, (dw, dh)
+
+
+def img_rgb(img):
+    """Gets an image as a contiguous RGB array
+
+    Args:
+        img (narray|str): image as an RGB or grayscale array, or path to an image file
+    Returns:
+        (narray): the image as a contiguous RGB array of shape (h, w, 3)
+    """
+    if isinstance(img, np.ndarray):
+        if img.ndim == 2:
+            return cv2.cvtColor(img, cv2.COLOR_GRAY2RGB)
+        return np.ascontiguousarray(img)
+    img0 = cv2.imread(str(img))  # BGR
+    assert img0 is not None, "Image Not Found " + str(img)
+    return np.ascontiguousarray(img0[:, :, ::-1])  # BGR to RGB
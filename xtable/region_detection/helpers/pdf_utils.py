@@ -6,8 +6,6 @@ from typing import Union
 
 import fitz
 import numpy as np
-from pdf2image import convert_from_path
-from PyPDF2 import PdfFileReader
 
 
 def norm_pdf_page(pdf_path: Union[pathlib.Path, str], pgno: int):
@@ -18,6 +16,8 @@ def norm_pdf_page(pdf_path: Union[pathlib.Path, str], pgno: int):
     Returns:
         The pdf page object of Pypdf2
     """
+    from PyPDF2 import PdfFileReader
+
     pdf_doc = PdfFileReader(open((pdf_path), "rb"), strict=False)
 
     # get page
@@ -27,6 +27,27 @@ def norm_pdf_page(pdf_path: Union[pathlib.Path, str], pgno: int):
     return pdf_page
 
 
+def norm_pdf_pages(pdf_path: Union[pathlib.Path, str], pages):
+    """Read several Pdf pages with a single reader
+    Args:
+        pdf_path (str): path to pdf file
+        pages (list): page numbers
+    Returns:
+        list of pdf page objects of Pypdf2, one per page in pages
+    """
+    from PyPDF2 import PdfFileReader
+
+    pdf_doc = PdfFileReader(open((pdf_path), "rb"), strict=False)
+
+    pdf_pages = []
+    for pgno in pages:
+        pdf_page = pdf_doc.getPage(pgno - 1)
+        pdf_page.cropBox.upperLeft = (0, list(pdf_page.mediaBox)[-1])
+        pdf_page.cropBox.lowerRight = (list(pdf_page.mediaBox)[-2], 0)
+        pdf_pages.append(pdf_page)
+    return pdf_pages
+
+
 def pdf_page2img(
     pdf_path: Union[pathlib.Path, str],
     pgno: int,
@@ -45,6 +66,8 @@ def pdf_page2img(
     Returns:
         set of image files
     """
+    from pdf2image import convert_from_path
+
     img_page = convert_from_path(
         str(pdf_path),
         first_page=pgno,
@@ -64,6 +87,46 @@ def pdf_page2img(
     return np.array(img_page)
 
 
+def pdf_pages2img(
+    pdf_path: Union[pathlib.Path, str],
+    pages,
+    dpi: int = 300,
+):
+    """Convert several pdf pages to images
+    Each run of consecutive page numbers is rendered by a single conversion
+    call, instead of one call per page.
+    Args:
+        pdf_path (str): path to pdf file
+        pages (list): page numbers
+        dpi (int): dpi value
+
+    Returns:
+        list of images, one per page in pages
+    """
+    from pdf2image import convert_from_path
+
+    imgs = {}
+    wanted = sorted(set(pages))
+    start = 0
+    while start < len(wanted):
+        end = start
+        while end + 1 < len(wanted) and wanted[end + 1] == wanted[end] + 1:
+            end += 1
+        img_pages = convert_from_path(
+            str(pdf_path),
+            first_page=wanted[start],
+            last_page=wanted[end],
+            dpi=dpi,
+            thread_count=multiprocessing.cpu_count(),
+            grayscale=False,
+        )
+        for pgno, img_page in zip(wanted[start : end + 1], img_pages):
+            imgs[pgno] = np.array(img_page)
+        start = end + 1
+
+    return [imgs[pgno] for pgno in pages]
+
+
 def box_convert(page_size, bbox):
     """Convert bbox format from camelot to pdfminer format
 
@@ -3,18 +3,13 @@ from pathlib import Path
 import os, glob, math, random, shutil
 
 import cv2
-import matplotlib
-import matplotlib.pyplot as plt
 
 import torch
 import torch.nn as nn
-import torchvision
 from tqdm import tqdm
 
 from . import torch_utils  # , google_utils
 
-matplotlib.rc("font", **{"size": 11})
-
 # Set print options
 torch.set_printoptions(linewidth=320, precision=5, profile="long")
 np.set_printoptions(
@@ -717,6 +712,8 @@ def non_max_suppression(
     """
     # NMS methods https://github.com/ultralytics/yolov3/issues/679 'or', 'and', 'merge', 'vision', 'vision_batch'
 
+    import torchvision
+
     # Box constraints
     min_wh, max_wh = 2, 4096  # (pixels) minimum and maximum box width and height
 
@@ -1215,8 +1212,18 @@ def plot_one_box(x, img, color=None, label=None, line_thickness=None):
         )
 
 
+def _pyplot():
+    # matplotlib is only imported by the plots of training results
+    import matplotlib
+    import matplotlib.pyplot as plt
+
+    matplotlib.rc("font", **{"size": 11})
+    return plt
+
+
 def plot_wh_methods():  # from utils.utils import *; plot_wh_methods()
     # Compares the two methods for width-height anchor multiplication
+    plt = _pyplot()
     # https://github.com/ultralytics/yolov3/issues/168
     x = np.arange(-4.0, 4.0, 0.1)
     ya = np.exp(x)
@@ -1237,6 +1244,7 @@ def plot_wh_methods():  # from utils.utils import *; plot_wh_methods()
 
 def plot_images(imgs, targets, paths=None, fname="images.png"):
     # Plots training images overlaid with targets
+    plt = _pyplot()
     imgs = imgs.cpu().numpy()
     targets = targets.cpu().numpy()
     # targets = targets[targets[:, 1] == 21]  # plot only one class
@@ -1265,6 +1273,7 @@ def plot_images(imgs, targets, paths=None, fname="images.png"):
 
 def plot_test_txt():  # from utils.utils import *; plot_test()
     # Plot test.txt histograms
+    plt = _pyplot()
     x = np.loadtxt("test.txt", dtype=np.float32)
     box = xyxy2xywh(x[:, :4])
     cx, cy = box[:, 0], box[:, 1]
@@ -1284,6 +1293,7 @@ def plot_test_txt():  # from utils.utils import *; plot_test()
 
 def plot_targets_txt():  # from utils.utils import *; plot_targets_txt()
     # Plot test.txt histograms
+    plt = _pyplot()
     x = np.loadtxt("targets.txt", dtype=np.float32)
     x = x.T
 
@@ -1302,11 +1312,12 @@ def plot_evolution_results(
     hyp,
 ):  # from utils.utils import *; plot_evolution_results(hyp)
     # Plot hyperparameter evolution results in evolve.txt
+    plt = _pyplot()
     x = np.loadtxt("evolve.txt", ndmin=2)
     f = fitness(x)
     weights = (f - f.min()) ** 2  # for weighted results
     fig = plt.figure(figsize=(12, 10))
-    matplotlib.rc("font", **{"size": 8})
+    plt.rc("font", **{"size": 8})
     for i, (k, v) in enumerate(hyp.items()):
         y = x[:, i + 7]
         # mu = (y * weights).sum() / weights.sum()  # best weighted result
@@ -1324,6 +1335,7 @@ def plot_results_overlay(
     start=0, stop=0
 ):  # from utils.utils import *; plot_results_overlay()
     # Plot training results files 'results*.txt', overlaying train and val losses
+    plt = _pyplot()
     s = [
         "train",
         "train",
@@ -1362,6 +1374,7 @@ def plot_results(
     start=0, stop=0, bucket="", id=()
 ):  # from utils.utils import *; plot_results()
     # Plot training results files 'results*.txt'
+    plt = _pyplot()
     fig, ax = plt.subplots(2, 5, figsize=(12, 6))
     ax = ax.ravel()
     s = [
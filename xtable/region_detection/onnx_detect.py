@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from .helpers.img_utils import img_rgb, letterbox
+
+# table detectors which have been loaded, keyed by (model, providers)
+_detectors = {}
+
+
+def xywh2xyxy(x):
+    # Convert nx4 boxes from [x, y, w, h] to [x1, y1, x2, y2] where xy1=top-left, xy2=bottom-right
+    y = np.zeros_like(x)
+    y[:, 0] = x[:, 0] - x[:, 2] / 2  # top left x
+    y[:, 1] = x[:, 1] - x[:, 3] / 2  # top left y
+    y[:, 2] = x[:, 0] + x[:, 2] / 2  # bottom right x
+    y[:, 3] = x[:, 1] + x[:, 3] / 2  # bottom right y
+    return y
+
+
+def nms(boxes, scores, iou_thres):
+    """Greedy non-maximum suppression, like torchvision.ops.boxes.nms
+
+    Args:
+        boxes (narray): nx4 boxes in [x1, y1, x2, y2] format
+        scores (narray): n scores
+        iou_thres (float): boxes overlapping a kept box by more than this IoU are removed
+
+    Returns:
+        keep (narray): indices of the kept boxes, by decreasing score
+    """
+    x1, y1, x2, y2 = boxes.T
+    areas = (x2 - x1) * (y2 - y1)
+    order = np.argsort(-scores, kind="stable")
+
+    keep = []
+    while order.size:
+        i, order = order[0], order[1:]
+        keep.append(i)
+        w = np.minimum(x2[i], x2[order]) - np.maximum(x1[i], x1[order])
+        h = np.minimum(y2[i], y2[order]) - np.maximum(y1[i], y1[order])
+        inter = w.clip(0) * h.clip(0)
+        iou = inter / (areas[i] + areas[order] - inter)
+        order = order[iou <= iou_thres]
+    return np.array(keep, dtype=np.int64)
+
+
+def non_max_suppression(
+    prediction, conf_thres=0.1, iou_thres=0.6, classes=None, agnostic=False
+):
+    """NumPy port of the batched non-maximum suppression of
+    helpers.utils.non_max_suppression, for models with a single class
+    or keeping the best class of each box
+
+    Returns:
+        output (list): one array of detections (x1, y1, x2, y2, conf, cls) per image, None if there is none
+    """
+    # Box constraints
+    min_wh, max_wh = 2, 4096  # (pixels) minimum and maximum box width and height
+
+    output = [None] * len(prediction)
+    for image_i, pred in enumerate(prediction):
+        # Apply conf constraint
+        pred = pred[pred[:, 4] > conf_thres]
+
+        # Apply width-height constraint
+        pred = pred[((pred[:, 2:4] > min_wh) & (pred[:, 2:4] < max_wh)).all(1)]
+
+        # If none remain process next image
+        if not pred.shape[0]:
+            continue
+
+        # Compute conf
+        pred = pred.copy()
+        pred[:, 5:] *= pred[:, 4:5]  # conf = obj_conf * cls_conf
+
+        # Detections matrix nx6 (xyxy, conf, cls), best class only
+        box = xywh2xyxy(pred[:, :4])
+        j = pred[:, 5:].argmax(1)
+        conf = pred[:, 5:].max(1)
+        pred = np.concatenate((box, conf[:, None], j[:, None].astype(pred.dtype)), 1)
+
+        # Filter by class
+        if classes:
+            pred = pred[np.isin(j, classes)]
+
+        # Apply finite constraint
+        pred = pred[np.isfinite(pred).all(1)]
+
+        # If none remain process next image
+        if not pred.shape[0]:
+            continue
+
+        # Batched NMS, boxes of different classes are offset so that they never overlap
+        c = pred[:, 5] * 0 if agnostic else pred[:, 5]
+        boxes = pred[:, :4] + c[:, None] * (pred[:, :4].max() + 1)
+        output[image_i] = pred[nms(boxes, pred[:, 4], iou_thres)]
+
+    return output
+
+
+def scale_coords(img1_shape, coords, img0_shape):
+    # Rescale coords (xyxy) from img1_shape to img0_shape
+    gain = max(img1_shape) / max(img0_shape)  # gain  = old / new
+    pad = (img1_shape[1] - img0_shape[1] * gain) / 2, (
+        img1_shape[0] - img0_shape[0] * gain
+    ) / 2  # wh padding
+
+    coords[:, [0, 2]] -= pad[0]  # x padding
+    coords[:, [1, 3]] -= pad[1]  # y padding
+    coords[:, :4] /= gain
+
+    # Clip bounding xyxy bounding boxes to image shape (height, width)
+    coords[:, [0, 2]] = coords[:, [0, 2]].clip(0, img0_shape[1])  # clip x
+    coords[:, [1, 3]] = coords[:, [1, 3]].clip(0, img0_shape[0])  # clip y
+    return coords
+
+
+class OnnxTableDetector(object):
+    """Table detector which runs the ONNX model exported by
+    detect_func.export_onnx with ONNX Runtime, without importing
+    PyTorch. The session is created once and then runs on any number
+    of images.
+
+    Args:
+        model (str): path to the ONNX model
+        providers (tuple): ONNX Runtime execution providers. Default is CPU only
+    """
+
+    def __init__(self, model, providers=("CPUExecutionProvider",)):
+        import onnxruntime
+
+        self.model = model
+        self.session = onnxruntime.InferenceSession(model, providers=list(providers))
+        self.input_name = self.session.get_inputs()[0].name
+        self.output_name = self.session.get_outputs()[0].name
+        # the graph is exported for one input size, (batch, 3, h, w)
+        self.img_size = tuple(self.session.get_inputs()[0].shape[2:])
+
+    @classmethod
+    def get(cls, model, providers=("CPUExecutionProvider",)):
+        """Gets the table detector for an ONNX model, which is only
+        loaded on the first call and shared by the later ones.
+
+        Args:
+            model (str): path to the ONNX model
+            providers (tuple): ONNX Runtime execution providers. Default is CPU only
+
+        Returns:
+            detector (OnnxTableDetector): the loaded table detector
+        """
+        key = (str(model), tuple(providers))
+        if key not in _detectors:
+            _detectors[key] = cls(str(model), providers=providers)
+        return _detectors[key]
+
+    def detect(
+        self,
+        images,
+        conf_thres=0.2,
+        iou_thres=0.4,
+        classes=None,
+        agnostic=False,
+        batch_size=1,
+    ):
+        """Detects tables in images, running the graph on up to
+        batch_size images at a time
+
+        Args:
+            images (list): list of images as RGB arrays of shape (h, w, 3), or paths to images
+            conf_thres (float): object confidence threshold. Default is 0.2
+            iou_thres (float): IoU threshold of the non-maximum suppression. Default is 0.4
+            classes (list): classes to keep, all of them if None
+            agnostic (bool): True for class-agnostic non-maximum suppression
+            batch_size (int): maximum number of images in a forward pass. Default is 1
+
+        Returns:
+            boxes (list): one array of detections per image, with a row
+            (x1, y1, x2, y2, conf, cls) per table in image pixels
+        """
+        boxes = []
+        for start in range(0, len(images), batch_size):
+            img0s = [img_rgb(img0) for img0 in images[start : start + batch_size]]
+
+            # Padded resize to the input size of the graph, to bsx3xhxw
+            imgs = [letterbox(x, new_shape=self.img_size, auto=False)[0] for x in img0s]
+            img = np.stack(imgs).transpose(0, 3, 1, 2)
+            img = np.ascontiguousarray(img, dtype=np.float32) / 255.0  # 0 - 255 to 0.0 - 1.0
+
+            # Inference
+            pred = self.session.run([self.output_name], {self.input_name: img})[0]
+
+            # Apply NMS
+            pred = non_max_suppression(
+                pred, conf_thres, iou_thres, classes=classes, agnostic=agnostic
+            )
+
+            for det, img0 in zip(pred, img0s):
+                if det is None:
+                    boxes.append(np.zeros((0, 6), dtype=np.float32))
+                    continue
+
+                # Rescale boxes from img_size to img0 size
+                det[:, :4] = scale_coords(img.shape[2:], det[:, :4], img0.shape).round()
+                boxes.append(det)
+        return boxes